@@ -0,0 +1,77 @@
+"""
+Parallel column profiling scaling benchmark.
+
+Profiles one synthetic frame with an increasing number of workers and
+reports wall time and speedup relative to the serial run:
+
+    python -m benchmarks.bench_parallel --rows 2000000 --columns 64
+    python -m benchmarks.bench_parallel --executor process --jobs 1 2 4 8 16 32
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import time
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+
+from benchmarks.synthetic import make_frame
+from sanitify.core.profiler import DataProfiler
+
+
+def time_profile(df: pd.DataFrame, n_jobs: int, executor: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if executor == "process" and n_jobs > 1:
+            with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                DataProfiler(df, executor=pool).run()
+        else:
+            DataProfiler(df, n_jobs=n_jobs).run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: List[str] | None = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--columns", type=int, default=32)
+    parser.add_argument("--jobs", type=int, nargs="+", default=None)
+    parser.add_argument("--executor", choices=["thread", "process"], default="thread")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="optional JSON output path")
+    args = parser.parse_args(argv)
+
+    cpus = os.cpu_count() or 1
+    jobs = args.jobs or sorted({1, 2, 4, 8, 16, 32, cpus} & set(range(1, cpus + 1)))
+    df = make_frame(args.rows, args.columns, kinds=("float", "float", "int", "string"))
+
+    results = []
+    baseline = None
+    for n_jobs in jobs:
+        seconds = time_profile(df, n_jobs, args.executor, args.repeat)
+        baseline = baseline or seconds
+        results.append({
+            "n_jobs": n_jobs,
+            "seconds": seconds,
+            "speedup": baseline / seconds,
+        })
+        print(f"n_jobs={n_jobs:>3}  {seconds:8.3f}s  speedup={baseline / seconds:5.2f}x")
+
+    report = {
+        "benchmark": "parallel_profile",
+        "rows": args.rows,
+        "columns": args.columns,
+        "executor": args.executor,
+        "cpu_count": cpus,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+    return report
+
+
+if __name__ == "__main__":
+    main()
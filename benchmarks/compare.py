@@ -0,0 +1,81 @@
+"""
+Compare two ``benchmarks.pipeline`` JSON results.
+
+Cases are matched on shape and data parameters; for every stage the
+candidate/baseline ratio of time and peak memory is printed. Exits with
+status 1 when any ratio exceeds ``--threshold``:
+
+    python -m benchmarks.compare results/v0.1.3.json results/main.json
+"""
+from __future__ import annotations
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Tuple
+
+CASE_KEYS = ("rows", "columns", "missing_rate", "cardinality", "duplicate_rate")
+
+
+def case_key(case: Dict[str, Any]) -> Tuple[Any, ...]:
+    return tuple(case.get(key) for key in CASE_KEYS) + (tuple(case.get("kinds", [])),)
+
+
+def compare(
+    baseline: Dict[str, Any],
+    candidate: Dict[str, Any],
+    threshold: float = 1.10,
+) -> List[Dict[str, Any]]:
+    base_cases = {case_key(case): case for case in baseline["results"]}
+    rows = []
+
+    for case in candidate["results"]:
+        base = base_cases.get(case_key(case))
+        if base is None:
+            continue
+        for stage, timing in case["stages"].items():
+            base_timing = base["stages"].get(stage)
+            if base_timing is None:
+                continue
+            for metric in ("seconds", "peak_bytes"):
+                if metric not in timing or metric not in base_timing:
+                    continue
+                old, new = base_timing[metric], timing[metric]
+                ratio = new / old if old else float("inf") if new else 1.0
+                rows.append({
+                    "rows": case["rows"],
+                    "columns": case["columns"],
+                    "stage": stage,
+                    "metric": metric,
+                    "baseline": old,
+                    "candidate": new,
+                    "ratio": ratio,
+                    "regression": ratio > threshold,
+                })
+    return rows
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare pipeline benchmark results")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=1.10)
+    args = parser.parse_args(argv)
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.candidate, encoding="utf-8") as f:
+        candidate = json.load(f)
+
+    rows = compare(baseline, candidate, args.threshold)
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['rows']:>11} x {row['columns']:<5} {row['stage']:<8} "
+            f"{row['metric']:<10} {row['ratio']:6.2f}x {flag}"
+        )
+
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
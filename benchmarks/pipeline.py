@@ -0,0 +1,180 @@
+"""
+Stage-by-stage benchmark of the profile -> quality -> score -> suggest ->
+apply pipeline.
+
+Each stage is timed on its own (best of ``--repeat`` runs) and, unless
+``--no-memory`` is given, re-run once under tracemalloc to record its peak
+allocation. Results are written as JSON for ``benchmarks.compare``:
+
+    python -m benchmarks.pipeline --rows 100000 1000000 --columns 20 200 \\
+        --output results/main.json
+"""
+from __future__ import annotations
+import argparse
+import datetime
+import gc
+import json
+import platform
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, List
+
+from benchmarks.synthetic import KINDS, make_frame
+from sanitify.cleaning.deterministic import FixApplier
+from sanitify.core.profiler import DataProfiler
+from sanitify.core.quality import RuleEngine
+from sanitify.core.scoring import QualityScorer
+from sanitify.core.suggestions import DeterministicSuggestionEngine
+from sanitify.datacleaner import default_rules
+
+STAGES = ("profile", "quality", "score", "suggest", "apply")
+
+
+def measure(func: Callable[[], Any], repeat: int, memory: bool) -> Dict[str, Any]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+
+    entry: Dict[str, Any] = {"seconds": best}
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        func()
+        entry["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {"timing": entry, "result": result}
+
+
+def run_case(
+    rows: int,
+    columns: int,
+    kinds: List[str],
+    missing_rate: float,
+    cardinality: float,
+    duplicate_rate: float,
+    repeat: int,
+    memory: bool,
+    seed: int,
+) -> Dict[str, Any]:
+    df = make_frame(
+        rows,
+        columns,
+        kinds=kinds,
+        missing_rate=missing_rate,
+        cardinality=cardinality,
+        duplicate_rate=duplicate_rate,
+        seed=seed,
+    )
+
+    engine = RuleEngine(default_rules())
+    scorer = QualityScorer()
+    suggester = DeterministicSuggestionEngine()
+    applier = FixApplier()
+
+    stages: Dict[str, Dict[str, Any]] = {}
+
+    run = measure(lambda: DataProfiler(df).run(), repeat, memory)
+    stages["profile"], profile = run["timing"], run["result"]
+
+    run = measure(lambda: engine.run(profile), repeat, memory)
+    stages["quality"], issues = run["timing"], run["result"]
+
+    run = measure(lambda: scorer.score(profile, issues), repeat, memory)
+    stages["score"] = run["timing"]
+
+    run = measure(lambda: suggester.generate(profile, issues), repeat, memory)
+    stages["suggest"], suggestions = run["timing"], run["result"]
+
+    run = measure(lambda: applier.apply(df, suggestions), repeat, memory)
+    stages["apply"] = run["timing"]
+
+    return {
+        "rows": rows,
+        "columns": columns,
+        "kinds": list(kinds),
+        "missing_rate": missing_rate,
+        "cardinality": cardinality,
+        "duplicate_rate": duplicate_rate,
+        "frame_bytes": int(df.memory_usage(deep=True).sum()),
+        "issues": len(issues),
+        "fixes": len(suggestions),
+        "stages": stages,
+    }
+
+
+def environment() -> Dict[str, Any]:
+    try:
+        from importlib.metadata import version
+        sanitify_version = version("sanitify")
+    except Exception:
+        sanitify_version = "unknown"
+
+    return {
+        "sanitify": sanitify_version,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+
+
+def main(argv: List[str] | None = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description="Sanitify pipeline benchmark")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000])
+    parser.add_argument("--columns", type=int, nargs="+", default=[20])
+    parser.add_argument("--kinds", nargs="+", default=list(KINDS), choices=KINDS)
+    parser.add_argument("--missing-rate", type=float, nargs="+", default=[0.05])
+    parser.add_argument("--cardinality", type=float, nargs="+", default=[1_000])
+    parser.add_argument("--duplicate-rate", type=float, default=0.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc runs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON output path")
+    args = parser.parse_args(argv)
+
+    results = []
+    for rows in args.rows:
+        for columns in args.columns:
+            for missing_rate in args.missing_rate:
+                for cardinality in args.cardinality:
+                    case = run_case(
+                        rows,
+                        columns,
+                        args.kinds,
+                        missing_rate,
+                        cardinality,
+                        args.duplicate_rate,
+                        args.repeat,
+                        not args.no_memory,
+                        args.seed,
+                    )
+                    results.append(case)
+                    timings = "  ".join(
+                        f"{stage}={case['stages'][stage]['seconds']:.4f}s"
+                        for stage in STAGES
+                    )
+                    print(
+                        f"rows={rows} columns={columns} missing={missing_rate} "
+                        f"cardinality={cardinality}: {timings}"
+                    )
+
+    report = {
+        "benchmark": "pipeline",
+        "environment": environment(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+    return report
+
+
+if __name__ == "__main__":
+    main()
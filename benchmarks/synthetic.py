@@ -0,0 +1,82 @@
+"""
+Synthetic frames for benchmarks.
+
+Frames are built column by column from a seeded generator, so the same
+arguments always produce the same data.
+"""
+from __future__ import annotations
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Sequence
+
+KINDS = ("float", "int", "string", "categorical", "datetime")
+
+
+def make_frame(
+    rows: int,
+    columns: int,
+    kinds: Sequence[str] = KINDS,
+    missing_rate: float = 0.05,
+    cardinality: float = 1_000,
+    duplicate_rate: float = 0.0,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Build a ``rows`` x ``columns`` frame cycling through ``kinds``.
+
+    ``cardinality`` is the number of distinct values per column, or a
+    fraction of ``rows`` when below 1. ``duplicate_rate`` overwrites that
+    share of rows with copies of earlier rows.
+    """
+    unknown = set(kinds) - set(KINDS)
+    if unknown:
+        raise ValueError(f"Unknown column kinds: {sorted(unknown)}")
+
+    rng = np.random.default_rng(seed)
+    distinct = int(cardinality * rows) if cardinality < 1 else int(cardinality)
+    distinct = max(min(distinct, max(rows, 1)), 1)
+
+    data: Dict[str, Any] = {}
+    for i in range(columns):
+        kind = kinds[i % len(kinds)]
+        data[f"{kind}_{i}"] = _column(rng, kind, rows, distinct, missing_rate)
+
+    df = pd.DataFrame(data)
+
+    n_duplicates = int(rows * duplicate_rate)
+    if n_duplicates and rows > n_duplicates:
+        order = np.arange(rows)
+        order[rows - n_duplicates:] = rng.integers(0, rows - n_duplicates, n_duplicates)
+        df = df.take(order).reset_index(drop=True)
+
+    return df
+
+
+def _column(rng: np.random.Generator, kind: str, rows: int, distinct: int, missing_rate: float):
+    codes = rng.integers(0, distinct, rows)
+    missing = rng.random(rows) < missing_rate
+
+    if kind == "float":
+        values = codes.astype(np.float64)
+        values[missing] = np.nan
+        return values
+
+    if kind == "int":
+        if missing.any():
+            return pd.arrays.IntegerArray(codes, mask=missing)
+        return codes
+
+    if kind == "string":
+        vocab = np.array([f"value_{k}" for k in range(distinct)], dtype=object)
+        values = vocab[codes]
+        values[missing] = None
+        return values
+
+    if kind == "categorical":
+        codes = codes.copy()
+        codes[missing] = -1
+        return pd.Categorical.from_codes(codes, categories=[f"cat_{k}" for k in range(distinct)])
+
+    stamps = np.datetime64("2020-01-01", "s") + codes.astype("timedelta64[s]")
+    stamps[missing] = np.datetime64("NaT")
+    return stamps
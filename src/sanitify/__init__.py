@@ -1,3 +1,4 @@
 from .datacleaner import DataCleaner
+from .bulk import profile_many
 
-__all__ = ["DataCleaner"]
+__all__ = ["DataCleaner", "profile_many"]
@@ -0,0 +1,4 @@
+from .jobs import Job, JobRejected, ProfilingService, estimate_source
+from .server import run, serve
+
+__all__ = ["Job", "JobRejected", "ProfilingService", "estimate_source", "run", "serve"]
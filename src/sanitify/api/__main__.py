@@ -0,0 +1,27 @@
+import argparse
+
+from sanitify.api.server import run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the sanitify profiling service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--max-queued", type=int, default=64)
+    parser.add_argument("--max-job-bytes", type=int, default=None)
+    parser.add_argument("--max-pending-bytes", type=int, default=None)
+    args = parser.parse_args()
+
+    run(
+        args.host,
+        args.port,
+        max_workers=args.workers,
+        max_queued=args.max_queued,
+        max_job_bytes=args.max_job_bytes,
+        max_pending_bytes=args.max_pending_bytes,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,446 @@
+from __future__ import annotations
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from sanitify.core.quality import RulePlan
+from sanitify.core.rules import compile_rules
+from sanitify.core.scoring import QualityScorer
+from sanitify.core.streaming import ChunkedProfiler
+from sanitify.datacleaner import default_rules
+from sanitify.utils.io import COMPRESSION_SUFFIXES, file_format, iter_chunks
+
+FINISHED_STATES = ("done", "failed", "cancelled")
+
+# Options a job may set; everything else is rejected at submission.
+JOB_OPTIONS = {"chunksize", "sample_size", "partial_interval", "rules", "read_options"}
+
+# Bytes read from the head of a CSV file to extrapolate its row count.
+_HEAD_BYTES = 1 << 16
+
+# Event queue of the worker process, set by the pool initializer.
+_events: Any = None
+
+
+class JobRejected(Exception):
+    """
+    Raised when admission control turns a job away.
+
+    ``status`` is the HTTP status the service answers with: 413 for a job
+    larger than any single job may be, 429 while the service is saturated,
+    with ``retry_after`` seconds as a hint.
+    """
+
+    def __init__(self, message: str, status: int, retry_after: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+def estimate_source(path: str | Path) -> Dict[str, Optional[int]]:
+    """
+    Estimated data ``bytes`` and ``rows`` of a CSV/Parquet file.
+
+    Parquet sizes and row counts come from the footer metadata. CSV files
+    count their bytes on disk and extrapolate rows from the first 64 KiB;
+    ``rows`` is None for compressed CSV.
+    """
+    fmt = file_format(path)
+    size = os.path.getsize(path)
+
+    if fmt == "parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            return {"bytes": size, "rows": None}
+        metadata = pq.ParquetFile(path).metadata
+        data = sum(metadata.row_group(i).total_byte_size for i in range(metadata.num_row_groups))
+        return {"bytes": max(data, size), "rows": metadata.num_rows}
+
+    if Path(path).suffix.lower() in COMPRESSION_SUFFIXES:
+        return {"bytes": size, "rows": None}
+    with open(path, "rb") as handle:
+        head = handle.read(_HEAD_BYTES)
+    lines = head.count(b"\n") + (bool(head) and not head.endswith(b"\n"))
+    if len(head) < size:
+        lines = round(lines * size / len(head))
+    # The first line is the header.
+    return {"bytes": size, "rows": max(lines - 1, 0)}
+
+
+def run_job(job_id: str, path: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Profile, check and score one file in a pool worker.
+
+    The file is streamed through a ``ChunkedProfiler``. After each chunk the
+    row count is posted to the service's event queue, with a partial
+    profile at most every ``partial_interval`` seconds.
+    """
+    interval = options.get("partial_interval", 1.0)
+    profiler = ChunkedProfiler(sample_size=options.get("sample_size"))
+    rows = chunks = 0
+    last_partial = None
+
+    chunksize = options.get("chunksize", 100_000)
+    for chunk in iter_chunks(path, chunksize, **options.get("read_options", {})):
+        profiler.update(chunk)
+        rows += len(chunk)
+        chunks += 1
+
+        event: Dict[str, Any] = {"rows": rows, "chunks": chunks}
+        if last_partial is None or time.monotonic() - last_partial >= interval:
+            event["profile"] = profiler.run()
+            last_partial = time.monotonic()
+        _post(job_id, event)
+
+    profile = profiler.run()
+    rules = options.get("rules")
+    plan = RulePlan(default_rules()) if rules is None else compile_rules(rules)
+    issues = plan.run(profile)
+    return {
+        "profile": profile,
+        "issues": issues,
+        "score": QualityScorer.from_plan(plan).score(profile, issues),
+    }
+
+
+def _init_worker(events: Any) -> None:
+    global _events
+    _events = events
+
+
+def _post(job_id: str, event: Dict[str, Any]) -> None:
+    if _events is not None:
+        _events.put((job_id, event))
+
+
+class Job:
+    """
+    State of one profiling job, owned by the service's event loop.
+
+    ``version`` increases on every change; ``wait_changed`` lets any number
+    of readers follow a job without polling.
+    """
+
+    def __init__(self, path: str, options: Dict[str, Any], estimate: Dict[str, Optional[int]]):
+        self.id = uuid.uuid4().hex
+        self.path = path
+        self.options = options
+        self.estimated_bytes = int(estimate["bytes"] or 0)
+        self.estimated_rows = estimate["rows"]
+
+        self.status = "queued"
+        self.rows = 0
+        self.chunks = 0
+        self.partial: Optional[Dict[str, Any]] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+
+        self.submitted = time.time()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+
+        self.version = 0
+        self._changed = asyncio.Event()
+
+    @property
+    def done(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    @property
+    def progress(self) -> Dict[str, Any]:
+        if self.status == "done":
+            fraction: Optional[float] = 1.0
+        elif self.estimated_rows:
+            # Row counts of CSV files are extrapolated, so cap below done.
+            fraction = min(self.rows / self.estimated_rows, 0.99)
+        else:
+            fraction = None
+        return {"rows": self.rows, "chunks": self.chunks, "fraction": fraction}
+
+    async def wait_changed(self, version: int) -> None:
+        while self.version == version:
+            await self._changed.wait()
+
+    def to_dict(self, result: bool = False) -> Dict[str, Any]:
+        data = {
+            "id": self.id,
+            "path": self.path,
+            "status": self.status,
+            "estimated_bytes": self.estimated_bytes,
+            "estimated_rows": self.estimated_rows,
+            "progress": self.progress,
+            "submitted": self.submitted,
+            "started": self.started,
+            "finished": self.finished,
+            "error": self.error,
+        }
+        if result:
+            data["result"] = self.result
+        return data
+
+    def _update(self, **changes: Any) -> None:
+        for name, value in changes.items():
+            setattr(self, name, value)
+        self.version += 1
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+
+class ProfilingService:
+    """
+    Asyncio front end that runs profiling jobs in a bounded process pool.
+
+    Jobs profile CSV/Parquet files with the streaming profiler, so a large
+    file occupies one worker process and never the event loop. At most
+    ``max_workers`` jobs run at once; the rest wait in submission order.
+
+    Admission control works on each file's estimated size
+    (``estimate_source``): a job above ``max_job_bytes`` is rejected
+    outright (413), and a new job is refused (429) while ``max_queued``
+    jobs are waiting or while the estimated bytes of waiting and running
+    jobs would exceed ``max_pending_bytes``. A job is always admitted when
+    the service is idle. Finished jobs are kept for ``max_finished`` more
+    submissions.
+
+    Use as ``async with ProfilingService() as service`` or call ``start()``
+    and ``close()``; ``sanitify.api.serve`` exposes it over HTTP.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_queued: int = 64,
+        max_job_bytes: Optional[int] = None,
+        max_pending_bytes: Optional[int] = None,
+        max_finished: int = 256,
+        mp_context: Any = None,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.max_job_bytes = max_job_bytes
+        self.max_pending_bytes = max_pending_bytes
+        self.max_finished = max_finished
+        # Forking a process that already runs threads is unsafe.
+        self._context = mp_context or multiprocessing.get_context("spawn")
+
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._events: Any = None
+        self._dispatchers: List[asyncio.Task] = []
+        self._reader: Optional[threading.Thread] = None
+
+    # ------------------------
+    # Lifecycle
+    # ------------------------
+    async def start(self) -> "ProfilingService":
+        if self._pool is not None:
+            return self
+        loop = asyncio.get_running_loop()
+        self._events = self._context.Queue()
+        self._pool = ProcessPoolExecutor(
+            self.max_workers,
+            mp_context=self._context,
+            initializer=_init_worker,
+            initargs=(self._events,),
+        )
+        self._queue = asyncio.Queue()
+        self._dispatchers = [loop.create_task(self._dispatch()) for _ in range(self.max_workers)]
+        self._reader = threading.Thread(target=self._read_events, args=(loop,), daemon=True)
+        self._reader.start()
+        return self
+
+    async def close(self) -> None:
+        """
+        Cancel waiting jobs, wait for running ones and stop the pool.
+        """
+        if self._pool is None:
+            return
+        for job in self._jobs.values():
+            if job.status == "queued":
+                job._update(status="cancelled", finished=time.time())
+        for task in self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+
+        pool, self._pool = self._pool, None
+        await asyncio.get_running_loop().run_in_executor(None, pool.shutdown)
+        self._events.put(None)
+        await asyncio.get_running_loop().run_in_executor(None, self._reader.join)
+        self._events.close()
+
+    async def __aenter__(self) -> "ProfilingService":
+        return await self.start()
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    # ------------------------
+    # Jobs
+    # ------------------------
+    async def submit(self, path: str | Path, **options: Any) -> Job:
+        """
+        Admit a job profiling ``path``; raises ``JobRejected`` when refused.
+
+        ``options`` may set ``chunksize``, ``sample_size`` (reservoir size
+        for medians), ``partial_interval`` (seconds between partial
+        profiles), ``rules`` (a rule spec) and ``read_options`` (passed to
+        the file reader).
+        """
+        if self._pool is None:
+            raise RuntimeError("ProfilingService is not started")
+        unknown = set(options) - JOB_OPTIONS
+        if unknown:
+            raise ValueError(f"Unknown job options: {', '.join(sorted(unknown))}")
+        if options.get("rules") is not None:
+            compile_rules(options["rules"])
+
+        path = str(path)
+        estimate = await asyncio.get_running_loop().run_in_executor(None, estimate_source, path)
+        job = Job(path, options, estimate)
+        self._admit(job)
+
+        self._jobs[job.id] = job
+        self._queue.put_nowait(job)
+        self._retire()
+        return job
+
+    def get(self, job_id: str) -> Job:
+        try:
+            return self._jobs[job_id]
+        except KeyError:
+            raise KeyError(f"Unknown job: {job_id}") from None
+
+    def jobs(self) -> List[Job]:
+        return list(self._jobs.values())
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a waiting job. Running jobs cannot be interrupted.
+        """
+        job = self.get(job_id)
+        if job.status != "queued":
+            return False
+        job._update(status="cancelled", finished=time.time())
+        return True
+
+    async def wait(self, job_id: str) -> Job:
+        job = self.get(job_id)
+        while not job.done:
+            await job.wait_changed(job.version)
+        return job
+
+    async def events(self, job_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Follow a job: yields its state on every change until it finishes.
+
+        Partial profiles are attached when a newer one is available and the
+        final event carries the result. Slow readers skip intermediate
+        states instead of buffering them.
+        """
+        job = self.get(job_id)
+        version = -1
+        partial = None
+        while True:
+            if job.version == version:
+                await job.wait_changed(version)
+            version = job.version
+
+            event = job.to_dict(result=job.done)
+            if not job.done and job.partial is not partial:
+                partial = event["profile"] = job.partial
+            yield event
+            if job.done:
+                return
+
+    def stats(self) -> Dict[str, Any]:
+        counts = {state: 0 for state in ("queued", "running") + FINISHED_STATES}
+        for job in self._jobs.values():
+            counts[job.status] += 1
+        return {
+            "workers": self.max_workers,
+            "jobs": counts,
+            "pending_bytes": self._pending_bytes(),
+            "max_pending_bytes": self.max_pending_bytes,
+            "max_queued": self.max_queued,
+        }
+
+    # ------------------------
+    # Internals
+    # ------------------------
+    def _admit(self, job: Job) -> None:
+        if self.max_job_bytes is not None and job.estimated_bytes > self.max_job_bytes:
+            raise JobRejected(
+                f"Estimated size {job.estimated_bytes} bytes exceeds the "
+                f"{self.max_job_bytes} byte job limit",
+                status=413,
+            )
+
+        active = [j for j in self._jobs.values() if not j.done]
+        if not active:
+            return
+        queued = sum(j.status == "queued" for j in active)
+        if queued >= self.max_queued:
+            raise JobRejected(f"{queued} jobs are already waiting", status=429, retry_after=1)
+        pending = self._pending_bytes()
+        if self.max_pending_bytes is not None and pending + job.estimated_bytes > self.max_pending_bytes:
+            raise JobRejected(
+                f"{pending} bytes are already pending; limit is {self.max_pending_bytes}",
+                status=429,
+                retry_after=1,
+            )
+
+    def _pending_bytes(self) -> int:
+        return sum(job.estimated_bytes for job in self._jobs.values() if not job.done)
+
+    async def _dispatch(self) -> None:
+        # One dispatcher per worker keeps at most max_workers jobs in the pool.
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self._queue.get()
+            if job.status != "queued":
+                continue
+            job._update(status="running", started=time.time())
+            try:
+                result = await loop.run_in_executor(self._pool, run_job, job.id, job.path, job.options)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                job._update(status="failed", error=f"{type(exc).__name__}: {exc}", finished=time.time())
+            else:
+                job._update(status="done", result=result, partial=None, finished=time.time())
+
+    def _read_events(self, loop: asyncio.AbstractEventLoop) -> None:
+        while True:
+            item = self._events.get()
+            if item is None:
+                return
+            try:
+                loop.call_soon_threadsafe(self._progress, *item)
+            except RuntimeError:
+                return
+
+    def _progress(self, job_id: str, event: Dict[str, Any]) -> None:
+        job = self._jobs.get(job_id)
+        # Progress can arrive after the result; it is stale by then.
+        if job is None or job.status != "running":
+            return
+        changes = {"rows": event["rows"], "chunks": event["chunks"]}
+        if "profile" in event:
+            changes["partial"] = event["profile"]
+        job._update(**changes)
+
+    def _retire(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.done]
+        for job_id in finished[: max(len(finished) - self.max_finished, 0)]:
+            del self._jobs[job_id]
@@ -0,0 +1,171 @@
+from __future__ import annotations
+import asyncio
+import json
+from functools import partial
+from http import HTTPStatus
+from typing import Any, Dict, Optional, Tuple
+
+from sanitify.api.jobs import JobRejected, ProfilingService
+
+# Largest request body accepted; job requests are small JSON documents.
+MAX_BODY_BYTES = 1 << 20
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+async def serve(service: ProfilingService, host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+    """
+    Expose a started ``ProfilingService`` over HTTP/JSON on ``host:port``.
+
+    Routes::
+
+        POST   /jobs              {"path": ..., <job options>} -> 202 job
+        GET    /jobs              all known jobs
+        GET    /jobs/<id>         job state, with the result once done
+        GET    /jobs/<id>/stream  newline-delimited JSON events until done
+        DELETE /jobs/<id>         cancel a waiting job
+        GET    /health            pool and queue statistics
+
+    Rejected jobs answer 413 or 429 (with ``Retry-After``). Each
+    connection serves one request. Pass ``port=0`` to pick a free port.
+    """
+    return await asyncio.start_server(partial(_handle, service), host, port)
+
+
+def run(host: str = "127.0.0.1", port: int = 8765, **service_options: Any) -> None:
+    """
+    Run a profiling service until interrupted.
+    """
+    async def main() -> None:
+        async with ProfilingService(**service_options) as service:
+            server = await serve(service, host, port)
+            async with server:
+                await server.serve_forever()
+
+    asyncio.run(main())
+
+
+async def _handle(service: ProfilingService, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        try:
+            method, path, body = await _read_request(reader)
+            await _route(service, method, path, body, writer)
+        except HTTPError as exc:
+            await _respond(writer, exc.status, {"error": str(exc)}, exc.headers)
+        except JobRejected as exc:
+            headers = {} if exc.retry_after is None else {"Retry-After": str(exc.retry_after)}
+            await _respond(writer, exc.status, {"error": str(exc)}, headers)
+        except KeyError as exc:
+            await _respond(writer, 404, {"error": exc.args[0]})
+        except (ValueError, TypeError, OSError) as exc:
+            await _respond(writer, 400, {"error": f"{type(exc).__name__}: {exc}"})
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Tuple[str, str, Any]:
+    request_line = (await reader.readline()).decode("latin-1").split()
+    if len(request_line) != 3:
+        raise HTTPError(400, "Malformed request line")
+    method, target, _ = request_line
+
+    headers: Dict[str, str] = {}
+    while True:
+        line = (await reader.readline()).decode("latin-1").strip()
+        if not line:
+            break
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    length = int(headers.get("content-length") or 0)
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(413, "Request body too large")
+    body = None
+    if length:
+        try:
+            body = json.loads(await reader.readexactly(length))
+        except json.JSONDecodeError as exc:
+            raise HTTPError(400, f"Invalid JSON body: {exc}") from None
+    return method.upper(), target.split("?", 1)[0].rstrip("/"), body
+
+
+async def _route(service: ProfilingService, method: str, path: str, body: Any, writer: asyncio.StreamWriter) -> None:
+    parts = path.strip("/").split("/")
+
+    if parts == ["health"] and method == "GET":
+        return await _respond(writer, 200, service.stats())
+
+    if parts == ["jobs"]:
+        if method == "GET":
+            return await _respond(writer, 200, [job.to_dict() for job in service.jobs()])
+        if method == "POST":
+            if not isinstance(body, dict) or "path" not in body:
+                raise HTTPError(400, "Body must be a JSON object with a 'path'")
+            options = dict(body)
+            job = await service.submit(options.pop("path"), **options)
+            return await _respond(writer, 202, job.to_dict(), {"Location": f"/jobs/{job.id}"})
+        raise HTTPError(405, f"{method} not allowed on /jobs")
+
+    if len(parts) == 2 and parts[0] == "jobs":
+        if method == "GET":
+            return await _respond(writer, 200, service.get(parts[1]).to_dict(result=True))
+        if method == "DELETE":
+            if not service.cancel(parts[1]):
+                raise HTTPError(409, "Only waiting jobs can be cancelled")
+            return await _respond(writer, 200, service.get(parts[1]).to_dict())
+        raise HTTPError(405, f"{method} not allowed on /jobs/<id>")
+
+    if len(parts) == 3 and parts[0] == "jobs" and parts[2] == "stream" and method == "GET":
+        events = service.events(parts[1])
+        first = await events.__anext__()
+        # The body runs until the connection closes; each line is one event.
+        await _write_head(writer, 200, {"Content-Type": "application/x-ndjson"})
+        writer.write(_dumps(first) + b"\n")
+        await writer.drain()
+        async for event in events:
+            # drain() blocks on slow readers, which then skip states.
+            writer.write(_dumps(event) + b"\n")
+            await writer.drain()
+        return
+
+    raise HTTPError(404, f"No route for {method} {path or '/'}")
+
+
+async def _write_head(writer: asyncio.StreamWriter, status: int, headers: Dict[str, str]) -> None:
+    lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}", "Connection: close"]
+    lines += [f"{name}: {value}" for name, value in headers.items()]
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+
+
+async def _respond(
+    writer: asyncio.StreamWriter,
+    status: int,
+    payload: Any,
+    headers: Optional[Dict[str, str]] = None,
+) -> None:
+    body = _dumps(payload)
+    await _write_head(writer, status, {
+        "Content-Type": "application/json",
+        "Content-Length": str(len(body)),
+        **(headers or {}),
+    })
+    writer.write(body)
+    await writer.drain()
+
+
+def _dumps(payload: Any) -> bytes:
+    return json.dumps(payload, default=_jsonable).encode("utf-8")
+
+
+def _jsonable(value: Any) -> Any:
+    # NumPy scalars and arrays, then anything else as text.
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
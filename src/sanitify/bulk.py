@@ -0,0 +1,186 @@
+from __future__ import annotations
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+import pandas as pd
+
+from sanitify.core.parallel import resolve_n_jobs
+from sanitify.core.quality import RulePlan
+from sanitify.core.rules import compile_rules
+from sanitify.core.scoring import QualityScorer
+from sanitify.datacleaner import DataCleaner, default_rules
+
+
+def profile_many(
+    sources: Iterable[Any] | Mapping[Any, Any],
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    rules: Any = None,
+    scorer: Optional[QualityScorer] = None,
+    suggestions: bool = True,
+    ordered: bool = False,
+    **profile_options: Any,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Profile, check and score many tables, yielding one result per table.
+
+    ``sources`` holds DataFrames, CSV/Parquet paths or pyarrow Tables, as
+    an iterable or as a mapping from name to source (unnamed sources are
+    named by path or position). It is consumed lazily and at most two
+    tables per worker are in flight, so generators of tables work.
+
+    Rules (a rule list or spec) are compiled once and the scorer is shared
+    by every table. Tables run on a thread pool of ``n_jobs`` workers, or
+    on ``executor`` (a ``ProcessPoolExecutor`` needs picklable sources and
+    rules), whose in-flight window is sized for ``n_jobs`` workers, one per
+    CPU by default; with neither they run inline. Results stream back as
+    tables finish, or in input order with ``ordered=True``.
+
+    Each result is a dict with ``name``, ``ok``, ``seconds`` and either
+    ``profile``, ``issues``, ``score`` and ``suggestions`` or ``error`` and
+    ``traceback``: a failing table never aborts the batch.
+    ``profile_options`` are passed to ``DataCleaner.profile``.
+    """
+    plan = _compile(rules)
+    scorer = scorer or QualityScorer.from_plan(plan)
+    tasks = _named(sources)
+    args = (plan, scorer, suggestions, profile_options)
+
+    workers = resolve_n_jobs(n_jobs)
+    if executor is None and workers == 1:
+        for name, source in tasks:
+            yield profile_table(name, source, *args)
+        return
+
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            yield from _stream(pool, tasks, args, workers, ordered)
+        return
+
+    if n_jobs is None:
+        workers = resolve_n_jobs(-1)
+    yield from _stream(executor, tasks, args, workers, ordered)
+
+
+def profile_table(
+    name: Any,
+    source: Any,
+    plan: RulePlan,
+    scorer: QualityScorer,
+    suggestions: bool = True,
+    profile_options: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Result of one ``profile_many`` table; exceptions become error results.
+    """
+    start = time.perf_counter()
+    try:
+        cleaner = _cleaner(source, plan, scorer)
+        result = {
+            "name": name,
+            "ok": True,
+            "profile": cleaner.profile(**(profile_options or {})),
+            "issues": cleaner.check_quality(),
+            "score": cleaner.quality_score(),
+            "suggestions": cleaner.suggest_fixes() if suggestions else None,
+        }
+    except Exception as exc:
+        result = {
+            "name": name,
+            "ok": False,
+            "error": f"{type(exc).__name__}: {exc}",
+            "traceback": traceback.format_exc(),
+        }
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def _compile(rules: Any) -> RulePlan:
+    if rules is None:
+        return RulePlan(default_rules())
+    if isinstance(rules, RulePlan):
+        return rules
+    if isinstance(rules, list) and all(not isinstance(rule, dict) for rule in rules):
+        return RulePlan(rules)
+    return compile_rules(rules)
+
+
+def _cleaner(source: Any, plan: RulePlan, scorer: QualityScorer) -> DataCleaner:
+    # Frames are only read, so they are not copied.
+    if isinstance(source, pd.DataFrame):
+        return DataCleaner(source, rules=plan, scorer=scorer, copy=False)
+    if isinstance(source, (str, Path)):
+        return DataCleaner.from_path(source, rules=plan, scorer=scorer)
+    if type(source).__module__.startswith("pyarrow"):
+        return DataCleaner.from_arrow(source, rules=plan, scorer=scorer)
+    raise TypeError(f"Unsupported table source: {type(source).__name__}")
+
+
+def _named(sources: Iterable[Any] | Mapping[Any, Any]) -> Iterator[Tuple[Any, Any]]:
+    if isinstance(sources, Mapping):
+        yield from sources.items()
+        return
+    for position, source in enumerate(sources):
+        yield (str(source) if isinstance(source, (str, Path)) else position), source
+
+
+def _stream(
+    executor: Executor,
+    tasks: Iterator[Tuple[Any, Any]],
+    args: Tuple[Any, ...],
+    workers: int,
+    ordered: bool,
+) -> Iterator[Dict[str, Any]]:
+    limit = max(workers, 1) * 2
+    pending: Dict[Future, Tuple[int, Any]] = {}
+    finished: Dict[int, Dict[str, Any]] = {}
+    submitted = emitted = 0
+    exhausted = False
+
+    try:
+        while True:
+            # Results held back for ordering count against the limit too.
+            while not exhausted and len(pending) + len(finished) < limit:
+                task = next(tasks, None)
+                if task is None:
+                    exhausted = True
+                    break
+                pending[executor.submit(profile_table, *task, *args)] = (submitted, task[0])
+                submitted += 1
+
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                position, name = pending.pop(future)
+                result = _result(future, name)
+                if not ordered:
+                    yield result
+                    continue
+                finished[position] = result
+
+            while emitted in finished:
+                yield finished.pop(emitted)
+                emitted += 1
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _result(future: Future, name: Any) -> Dict[str, Any]:
+    # profile_table never raises; this catches executor failures such as
+    # unpicklable sources or a broken process pool.
+    try:
+        return future.result()
+    except Exception as exc:
+        return {
+            "name": name,
+            "ok": False,
+            "error": f"{type(exc).__name__}: {exc}",
+            "traceback": traceback.format_exc(),
+            "seconds": 0.0,
+        }
@@ -1,6 +1,10 @@
 from __future__ import annotations
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+
+from sanitify.cleaning.planner import FixPlanner
+from sanitify.utils.frames import drop_columns, fill_missing, shallow_copy
 
 class FixRegistry:
     """
@@ -8,7 +12,7 @@ class FixRegistry:
     """
     @staticmethod
     def drop_column(df: pd.DataFrame, column: str, params: Dict[str,Any]):
-        return df.drop(columns=[column])
+        return drop_columns(df, [column])
 
     @staticmethod
     def impute_mean(df: pd.DataFrame, column: str, params: Dict[str,Any]):
@@ -24,16 +28,21 @@ class FixRegistry:
 
     @staticmethod
     def impute_mode(df: pd.DataFrame, column: str, params: Dict[str, Any]):
-        mode_series = df[column].mode()
+        """
+        Fill with ``params["value"]`` when given (the suggestion engine
+        passes the profiled mode), else with the column's mode.
+        """
         if column not in df.columns:
-                return df
+            return df
 
-        mode_series = df[column].mode()
+        if "value" in params:
+            value = params["value"]
+        else:
+            mode_series = df[column].mode()
+            if mode_series.empty:
+                return df
+            value = mode_series.iloc[0]
 
-        if mode_series.empty:
-            return df
-        
-        value = mode_series.iloc[0]
         df[column] = df[column].fillna(value)
 
         return df
@@ -47,9 +56,53 @@ class FixRegistry:
     def drop_duplicate(df: pd.DataFrame, column: str, params: Dict[str, Any]):
         return df.drop_duplicates()
 
+    # Memory optimizations (see sanitify.core.optimize)
+    @staticmethod
+    def downcast(df: pd.DataFrame, column: str, params: Dict[str, Any]):
+        series = df[column]
+        try:
+            narrowed = series.astype(params["dtype"])
+        except (TypeError, ValueError, OverflowError):
+            return df
+        # Values outside the target range wrap or round; keep the column then.
+        if narrowed.astype(series.dtype).equals(series):
+            df[column] = narrowed
+        return df
+
+    @staticmethod
+    def to_datetime(df: pd.DataFrame, column: str, params: Dict[str, Any]):
+        series = df[column]
+        try:
+            parsed = pd.to_datetime(series, format=params.get("format"), errors="coerce")
+        except (TypeError, ValueError, OverflowError):
+            return df
+        # Values that fail to parse would become NaT; keep the column then.
+        if not (parsed.isna() & series.notna()).any():
+            df[column] = parsed
+        return df
+
+    @staticmethod
+    def to_category(df: pd.DataFrame, column: str, params: Dict[str, Any]):
+        df[column] = df[column].astype("category")
+        return df
+
+    @staticmethod
+    def to_arrow_string(df: pd.DataFrame, column: str, params: Dict[str, Any]):
+        df[column] = df[column].astype(pd.StringDtype("pyarrow"))
+        return df
+
+    @staticmethod
+    def to_sparse(df: pd.DataFrame, column: str, params: Dict[str, Any]):
+        df[column] = df[column].astype(pd.SparseDtype(df[column].dtype, np.nan))
+        return df
+
 class FixApplier:
     """
     Applies deterministic fixes to a copy of dataframe
+
+    The copy is shallow: fixes replace the columns they change and never
+    write into the input arrays, so untouched columns are shared with the
+    input instead of duplicated.
     """
 
     OPERATIONS = {
@@ -59,15 +112,63 @@ class FixApplier:
         "impute_mode": FixRegistry.impute_mode,
         "strip_strings": FixRegistry.strip_string,
         "drop_duplicates": FixRegistry.drop_duplicate,
+        "downcast": FixRegistry.downcast,
+        "to_datetime": FixRegistry.to_datetime,
+        "to_category": FixRegistry.to_category,
+        "to_arrow_string": FixRegistry.to_arrow_string,
+        "to_sparse": FixRegistry.to_sparse,
     }
 
+    def plan(
+        self,
+        df: pd.DataFrame,
+        fixes: List[Dict[str, Any]],
+        profile: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build an execution plan for ``fixes`` without running it.
+        """
+        return FixPlanner(self.OPERATIONS).plan(df, fixes, profile)
+
+    def execute(self, df: pd.DataFrame, plan: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Run a plan produced by ``plan()`` on a shallow copy of ``df``.
+        """
+        new_df = shallow_copy(df)
+
+        for step in plan["steps"]:
+            operation = step["operation"]
+
+            if operation == "drop_columns":
+                new_df = drop_columns(new_df, step["columns"])
+            elif operation == "fillna":
+                new_df = fill_missing(new_df, step["values"])
+            elif operation == "strip_strings":
+                for column in step["columns"]:
+                    new_df = FixRegistry.strip_string(new_df, column, {})
+            elif operation == "drop_duplicates":
+                new_df = new_df.drop_duplicates()
+            else:
+                func = self.OPERATIONS[operation]
+                new_df = func(new_df, step["column"], step["params"])
+
+        return new_df
+
     def apply(
         self,
         df: pd.DataFrame,
         fixes: List[Dict[str, Any]],
+        profile: Optional[Dict[str, Any]] = None,
+        optimize: bool = False,
     ) -> pd.DataFrame:
-
-        new_df = df.copy()
+        """
+        Apply ``fixes`` in order, or through a fused execution plan when
+        ``optimize=True`` (see ``FixPlanner`` for the reordering rules).
+        """
+        if optimize:
+            return self.execute(df, self.plan(df, fixes, profile))
+
+        new_df = shallow_copy(df)
 
         for fix in fixes:
             operation = fix["operation"]
@@ -0,0 +1,268 @@
+from __future__ import annotations
+import pandas as pd
+from typing import Callable, Dict, List, Any, Iterable, Optional, Tuple
+
+from sanitify.core.sketches import profile_mode
+
+# Statistic each imputation fills with, and where the profile keeps it.
+IMPUTATIONS = {
+    "impute_mean": "mean",
+    "impute_median": "median",
+    "impute_mode": "mode",
+}
+
+# Relative per-cell cost of each step kind, used for plan cost estimates.
+CELL_COST = {
+    "drop_columns": 0,
+    "fillna": 1,
+    "statistic": 1,
+    "strip_strings": 4,
+    "custom": 2,
+    "drop_duplicates": 3,
+}
+
+
+class FixPlanner:
+    """
+    Turns an approved fix list into an inspectable execution plan.
+
+    The planner looks at the whole list before anything runs:
+
+    - all dropped columns are removed first, and later fixes on them skipped
+    - imputations reuse exact profile statistics where available (an
+      ``impute_mode`` ``value`` param first) and are merged into one
+      ``fillna`` mapping (the first imputation of a column wins)
+    - string stripping and other operations follow, in their listed order
+    - ``drop_duplicates`` runs last, once, over the surviving columns
+
+    Each step carries an ``estimated_cost`` in weighted cells touched.
+
+    ``statistic(df, column, operation, profile)`` replaces how imputation
+    values are resolved; it returns ``(value, source)``.
+    """
+
+    def __init__(
+        self,
+        operations: Iterable[str],
+        statistic: Optional[Callable[..., Tuple[Any, str]]] = None,
+    ):
+        self._operations = set(operations)
+        self._resolve = statistic or self._statistic
+
+    def plan(
+        self,
+        df: pd.DataFrame,
+        fixes: List[Dict[str, Any]],
+        profile: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        rows = len(df)
+
+        for fix in fixes:
+            operation = fix["operation"]
+            column = fix.get("column")
+            if operation not in self._operations:
+                raise ValueError(f"Unknown operation: {operation}")
+            if column is not None and column not in df.columns:
+                raise ValueError(f"Column '{column}' not found in dataframe")
+
+        dropped = [
+            fix["column"] for fix in fixes
+            if fix["operation"] == "drop_column"
+        ]
+        dropped = list(dict.fromkeys(dropped))
+        skipped: List[Dict[str, Any]] = []
+
+        fill_values: Dict[str, Any] = {}
+        fill_sources: Dict[str, str] = {}
+        computed_cells = 0
+        strip_columns: List[str] = []
+        custom: List[Dict[str, Any]] = []
+        dedup: List[Dict[str, Any]] = []
+
+        for fix in fixes:
+            operation = fix["operation"]
+            column = fix.get("column")
+
+            if operation == "drop_column":
+                continue
+            if column is not None and column in dropped:
+                skipped.append({"fix": fix, "reason": "column dropped"})
+                continue
+
+            if operation in IMPUTATIONS:
+                if column in fill_sources:
+                    skipped.append({"fix": fix, "reason": "column already imputed"})
+                    continue
+                params = fix.get("params") or {}
+                if operation == "impute_mode" and "value" in params:
+                    value, source = params["value"], "params"
+                else:
+                    value, source = self._resolve(df, column, operation, profile)
+                fill_sources[column] = source
+                if source == "computed":
+                    computed_cells += rows
+                if value is not None:
+                    fill_values[column] = value
+            elif operation == "strip_strings":
+                if column not in strip_columns:
+                    strip_columns.append(column)
+            elif operation == "drop_duplicates":
+                dedup.append(fix)
+            else:
+                custom.append(fix)
+
+        steps: List[Dict[str, Any]] = []
+        width = df.shape[1] - len(dropped)
+
+        if dropped:
+            steps.append(self._step("drop_columns", dropped, len(dropped)))
+
+        if fill_sources:
+            step = self._step(
+                "fillna",
+                list(fill_sources),
+                rows * len(fill_values) * CELL_COST["fillna"]
+                + computed_cells * CELL_COST["statistic"],
+            )
+            step["values"] = fill_values
+            step["sources"] = fill_sources
+            steps.append(step)
+
+        if strip_columns:
+            steps.append(self._step(
+                "strip_strings",
+                strip_columns,
+                rows * len(strip_columns) * CELL_COST["strip_strings"],
+            ))
+
+        for fix in custom:
+            column = fix.get("column")
+            step = self._step(
+                fix["operation"],
+                [] if column is None else [column],
+                rows * (width if column is None else 1) * CELL_COST["custom"],
+            )
+            step["params"] = fix.get("params", {})
+            step["column"] = column
+            steps.append(step)
+
+        if dedup:
+            steps.append(self._step(
+                "drop_duplicates",
+                None,
+                rows * width * CELL_COST["drop_duplicates"],
+            ))
+            skipped.extend(
+                {"fix": fix, "reason": "duplicate drop_duplicates"}
+                for fix in dedup[1:]
+            )
+
+        for index, step in enumerate(steps):
+            step["step"] = index
+
+        return {
+            "steps": steps,
+            "skipped": skipped,
+            "estimated_cost": sum(step["estimated_cost"] for step in steps),
+        }
+
+    # ------------------------
+    # Helpers
+    # ------------------------
+    @staticmethod
+    def _step(operation: str, columns: Optional[List[str]], cost: int) -> Dict[str, Any]:
+        return {
+            "step": None,
+            "operation": operation,
+            "columns": columns,
+            "estimated_cost": int(cost),
+        }
+
+    def _statistic(
+        self,
+        df: pd.DataFrame,
+        column: str,
+        operation: str,
+        profile: Optional[Dict[str, Any]],
+    ):
+        stat = IMPUTATIONS[operation]
+
+        value = profile_statistic(profile, df, column, stat)
+        if value is not None:
+            return value, "profile"
+
+        series = df[column]
+        if stat == "mean":
+            value = series.mean()
+        elif stat == "median":
+            value = series.median()
+        else:
+            modes = series.mode()
+            value = None if modes.empty else modes.iloc[0]
+
+        if value is not None and pd.isna(value):
+            value = None
+        return value, "computed"
+
+
+def profile_statistic(
+    profile: Optional[Dict[str, Any]],
+    df: pd.DataFrame,
+    column: str,
+    stat: str,
+) -> Any:
+    """
+    Exact statistic for ``column`` from ``profile``, or None when the
+    profile does not describe ``df`` or holds only an estimate.
+    """
+    if not profile or profile["dataset"]["rows"] != len(df):
+        return None
+    return exact_statistic(profile, column, stat, str(df[column].dtype))
+
+
+def exact_statistic(profile: Optional[Dict[str, Any]], column: Any, stat: str, dtype: str) -> Any:
+    """
+    ``stat`` of ``column`` from ``profile`` when it is exact and the column
+    still has ``dtype``, else None. The caller checks the profile describes
+    the same rows.
+    """
+    if not profile or profile["dataset"].get("sampled"):
+        return None
+
+    meta = profile["columns"].get(column)
+    if meta is None or meta["dtype"] != dtype:
+        return None
+    if stat in meta.get("approximate", {}):
+        return None
+    if stat == "mode":
+        return profile_mode(meta)
+
+    return (meta.get("numeric") or {}).get(stat)
+
+
+def changed_columns(
+    before: pd.DataFrame,
+    after: pd.DataFrame,
+    fixes: List[Dict[str, Any]],
+) -> Optional[List[Any]]:
+    """
+    Columns of ``after`` that applying ``fixes`` to ``before`` may have
+    changed, or None when rows were removed or reordered.
+
+    Dropped columns are not listed; they are simply absent from ``after``.
+    """
+    if len(before) != len(after) or not before.index.equals(after.index):
+        return None
+
+    changed: List[Any] = [col for col in after.columns if col not in before.columns]
+    for fix in fixes:
+        operation = fix["operation"]
+        column = fix.get("column")
+        if operation in ("drop_column", "drop_duplicates"):
+            # With identical rows drop_duplicates removed nothing.
+            continue
+        if column is None:
+            return list(after.columns)
+        if column in after.columns and column not in changed:
+            changed.append(column)
+    return changed
@@ -0,0 +1,259 @@
+from __future__ import annotations
+import pandas as pd
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sanitify.cleaning.deterministic import FixApplier
+from sanitify.cleaning.planner import IMPUTATIONS, FixPlanner, exact_statistic
+from sanitify.core.duplicates import DEFAULT_MEMORY_LIMIT, FingerprintSet, row_fingerprints
+from sanitify.utils.io import file_format
+from sanitify.utils.tracing import NULL_TRACER
+
+# ``read(columns)`` returns a fresh iterator of DataFrame chunks of the
+# source, restricted to ``columns`` unless it is None.
+ChunkReader = Callable[[Optional[List[Any]]], Iterable[pd.DataFrame]]
+
+
+class StreamingFixApplier:
+    """
+    Applies approved fixes chunk by chunk and writes the cleaned rows to a
+    CSV/TSV (optionally gzip/bz2/xz compressed) or Parquet file, so neither
+    the source nor the result has to fit in memory.
+
+    Fixes follow the ``FixPlanner`` plan, so the file holds the rows of
+    ``FixApplier().apply(df, fixes, profile, optimize=True)`` (without the
+    index). ``drop_duplicates`` keeps the first occurrence of each row in a
+    ``FingerprintSet`` that spills to disk past ``memory_limit`` bytes.
+
+    Imputation values are resolved before any row is written: means and
+    medians come from ``profile`` when it holds them exactly, anything else
+    from one pass over the imputed columns only. Means keep a running sum
+    and count and modes merge per-chunk value counts. A median missing
+    from the profile is the one exception to bounded memory: the present
+    values of its column are loaded in full, and the summary lists such
+    columns under ``materialized``. Other operations run per chunk, and
+    Parquet output keeps the schema of the first chunk.
+    """
+
+    def __init__(
+        self,
+        memory_limit: int = DEFAULT_MEMORY_LIMIT,
+        spill_dir: Optional[str] = None,
+        tracer: Any = NULL_TRACER,
+    ):
+        self._memory_limit = memory_limit
+        self._spill_dir = spill_dir
+        self._tracer = tracer
+
+    def apply(
+        self,
+        read: ChunkReader,
+        fixes: List[Dict[str, Any]],
+        output: str | Path,
+        profile: Optional[Dict[str, Any]] = None,
+        **write_options: Any,
+    ) -> Dict[str, Any]:
+        """
+        Write the fixed source to ``output`` and return a summary of rows
+        read and written, duplicates dropped and imputation values used.
+        """
+        writer = _ChunkWriter(output, **write_options)
+        chunks = iter(read(None))
+        first = next(chunks, None)
+        if first is None:
+            writer.close()
+            return self._summary(writer, 0, 0, {}, [], None)
+
+        imputed: Dict[Any, str] = {}
+
+        def defer(df: pd.DataFrame, column: Any, operation: str, _profile: Any) -> Tuple[Any, str]:
+            imputed[column] = operation
+            return None, "pending"
+
+        plan = FixPlanner(FixApplier.OPERATIONS, statistic=defer).plan(first, fixes)
+        dedup = any(step["operation"] == "drop_duplicates" for step in plan["steps"])
+        steps = [step for step in plan["steps"] if step["operation"] != "drop_duplicates"]
+
+        with self._tracer.span("apply.statistics", columns=len(imputed)):
+            statistics = self._statistics(read, imputed, profile, first)
+        for step in steps:
+            if step["operation"] == "fillna":
+                # Values given as fix params were resolved by the planner.
+                for column, source in step["sources"].items():
+                    if source == "params":
+                        statistics[column] = {
+                            "operation": "impute_mode",
+                            "value": step["values"].get(column),
+                            "source": source,
+                        }
+                step["values"] = {
+                    column: stat["value"]
+                    for column, stat in statistics.items()
+                    if stat["value"] is not None
+                }
+                step["sources"] = {column: stat["source"] for column, stat in statistics.items()}
+
+        applier = FixApplier()
+        seen = FingerprintSet(self._memory_limit, self._spill_dir) if dedup else None
+        rows_read = dropped = 0
+        try:
+            for chunk in _chain(first, chunks):
+                with self._tracer.span("apply.chunk", rows=len(chunk)):
+                    rows_read += len(chunk)
+                    cleaned = applier.execute(chunk, {"steps": steps})
+                    if seen is not None and len(cleaned):
+                        keep = seen.add(row_fingerprints(cleaned))
+                        dropped += int(len(keep) - keep.sum())
+                        cleaned = cleaned[keep]
+                    writer.write(cleaned)
+            writer.close()
+        finally:
+            if seen is not None:
+                seen.close()
+
+        return self._summary(writer, rows_read, dropped, statistics, plan["skipped"], seen)
+
+    # ------------------------
+    # Helpers
+    # ------------------------
+    def _statistics(
+        self,
+        read: ChunkReader,
+        imputed: Dict[Any, str],
+        profile: Optional[Dict[str, Any]],
+        first: pd.DataFrame,
+    ) -> Dict[Any, Dict[str, Any]]:
+        statistics: Dict[Any, Dict[str, Any]] = {}
+        pending: Dict[Any, str] = {}
+        for column, operation in imputed.items():
+            stat = IMPUTATIONS[operation]
+            value = exact_statistic(profile, column, stat, str(first[column].dtype))
+            if value is None:
+                pending[column] = stat
+            else:
+                statistics[column] = {"operation": operation, "value": value, "source": "profile"}
+
+        if not pending:
+            return statistics
+
+        # One pass over the imputed columns only.
+        sums: Dict[Any, List[float]] = {c: [0.0, 0] for c, s in pending.items() if s == "mean"}
+        values: Dict[Any, List[pd.Series]] = {c: [] for c, s in pending.items() if s == "median"}
+        counts: Dict[Any, Optional[pd.Series]] = {c: None for c, s in pending.items() if s == "mode"}
+        for chunk in read(list(pending)):
+            for column, running in sums.items():
+                running[0] += chunk[column].sum()
+                running[1] += int(chunk[column].count())
+            for column in values:
+                values[column].append(chunk[column].dropna())
+            for column, total in counts.items():
+                chunk_counts = chunk[column].value_counts(dropna=True)
+                counts[column] = chunk_counts if total is None else total.add(chunk_counts, fill_value=0)
+
+        for column, stat in pending.items():
+            if stat == "mode":
+                value = _mode(counts[column])
+            elif stat == "mean":
+                total, count = sums[column]
+                value = total / count if count else None
+            else:
+                value = pd.concat(values.pop(column), ignore_index=True).median()
+            if value is not None and pd.isna(value):
+                value = None
+            statistics[column] = {"operation": imputed[column], "value": value, "source": "computed"}
+        return statistics
+
+    @staticmethod
+    def _summary(
+        writer: "_ChunkWriter",
+        rows_read: int,
+        dropped: int,
+        statistics: Dict[Any, Dict[str, Any]],
+        skipped: List[Dict[str, Any]],
+        seen: Optional[FingerprintSet],
+    ) -> Dict[str, Any]:
+        return {
+            "output": str(writer.path),
+            "format": writer.format,
+            "chunks": writer.chunks,
+            "rows_read": rows_read,
+            "rows_written": writer.rows,
+            "duplicates_dropped": dropped,
+            "statistics": statistics,
+            # Columns loaded in full to compute a median.
+            "materialized": [
+                column
+                for column, stat in statistics.items()
+                if stat["source"] == "computed" and IMPUTATIONS[stat["operation"]] == "median"
+            ],
+            "skipped": skipped,
+            "spilled": bool(seen is not None and seen.spilled),
+        }
+
+
+class _ChunkWriter:
+    """
+    Appends DataFrame chunks to a CSV/TSV or Parquet file.
+    """
+
+    def __init__(self, path: str | Path, **options: Any):
+        self.path = Path(path)
+        self.format = file_format(path)
+        if self.path.suffix.lower() in (".zip", ".zst"):
+            raise ValueError(f"Streaming output cannot be appended to {self.path.suffix} files")
+        self.options = options
+        self.chunks = 0
+        self.rows = 0
+        self._parquet: Any = None
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        if self.format == "parquet":
+            self._write_parquet(chunk)
+        else:
+            if self.format == "tsv":
+                self.options.setdefault("sep", "\t")
+            # Compressed CSV is appended as concatenated streams, which
+            # gzip, bz2 and xz readers treat as one file.
+            chunk.to_csv(
+                self.path,
+                mode="a" if self.chunks else "w",
+                header=not self.chunks,
+                index=False,
+                **self.options,
+            )
+        self.chunks += 1
+        self.rows += len(chunk)
+
+    def close(self) -> None:
+        if self.chunks == 0:
+            self.write(pd.DataFrame())
+        if self._parquet is not None:
+            self._parquet.close()
+            self._parquet = None
+
+    def _write_parquet(self, chunk: pd.DataFrame) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(chunk, preserve_index=False)
+        if self._parquet is None:
+            self._parquet = pq.ParquetWriter(str(self.path), table.schema, **self.options)
+        else:
+            table = table.cast(self._parquet.schema)
+        self._parquet.write_table(table)
+
+
+def _chain(first: pd.DataFrame, rest: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    yield first
+    yield from rest
+
+
+def _mode(counts: Optional[pd.Series]) -> Any:
+    # Series.mode() returns the most frequent values sorted; take the first.
+    if counts is None or counts.empty:
+        return None
+    modes = counts.index[counts.to_numpy() == counts.max()]
+    try:
+        return modes.sort_values()[0]
+    except TypeError:
+        return modes[0]
@@ -0,0 +1,330 @@
+from __future__ import annotations
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sanitify.core.batch import TOP_K, EMPTY_NUMERIC, add_top_values, base_metrics, is_batchable
+from sanitify.core.duplicates import DEFAULT_MEMORY_LIMIT, DuplicateCounter, detection_info, row_fingerprints
+from sanitify.core.profiler import DataProfiler
+from sanitify.core.sketches import top_values
+from sanitify.core.temporal import EMPTY_TEMPORAL, TemporalSummary, is_temporal
+from sanitify.utils.tracing import NULL_TRACER
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.parquet
+    except ImportError as exc:
+        raise ImportError(
+            "Arrow-native profiling requires pyarrow. "
+            "Install it with: pip install 'sanitify[parquet]'"
+        ) from exc
+    return pyarrow
+
+
+def iter_arrow_chunks(
+    source: Any,
+    chunksize: int = 100_000,
+    columns: Optional[List[Any]] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield a ``pyarrow.Table``, ``RecordBatch`` or Parquet file as DataFrames
+    of at most ``chunksize`` rows, reading only ``columns`` when given.
+    """
+    pa = _require_pyarrow()
+
+    if isinstance(source, (str, Path)):
+        batches = pa.parquet.ParquetFile(source).iter_batches(batch_size=chunksize, columns=columns)
+    else:
+        table = pa.Table.from_batches([source]) if isinstance(source, pa.RecordBatch) else source
+        if columns is not None:
+            table = table.select(columns)
+        batches = table.to_batches(max_chunksize=chunksize)
+
+    for batch in batches:
+        yield batch.to_pandas()
+
+
+class ArrowProfiler:
+    """
+    Dataset profiler running on Arrow data with ``pyarrow.compute`` kernels.
+
+    Accepts a ``pyarrow.Table``, a ``RecordBatch`` or the path of a Parquet
+    file and returns the same layout as ``DataProfiler.run()``. Columns are
+    never converted to pandas objects; ``dtype`` reports the pandas dtype the
+    column converts to. For Parquet files, columns are read one at a time
+    and row-group statistics supply null counts and min/max directly;
+    columns that the statistics show to be all-null or constant are not
+    read at all. ``memory_bytes`` is the Arrow buffer size (the uncompressed
+    column size for Parquet files, an approximation), recorded as
+    ``memory_mode="arrow"``.
+
+    Duplicates are counted from row fingerprints over ``batch_size``-row
+    slices, so they cost one extra pass over the data.
+    """
+
+    PROFILE_VERSION = DataProfiler.PROFILE_VERSION
+
+    def __init__(
+        self,
+        source: Any,
+        batch_size: int = 100_000,
+        tracer: Any = NULL_TRACER,
+        duplicate_memory_limit: int = DEFAULT_MEMORY_LIMIT,
+    ):
+        pa = _require_pyarrow()
+
+        if isinstance(source, pa.RecordBatch):
+            source = pa.Table.from_batches([source])
+        if not isinstance(source, (pa.Table, str, Path)):
+            raise TypeError("ArrowProfiler expects a pyarrow Table, RecordBatch or Parquet path")
+
+        self._source = source
+        self._batch_size = batch_size
+        self._tracer = tracer
+        self._duplicate_memory_limit = duplicate_memory_limit
+
+        if isinstance(source, pa.Table):
+            self._parquet = None
+            self._schema = source.schema
+            self._rows = source.num_rows
+        else:
+            self._parquet = pa.parquet.ParquetFile(source)
+            self._schema = self._parquet.schema_arrow
+            self._rows = self._parquet.metadata.num_rows
+
+        # Conversion of an empty table yields pandas dtypes and drops
+        # pandas index columns stored alongside the data.
+        self._dtypes = self._schema.empty_table().to_pandas().dtypes
+
+    # ------------------------
+    # Public API
+    # ------------------------
+    def run(self) -> Dict[str, Any]:
+        tracer = self._tracer
+        with tracer.span("profile", rows=self._rows, engine="arrow"):
+            with tracer.span("profile.columns", columns=len(self._dtypes)):
+                columns = self._column_profiles()
+            with tracer.span("profile.dataset"):
+                dataset = self._dataset_summary(len(columns))
+            with tracer.span("profile.duplicates"):
+                duplicates, spilled = self._duplicates()
+
+        return {
+            "profile_version": self.PROFILE_VERSION,
+            "dataset": dataset,
+            "columns": columns,
+            "duplicates": duplicates,
+            "duplicate_detection": detection_info("fingerprint", True, None, spilled),
+        }
+
+    # ------------------------
+    # Dataset Level
+    # ------------------------
+    def _dataset_summary(self, width: int) -> Dict[str, Any]:
+        if self._parquet is None:
+            memory = self._source.select(list(self._dtypes.index)).nbytes
+        else:
+            meta = self._parquet.metadata
+            positions = self._parquet_positions()
+            memory = sum(
+                meta.row_group(g).column(i).total_uncompressed_size
+                for g in range(meta.num_row_groups)
+                for i in positions.values()
+            )
+
+        return {
+            "rows": int(self._rows),
+            "columns": int(width),
+            "memory_bytes": int(memory),
+            "memory_mode": "arrow",
+            "memory_error_bytes": None if self._parquet is not None else 0.0,
+            "sampled": False,
+            "sample_size": int(self._rows),
+            "sampling": None,
+        }
+
+    def _duplicates(self) -> Tuple[int, bool]:
+        counter = DuplicateCounter(memory_limit=self._duplicate_memory_limit)
+        try:
+            for chunk in iter_arrow_chunks(self._source, self._batch_size):
+                counter.update(row_fingerprints(chunk))
+            return counter.count(), counter.spilled
+        finally:
+            counter.close()
+
+    # ------------------------
+    # Column Level
+    # ------------------------
+    def _column_profiles(self) -> Dict[str, Any]:
+        positions = self._parquet_positions() if self._parquet is not None else {}
+        profiles: Dict[str, Any] = {}
+
+        for name, dtype in self._dtypes.items():
+            stats = self._parquet_statistics(positions.get(name))
+            with self._tracer.span("profile.column", column=str(name)):
+                profiles[name] = self._column_profile(name, dtype, stats)
+        return profiles
+
+    def _column_profile(self, name: str, dtype: Any, stats: Dict[str, Any]) -> Dict[str, Any]:
+        pa = _require_pyarrow()
+        field = self._schema.field(name)
+        is_float = pa.types.is_floating(field.type)
+        numeric = pa.types.is_integer(field.type) or is_float or pa.types.is_boolean(field.type)
+
+        null_count = stats.get("null_count")
+        if null_count is not None and not is_float:
+            dtype = _converted_dtype(field, dtype, null_count)
+            is_numeric = numeric and is_batchable(dtype)
+
+            if null_count == self._rows:
+                return self._result(dtype, null_count, 0, dict(EMPTY_NUMERIC))
+
+            low, high = stats.get("min"), stats.get("max")
+            if is_numeric and null_count == 0 and low is not None and low == high:
+                # Constant column: every metric follows from the statistics.
+                value = float(low)
+                return self._result(dtype, 0, 1, {
+                    "mean": value,
+                    "std": 0.0 if self._rows > 1 else float("nan"),
+                    "min": value,
+                    "max": value,
+                    "median": value,
+                })
+
+        column = self._read_column(name)
+        if field.type != column.type:
+            field = field.with_type(column.type)
+
+        valid = column.drop_null()
+        if pa.types.is_dictionary(valid.type):
+            valid = valid.cast(valid.type.value_type)
+        if is_float:
+            valid = valid.filter(pa.compute.invert(pa.compute.is_nan(valid)))
+        missing = self._rows - len(valid)
+        dtype = _converted_dtype(field, dtype, column.null_count)
+
+        temporal = pa.types.is_timestamp(valid.type) or pa.types.is_duration(valid.type)
+        top = []
+        with self._tracer.span("metric.unique", column=str(name)):
+            if numeric or temporal or not len(valid):
+                unique = pa.compute.count_distinct(valid).as_py() if len(valid) else 0
+            else:
+                # One hash pass gives the distinct count and the top values.
+                counts = pa.compute.value_counts(valid)
+                unique = len(counts)
+                top = top_values(pd.Series(
+                    counts.field("counts").to_numpy(),
+                    index=counts.field("values").to_pylist(),
+                ), TOP_K)
+
+        metrics = None
+        if numeric and is_batchable(dtype):
+            metrics = _numeric_metrics(valid, stats) if len(valid) else dict(EMPTY_NUMERIC)
+        elif missing == self._rows:
+            metrics = dict(EMPTY_NUMERIC)
+        col_profile = self._result(dtype, missing, unique, None)
+        add_top_values(col_profile, top)
+        if temporal and len(valid):
+            with self._tracer.span("metric.temporal", column=str(name)):
+                col_profile["temporal"] = _temporal_metrics(valid)
+        if metrics is not None:
+            col_profile["numeric"] = metrics
+        return col_profile
+
+    def _result(self, dtype: Any, missing: int, unique: int, numeric: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        col_profile = base_metrics(str(dtype), missing, unique, self._rows)
+        if missing == self._rows and is_temporal(dtype):
+            col_profile["temporal"] = dict(EMPTY_TEMPORAL)
+        if numeric is not None:
+            col_profile["numeric"] = numeric
+        return col_profile
+
+    def _read_column(self, name: str):
+        with self._tracer.span("profile.read", column=str(name)):
+            if self._parquet is None:
+                return self._source.column(name)
+            return self._parquet.read(columns=[name]).column(0)
+
+    # ------------------------
+    # Parquet statistics
+    # ------------------------
+    def _parquet_positions(self) -> Dict[str, int]:
+        schema = self._parquet.metadata.schema
+        wanted = set(self._dtypes.index)
+        return {
+            schema.column(i).path: i
+            for i in range(len(schema))
+            if schema.column(i).path in wanted
+        }
+
+    def _parquet_statistics(self, position: Optional[int]) -> Dict[str, Any]:
+        """
+        Null count and min/max merged over all row groups, for each one that
+        every row group records.
+        """
+        if position is None:
+            return {}
+
+        meta = self._parquet.metadata
+        stats = [meta.row_group(g).column(position).statistics for g in range(meta.num_row_groups)]
+        if not stats or any(s is None for s in stats):
+            return {}
+
+        merged: Dict[str, Any] = {}
+        if all(s.has_null_count for s in stats):
+            merged["null_count"] = int(sum(s.null_count for s in stats))
+
+        # Row groups without values have no min/max and do not constrain them.
+        bounded = [s for s in stats if s.num_values > 0]
+        if bounded and all(s.has_min_max for s in bounded):
+            merged["min"] = min(s.min for s in bounded)
+            merged["max"] = max(s.max for s in bounded)
+        return merged
+
+
+def _converted_dtype(field: Any, dtype: Any, null_count: int) -> Any:
+    # to_pandas turns integer columns with nulls into float64 and boolean
+    # columns with nulls into object.
+    pa = _require_pyarrow()
+    if null_count and pa.types.is_integer(field.type):
+        return np.dtype(np.float64)
+    if null_count and pa.types.is_boolean(field.type):
+        return np.dtype(object)
+    return dtype
+
+
+def _temporal_metrics(valid: Any) -> Dict[str, Any]:
+    # Timestamps and durations cast to their int64 ticks without a copy.
+    pa = _require_pyarrow()
+    kind = "m" if pa.types.is_duration(valid.type) else "M"
+    tz = getattr(valid.type, "tz", None)
+    summary = TemporalSummary(kind, valid.type.unit, tz, k=max(len(valid), 1))
+    summary.update_ticks(valid.cast(pa.int64()).to_numpy())
+    return summary.to_dict()
+
+
+def _numeric_metrics(valid: Any, stats: Dict[str, Any]) -> Dict[str, Any]:
+    pa = _require_pyarrow()
+    pc = pa.compute
+
+    if pa.types.is_boolean(valid.type):
+        valid = valid.cast(pa.uint8())
+
+    if "min" in stats and not pa.types.is_floating(valid.type):
+        low, high = stats["min"], stats["max"]
+    else:
+        bounds = pc.min_max(valid)
+        low, high = bounds["min"].as_py(), bounds["max"].as_py()
+
+    std = pc.stddev(valid, ddof=1).as_py()
+    return {
+        "mean": float(pc.mean(valid).as_py()),
+        "std": float("nan") if std is None else float(std),
+        "min": float(low),
+        "max": float(high),
+        "median": float(pc.quantile(valid, q=0.5, interpolation="midpoint")[0].as_py()),
+    }
@@ -0,0 +1,349 @@
+from __future__ import annotations
+import warnings
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, List, Optional
+
+from sanitify.core.sampling import RowSample, apply_estimates, sample_estimates
+from sanitify.core.sketches import HyperLogLog, QuantileSketch, TopK, numeric_keys, top_values, value_counts
+from sanitify.core.temporal import is_temporal, temporal_profile
+from sanitify.utils.tracing import NULL_TRACER
+
+# Number of same-dtype numeric columns reduced together in one 2D block.
+# Bounds the temporary memory of the block copy and its sorted twin.
+BATCH_COLUMNS = 64
+
+# Most frequent values kept per categorical column under "top_values".
+TOP_K = 10
+
+NUMERIC_KINDS = "biuf"
+
+EMPTY_NUMERIC = {
+    "mean": None,
+    "std": None,
+    "min": None,
+    "max": None,
+    "median": None,
+}
+
+
+def profile_columns(
+    df: pd.DataFrame,
+    total_rows: int,
+    approximate: bool = False,
+    tracer: Any = NULL_TRACER,
+    sample: Optional[RowSample] = None,
+) -> Dict[str, Any]:
+    """
+    Batched column profiling engine.
+
+    Numeric columns are grouped by dtype and reduced together on 2D NumPy
+    blocks. One sort per block yields min, max, median and the distinct
+    count; missing counts, mean and std come from column-wise reductions
+    over the same block. Remaining columns share a single ``isna`` pass,
+    and one ``value_counts`` per column yields both the distinct count and
+    the ``TOP_K`` most frequent values (``top_values``, as ``[value,
+    count]`` pairs). Datetime and timedelta columns also get ``temporal``
+    metrics (range, span, order and gaps) from their int64 ticks.
+
+    With ``approximate=True`` no column is sorted or hashed into a full set:
+    distinct counts come from HyperLogLog, medians from a quantile sketch
+    and top values from a ``TopK`` summary. Columns whose sketches
+    saturated carry an ``approximate`` mapping of metric name to error
+    bound.
+
+    With a ``sample`` the approximate path estimates median and std from
+    the sampled rows instead of a quantile sketch, and records their
+    confidence intervals under ``sampled``; missing, unique, min, max and
+    mean still cover every row. The exact path ignores it: its sort already
+    yields the exact median.
+
+    Every block and every non-numeric column metric is timed as a span on
+    ``tracer``; block spans list the columns they cover.
+
+    Output matches the per-column profile layout of ``DataProfiler``.
+    """
+    groups: Dict[str, List[int]] = {}
+    others: List[int] = []
+
+    for pos, dtype in enumerate(df.dtypes):
+        if is_batchable(dtype):
+            groups.setdefault(str(dtype), []).append(pos)
+        else:
+            others.append(pos)
+
+    by_position: Dict[int, Dict[str, Any]] = {}
+
+    for positions in groups.values():
+        for start in range(0, len(positions), BATCH_COLUMNS):
+            chunk = positions[start:start + BATCH_COLUMNS]
+            frame = df.iloc[:, chunk]
+            dtype = str(frame.dtypes.iloc[0])
+            with tracer.span(
+                "profile.numeric_block",
+                dtype=dtype,
+                columns=", ".join(map(str, frame.columns)),
+            ):
+                if approximate:
+                    metrics = approximate_block_metrics(
+                        to_block(frame), total_rows, dtype, tracer=tracer, sample=sample
+                    )
+                else:
+                    metrics = block_metrics(to_block(frame), total_rows, dtype, tracer=tracer)
+            by_position.update(zip(chunk, metrics))
+
+    if others:
+        with tracer.span("metric.missing", columns=len(others)):
+            missing_counts = df.iloc[:, others].isna().sum(axis=0).to_numpy()
+        for pos, missing in zip(others, missing_counts):
+            series = df.iloc[:, pos]
+            temporal = is_temporal(series.dtype)
+            errors: Dict[str, float] = {}
+            top_error = None
+            with tracer.span("metric.unique", column=str(df.columns[pos])):
+                if approximate:
+                    distinct = HyperLogLog()
+                    distinct.update(series)
+                    unique = distinct.count()
+                    if not distinct.is_exact:
+                        errors["unique"] = distinct.relative_error
+                    # Timestamps never make JSON top values.
+                    frequent = TopK(k=TOP_K)
+                    if not temporal:
+                        frequent.update(series)
+                    top = frequent.top()
+                    if not frequent.is_exact:
+                        top_error = frequent.relative_error
+                else:
+                    counts = value_counts(series)
+                    unique = len(counts)
+                    top = top_values(counts, TOP_K)
+            col_profile = base_metrics(
+                str(series.dtype), int(missing), unique, total_rows
+            )
+            add_top_values(col_profile, top)
+            if top_error is not None and "top_values" in col_profile:
+                errors["top_values"] = top_error
+            if temporal:
+                with tracer.span("metric.temporal", column=str(df.columns[pos])):
+                    col_profile["temporal"], error = temporal_profile(series, approximate)
+                if error is not None:
+                    errors["temporal"] = error
+            if int(missing) == total_rows:
+                col_profile["numeric"] = dict(EMPTY_NUMERIC)
+            if errors:
+                col_profile["approximate"] = errors
+            by_position[pos] = col_profile
+
+    return {col: by_position[pos] for pos, col in enumerate(df.columns)}
+
+
+def base_metrics(dtype: str, missing: int, unique: int, total_rows: int) -> Dict[str, Any]:
+    return {
+        "dtype": dtype,
+        "missing": int(missing),
+        "missing_pct": float(missing / total_rows) if total_rows > 0 else 0.0,
+        "unique": int(unique),
+        "is_constant": bool(unique <= 1),
+    }
+
+
+def add_top_values(col_profile: Dict[str, Any], top: List[Any]) -> None:
+    """
+    Record ``top`` as ``top_values`` when every value is a plain JSON
+    scalar, so profiles stay serializable and values survive a round trip.
+    """
+    pairs = []
+    for value, count in top:
+        if isinstance(value, np.generic):
+            value = value.item()
+        if not isinstance(value, (str, bool, int, float)):
+            return
+        pairs.append([value, int(count)])
+    if pairs:
+        col_profile["top_values"] = pairs
+
+
+def is_batchable(dtype: Any) -> bool:
+    if isinstance(dtype, np.dtype):
+        return dtype.kind in NUMERIC_KINDS
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_complex_dtype(dtype)
+
+
+def to_block(frame: pd.DataFrame) -> np.ndarray:
+    """
+    Materialize a same-dtype column group as a 2D array (rows x columns).
+
+    Native integer and float blocks keep their dtype so that sorting and
+    distinct counting stay exact; booleans become uint8 and nullable
+    extension dtypes become float64 with NaN for missing values.
+    """
+    dtype = frame.dtypes.iloc[0]
+    if isinstance(dtype, np.dtype):
+        if dtype.kind == "b":
+            return frame.to_numpy(dtype=np.uint8)
+        return frame.to_numpy(dtype=dtype)
+    return frame.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def block_metrics(
+    block: np.ndarray,
+    total_rows: int,
+    dtype: str,
+    tracer: Any = NULL_TRACER,
+) -> List[Dict[str, Any]]:
+    rows, width = block.shape
+
+    with tracer.span("metric.missing", columns=width):
+        if block.dtype.kind == "f":
+            missing = np.isnan(block).sum(axis=0)
+        else:
+            missing = np.zeros(width, dtype=np.int64)
+    valid = total_rows - missing
+
+    if rows == 0:
+        return [
+            _column_result(dtype, 0, 0, total_rows, dict(EMPTY_NUMERIC))
+            for _ in range(width)
+        ]
+
+    # NaNs sort to the end, so the first ``valid`` entries of each column
+    # are its non-missing values in ascending order.
+    with tracer.span("metric.sort", columns=width):
+        ordered = np.sort(block, axis=0)
+    cols = np.arange(width)
+
+    with tracer.span("metric.order_statistics", columns=width):
+        last = np.maximum(valid - 1, 0)
+        mins = ordered[0, cols]
+        maxs = ordered[last, cols]
+        lower = ordered[np.maximum((valid - 1) // 2, 0), cols].astype(np.float64)
+        upper = ordered[valid // 2, cols].astype(np.float64)
+        medians = (lower + upper) / 2
+
+    with tracer.span("metric.unique", columns=width):
+        if rows > 1:
+            changes = ordered[1:] != ordered[:-1]
+            changes &= np.arange(rows - 1)[:, None] < (valid - 1)[None, :]
+            unique = changes.sum(axis=0) + (valid > 0)
+        else:
+            unique = (valid > 0).astype(np.int64)
+
+    with tracer.span("metric.moments", columns=width):
+        means, stds = _moments(block)
+
+    results = []
+    for j in range(width):
+        if valid[j] == 0:
+            numeric = dict(EMPTY_NUMERIC)
+        else:
+            numeric = {
+                "mean": float(means[j]),
+                "std": float(stds[j]),
+                "min": float(mins[j]),
+                "max": float(maxs[j]),
+                "median": float(medians[j]),
+            }
+        results.append(
+            _column_result(dtype, int(missing[j]), int(unique[j]), total_rows, numeric)
+        )
+
+    return results
+
+
+def approximate_block_metrics(
+    block: np.ndarray,
+    total_rows: int,
+    dtype: str,
+    tracer: Any = NULL_TRACER,
+    sample: Optional[RowSample] = None,
+) -> List[Dict[str, Any]]:
+    rows, width = block.shape
+    is_float = block.dtype.kind == "f"
+    sampled = block[sample.positions] if sample is not None else None
+
+    with tracer.span("metric.moments", columns=width):
+        means, stds = _moments(block)
+
+    with tracer.span("metric.order_statistics", columns=width), warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        if rows:
+            mins = np.nanmin(block, axis=0)
+            maxs = np.nanmax(block, axis=0)
+
+    results = []
+    for j in range(width):
+        values = block[:, j]
+        if is_float:
+            values = values[~np.isnan(values)]
+        missing = total_rows - int(values.size)
+
+        if values.size == 0:
+            results.append(_column_result(dtype, missing, 0, total_rows, dict(EMPTY_NUMERIC)))
+            continue
+
+        with tracer.span("metric.unique", block_column=j):
+            distinct = HyperLogLog()
+            # Integer blocks hash as int64: float64 would merge ids above 2 ** 53.
+            distinct.update_hashes(pd.util.hash_array(numeric_keys(values)))
+
+        # Sampled rows replace the quantile sketch; it only runs when the
+        # sample holds no value of this column.
+        estimates = quantiles = None
+        if sampled is not None:
+            with tracer.span("metric.sample", block_column=j):
+                estimates = sample_estimates(sampled[:, j], sample.weights, int(values.size))
+        if estimates is None:
+            with tracer.span("metric.median", block_column=j):
+                quantiles = QuantileSketch()
+                quantiles.update(values)
+
+        numeric = {
+            "mean": float(means[j]),
+            "std": float(stds[j]),
+            "min": float(mins[j]),
+            "max": float(maxs[j]),
+            "median": quantiles.quantile(0.5) if quantiles is not None else None,
+        }
+        col_profile = _column_result(dtype, missing, distinct.count(), total_rows, numeric)
+        if estimates is not None:
+            apply_estimates(col_profile, estimates)
+
+        errors = approximation_errors(distinct, quantiles)
+        if errors:
+            col_profile["approximate"] = errors
+        results.append(col_profile)
+    return results
+
+
+def _moments(block: np.ndarray):
+    with warnings.catch_warnings(), np.errstate(invalid="ignore", divide="ignore"):
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        means = np.nanmean(block, axis=0, dtype=np.float64)
+        stds = np.sqrt(np.nanvar(block, axis=0, dtype=np.float64, ddof=1))
+    return means, stds
+
+
+def approximation_errors(
+    distinct: HyperLogLog,
+    quantiles: Optional[QuantileSketch],
+) -> Dict[str, float]:
+    """
+    Error bounds of the sketched metrics that are not exact: relative
+    standard error for ``unique`` and normalized rank error for ``median``.
+    """
+    errors: Dict[str, float] = {}
+    if not distinct.is_exact:
+        errors["unique"] = distinct.relative_error
+    if quantiles is not None and not quantiles.is_exact:
+        errors["median"] = quantiles.rank_error
+    return errors
+
+
+def _column_result(
+    dtype: str, missing: int, unique: int, total_rows: int, numeric: Dict[str, Any]
+) -> Dict[str, Any]:
+    col_profile = base_metrics(dtype, missing, unique, total_rows)
+    col_profile["numeric"] = numeric
+    return col_profile
+
@@ -0,0 +1,233 @@
+from __future__ import annotations
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import pandas as pd
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from sanitify.core.profiler import DataProfiler
+from sanitify.utils.io import file_format
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "sanitify"
+
+# JSON-native column labels; profiles with other labels are not cached.
+_LABEL_TYPES = (str, int, float, bool, type(None))
+
+
+def frame_fingerprint(df: pd.DataFrame) -> Optional[str]:
+    """
+    Content fingerprint of a DataFrame: schema plus vectorized hashes of
+    the index and every column. None when some values cannot be hashed.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(repr((
+        [repr(col) for col in df.columns],
+        [str(dtype) for dtype in df.dtypes],
+        df.shape,
+        type(df.index).__name__,
+    )).encode("utf-8"))
+
+    try:
+        digest.update(pd.util.hash_pandas_object(df.index).to_numpy().tobytes())
+        for pos in range(df.shape[1]):
+            hashes = pd.util.hash_pandas_object(df.iloc[:, pos], index=False)
+            digest.update(hashes.to_numpy().tobytes())
+    except TypeError:
+        return None
+
+    return digest.hexdigest()
+
+
+def file_fingerprint(path: str | Path) -> str:
+    """
+    Fingerprint of a file from its path, size and mtime, plus the row-group
+    layout for Parquet files when pyarrow is available.
+    """
+    stat = os.stat(path)
+    parts = [os.path.abspath(path), stat.st_size, stat.st_mtime_ns]
+
+    if file_format(path) == "parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            pq = None
+        if pq is not None:
+            meta = pq.ParquetFile(path).metadata
+            parts.append(str(meta.schema))
+            parts.extend(
+                (meta.row_group(i).num_rows, meta.row_group(i).total_byte_size)
+                for i in range(meta.num_row_groups)
+            )
+
+    return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=20).hexdigest()
+
+
+class ProfileCache:
+    """
+    Persistent profile store in a local SQLite database.
+
+    Entries are keyed by ``key(fingerprint, **options)``, which folds in
+    ``PROFILE_VERSION`` so profiles from older releases are never served.
+    Reads refresh an entry's access time; once ``max_entries`` or
+    ``max_bytes`` is exceeded the least recently used entries are evicted.
+    Profiles are stored as JSON, so nothing executable is ever loaded.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        max_entries: int = 1_000,
+        max_bytes: int = 256 * 2 ** 20,
+    ):
+        if path is None:
+            path = DEFAULT_CACHE_DIR / "profiles.sqlite"
+        self.path = Path(path).expanduser()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS profiles (
+                    key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created REAL NOT NULL,
+                    accessed REAL NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS profiles_accessed ON profiles (accessed)")
+
+    # ------------------------
+    # Public API
+    # ------------------------
+    @staticmethod
+    def key(fingerprint: str, **options: Any) -> str:
+        material = json.dumps(
+            {
+                "fingerprint": fingerprint,
+                "profile_version": DataProfiler.PROFILE_VERSION,
+                "options": options,
+            },
+            sort_keys=True,
+            default=repr,
+        )
+        return hashlib.blake2b(material.encode("utf-8"), digest_size=20).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT payload FROM profiles WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            conn.execute(
+                "UPDATE profiles SET accessed = ?, hits = hits + 1 WHERE key = ?",
+                (time.time(), key),
+            )
+
+        self._hits += 1
+        return _decode(row[0])
+
+    def put(self, key: str, profile: Dict[str, Any]) -> bool:
+        """
+        Store ``profile``; returns False when it cannot be serialized
+        (column labels that JSON cannot round-trip) or exceeds ``max_bytes``.
+        """
+        payload = _encode(profile)
+        if payload is None or len(payload) > self.max_bytes:
+            return False
+
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO profiles (key, payload, size, created, accessed, hits)
+                VALUES (?, ?, ?, ?, ?, 0)
+                """,
+                (key, payload, len(payload), now, now),
+            )
+            self._evict(conn)
+
+        self._writes += 1
+        return True
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM profiles")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss counters of this instance plus the current store size.
+        """
+        with self._connect() as conn:
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM profiles"
+            ).fetchone()
+
+        lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "writes": self._writes,
+            "evictions": self._evictions,
+            "entries": int(entries),
+            "bytes": int(size),
+        }
+
+    # ------------------------
+    # Internals
+    # ------------------------
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        entries, size = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM profiles"
+        ).fetchone()
+        if entries <= self.max_entries and size <= self.max_bytes:
+            return
+
+        rows = conn.execute("SELECT key, size FROM profiles ORDER BY accessed ASC, rowid ASC").fetchall()
+        for key, entry_size in rows:
+            if entries <= self.max_entries and size <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM profiles WHERE key = ?", (key,))
+            entries -= 1
+            size -= entry_size
+            self._evictions += 1
+
+
+def _encode(profile: Dict[str, Any]) -> Optional[str]:
+    # Column labels become a list of pairs so non-string labels survive.
+    columns = list(profile["columns"].items())
+    if not all(isinstance(col, _LABEL_TYPES) for col, _ in columns):
+        return None
+
+    body = dict(profile)
+    body["columns"] = [[col, meta] for col, meta in columns]
+    return json.dumps(body)
+
+
+def _decode(payload: str) -> Dict[str, Any]:
+    body = json.loads(payload)
+    body["columns"] = {col: meta for col, meta in body["columns"]}
+    return body
@@ -0,0 +1,358 @@
+from __future__ import annotations
+import os
+import shutil
+import tempfile
+import weakref
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Iterable, List, Optional
+
+from sanitify.core.sketches import HyperLogLog, normalize_for_hashing
+
+# Rows fingerprinted per pass over an in-memory frame; bounds the
+# temporary per-column hash arrays.
+FINGERPRINT_BATCH_ROWS = 1 << 20
+
+# Default budget for fingerprints held in memory (8M rows).
+DEFAULT_MEMORY_LIMIT = 64 * 2 ** 20
+
+# Number of spill partitions per level, selected by the top hash bits.
+PARTITION_BITS = 6
+
+_FINGERPRINT = np.dtype(np.uint64)
+
+
+def row_fingerprints(frame: pd.DataFrame) -> np.ndarray:
+    """
+    One 64-bit fingerprint per row, combining vectorized column hashes.
+
+    Numeric columns are normalized first so the same value hashes alike
+    across chunks with different inferred dtypes; integers keep their
+    native width, so large ids never round into each other.
+    """
+    normalized = pd.DataFrame(
+        {pos: normalize_for_hashing(frame.iloc[:, pos]) for pos in range(frame.shape[1])},
+        index=frame.index,
+        copy=False,
+    )
+    return pd.util.hash_pandas_object(normalized, index=False).to_numpy()
+
+
+def iter_fingerprints(
+    df: pd.DataFrame,
+    batch_rows: int = FINGERPRINT_BATCH_ROWS,
+) -> Iterable[np.ndarray]:
+    for start in range(0, len(df), batch_rows):
+        yield row_fingerprints(df.iloc[start:start + batch_rows])
+
+
+class DuplicateCounter:
+    """
+    Exact duplicate-row counter over 64-bit row fingerprints.
+
+    Duplicates are ``rows - distinct fingerprints``. Distinct fingerprints
+    are kept as one sorted array, consolidated with amortized doubling.
+    Once it outgrows ``memory_limit`` bytes everything is spilled to disk,
+    partitioned by the top hash bits, and each partition is deduplicated
+    on its own at ``count()`` (partitions larger than the budget are split
+    again). Counting is exact up to 64-bit hash collisions.
+
+    Counters over disjoint row sets can be merged.
+    """
+
+    def __init__(self, memory_limit: int = DEFAULT_MEMORY_LIMIT, spill_dir: Optional[str] = None):
+        self._limit = max(int(memory_limit) // _FINGERPRINT.itemsize, 1)
+        self._spill_root = spill_dir
+
+        self.rows = 0
+        self._seen = np.empty(0, dtype=_FINGERPRINT)
+        self._pending: List[np.ndarray] = []
+        self._pending_size = 0
+
+        self._spill_dir: Optional[str] = None
+        self._cleanup: Optional[weakref.finalize] = None
+
+    # ------------------------
+    # Public API
+    # ------------------------
+    @property
+    def spilled(self) -> bool:
+        return self._spill_dir is not None
+
+    def update(self, fingerprints: np.ndarray) -> "DuplicateCounter":
+        fingerprints = np.asarray(fingerprints, dtype=_FINGERPRINT)
+        self.rows += int(fingerprints.size)
+        self._add(fingerprints)
+        return self
+
+    def update_frame(self, df: pd.DataFrame) -> "DuplicateCounter":
+        for fingerprints in iter_fingerprints(df):
+            self.update(fingerprints)
+        return self
+
+    def merge(self, other: "DuplicateCounter") -> "DuplicateCounter":
+        self.rows += other.rows
+        for block in other._blocks():
+            self._add(block)
+        return self
+
+    def count(self) -> int:
+        return max(self.rows - self.distinct(), 0)
+
+    def distinct(self) -> int:
+        if not self.spilled:
+            self._consolidate()
+            return int(self._seen.size)
+
+        self._flush()
+        return self._distinct_in(self._spill_dir, 0)
+
+    def close(self) -> None:
+        """
+        Remove spill files now instead of when the counter is collected.
+        """
+        if self._cleanup is not None:
+            self._cleanup()
+
+    # ------------------------
+    # In-memory state
+    # ------------------------
+    def _add(self, fingerprints: np.ndarray) -> None:
+        if fingerprints.size == 0:
+            return
+        self._pending.append(fingerprints)
+        self._pending_size += int(fingerprints.size)
+
+        if self.spilled:
+            if self._pending_size >= self._limit // 2:
+                self._flush()
+        elif self._pending_size >= max(self._seen.size, min(self._limit, 1 << 16)):
+            self._consolidate()
+            if self._seen.size > self._limit:
+                self._spill()
+
+    def _consolidate(self) -> None:
+        if self._pending:
+            self._seen = _sorted_unique(np.concatenate([self._seen, *self._pending]))
+            self._pending = []
+            self._pending_size = 0
+
+    def _blocks(self) -> Iterable[np.ndarray]:
+        if self.spilled:
+            self._flush()
+            for name in sorted(os.listdir(self._spill_dir)):
+                yield from _read_blocks(os.path.join(self._spill_dir, name), self._limit)
+        else:
+            self._consolidate()
+            yield self._seen
+
+    # ------------------------
+    # Spilling
+    # ------------------------
+    def _spill(self) -> None:
+        self._spill_dir = tempfile.mkdtemp(prefix="sanitify-dup-", dir=self._spill_root)
+        self._cleanup = weakref.finalize(self, shutil.rmtree, self._spill_dir, True)
+
+        _write_partitions(self._seen, self._spill_dir, 0)
+        self._seen = np.empty(0, dtype=_FINGERPRINT)
+
+    def _flush(self) -> None:
+        if self._pending:
+            block = _sorted_unique(np.concatenate(self._pending))
+            self._pending = []
+            self._pending_size = 0
+            _write_partitions(block, self._spill_dir, 0)
+
+    def _distinct_in(self, path: str, shift: int) -> int:
+        """
+        Distinct fingerprints under ``path``, a partition file or a
+        directory of partitions keyed by the hash bits from ``shift`` on.
+        """
+        if os.path.isdir(path):
+            return sum(
+                self._distinct_in(os.path.join(path, name), shift + PARTITION_BITS)
+                for name in sorted(os.listdir(path))
+            )
+
+        size = os.path.getsize(path) // _FINGERPRINT.itemsize
+        if size <= self._limit or shift >= 64:
+            return int(_sorted_unique(np.fromfile(path, dtype=_FINGERPRINT)).size)
+
+        # Too large for the budget: count it through a temporary directory
+        # of sub-partitions on the next hash bits.
+        split_dir = tempfile.mkdtemp(dir=os.path.dirname(path))
+        try:
+            for block in _read_blocks(path, self._limit):
+                _write_partitions(_sorted_unique(block), split_dir, shift)
+            return self._distinct_in(split_dir, shift)
+        finally:
+            shutil.rmtree(split_dir, ignore_errors=True)
+
+
+class FingerprintSet:
+    """
+    Set of 64-bit row fingerprints that reports, batch by batch, which rows
+    are seen for the first time; ``drop_duplicates`` over a stream.
+
+    Fingerprints live in sorted in-memory runs, merged as they grow, up to
+    ``memory_limit`` bytes. Then the runs are merged into one sorted file
+    in a temporary directory and searched through a read-only memory map,
+    so the process keeps at most ``memory_limit`` bytes of fingerprints
+    however many distinct rows pass through.
+    """
+
+    def __init__(self, memory_limit: int = DEFAULT_MEMORY_LIMIT, spill_dir: Optional[str] = None):
+        self._limit = max(int(memory_limit) // _FINGERPRINT.itemsize, 1)
+        self._spill_root = spill_dir
+        self._runs: List[np.ndarray] = []
+        self._files: List[np.ndarray] = []
+        self._size = 0
+        self._in_memory = 0
+
+        self._spill_dir: Optional[str] = None
+        self._cleanup: Optional[weakref.finalize] = None
+
+    @property
+    def spilled(self) -> bool:
+        return self._spill_dir is not None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, fingerprints: np.ndarray) -> np.ndarray:
+        """
+        Insert ``fingerprints``; True marks the first occurrence of each
+        fingerprint not already in the set.
+        """
+        fingerprints = np.asarray(fingerprints, dtype=_FINGERPRINT)
+        unique, first = np.unique(fingerprints, return_index=True)
+
+        fresh = np.ones(unique.size, dtype=bool)
+        for run in (*self._files, *self._runs):
+            positions = np.minimum(np.searchsorted(run, unique), run.size - 1)
+            fresh &= run[positions] != unique
+
+        mask = np.zeros(fingerprints.size, dtype=bool)
+        mask[first[fresh]] = True
+        self._insert(unique[fresh])
+        return mask
+
+    def close(self) -> None:
+        """
+        Remove spill files now instead of when the set is collected.
+        """
+        self._files = []
+        if self._cleanup is not None:
+            self._cleanup()
+
+    def _insert(self, fresh: np.ndarray) -> None:
+        if fresh.size == 0:
+            return
+        self._size += int(fresh.size)
+        self._in_memory += int(fresh.size)
+
+        # Runs are disjoint; merge neighbours of similar size so lookups
+        # touch O(log n) runs.
+        self._runs.append(fresh)
+        while len(self._runs) > 1 and self._runs[-2].size <= 2 * self._runs[-1].size:
+            last = self._runs.pop()
+            self._runs[-1] = np.sort(np.concatenate([self._runs[-1], last]))
+        if self._in_memory > self._limit:
+            self._spill()
+
+    def _spill(self) -> None:
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="sanitify-dedup-", dir=self._spill_root)
+            self._cleanup = weakref.finalize(self, shutil.rmtree, self._spill_dir, True)
+
+        path = os.path.join(self._spill_dir, f"run-{len(self._files):06d}.bin")
+        np.sort(np.concatenate(self._runs)).tofile(path)
+        self._files.append(np.memmap(path, dtype=_FINGERPRINT, mode="r"))
+        self._runs = []
+        self._in_memory = 0
+
+
+def count_duplicates(
+    df: pd.DataFrame,
+    approximate: bool = False,
+    memory_limit: int = DEFAULT_MEMORY_LIMIT,
+) -> Dict[str, Any]:
+    """
+    Duplicate rows of ``df`` plus how they were counted.
+
+    Exact mode runs a ``DuplicateCounter``; ``approximate=True`` sketches
+    the distinct fingerprints with HyperLogLog, and ``error_bound`` is then
+    the standard error of the duplicate rate (None while still exact).
+    """
+    rows = len(df)
+
+    if not approximate:
+        counter = DuplicateCounter(memory_limit=memory_limit)
+        try:
+            counter.update_frame(df)
+            return {
+                "count": counter.count(),
+                "detection": detection_info("fingerprint", True, None, counter.spilled),
+            }
+        finally:
+            counter.close()
+
+    distinct = HyperLogLog()
+    for fingerprints in iter_fingerprints(df):
+        distinct.update_hashes(fingerprints)
+
+    estimate = distinct.count()
+    error = None
+    if not distinct.is_exact and rows:
+        error = float(distinct.relative_error * estimate / rows)
+    return {
+        "count": max(rows - estimate, 0),
+        "detection": detection_info("hyperloglog", distinct.is_exact, error, False),
+    }
+
+
+def detection_info(method: str, exact: bool, error_bound: Optional[float], spilled: bool) -> Dict[str, Any]:
+    return {
+        "method": method,
+        "exact": bool(exact),
+        "error_bound": error_bound,
+        "spilled": bool(spilled),
+    }
+
+
+def _write_partitions(block: np.ndarray, directory: str, shift: int) -> None:
+    if block.size == 0:
+        return
+    # Partition on the PARTITION_BITS hash bits following the top ``shift``.
+    keys = (block << np.uint64(shift)) >> np.uint64(64 - PARTITION_BITS)
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    block = block[order]
+
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    stops = np.r_[starts[1:], keys.size]
+    for start, stop in zip(starts, stops):
+        path = os.path.join(directory, f"{int(keys[start]):03d}.bin")
+        with open(path, "ab") as f:
+            block[start:stop].tofile(f)
+
+
+def _sorted_unique(values: np.ndarray) -> np.ndarray:
+    # Sort-and-mask; much faster than ``np.unique`` on large uint64 arrays
+    # with NumPy 2's hash-based implementation.
+    ordered = np.sort(values)
+    if ordered.size < 2:
+        return ordered
+    keep = np.empty(ordered.size, dtype=bool)
+    keep[0] = True
+    np.not_equal(ordered[1:], ordered[:-1], out=keep[1:])
+    return ordered[keep]
+
+
+def _read_blocks(path: str, size: int) -> Iterable[np.ndarray]:
+    with open(path, "rb") as f:
+        while True:
+            block = np.fromfile(f, dtype=_FINGERPRINT, count=size)
+            if block.size == 0:
+                return
+            yield block
@@ -0,0 +1,422 @@
+from __future__ import annotations
+import warnings
+import numpy as np
+import pandas as pd
+from collections.abc import Mapping
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set
+
+from sanitify.core.batch import EMPTY_NUMERIC, is_batchable, to_block
+from sanitify.core.parallel import profile_columns_parallel
+from sanitify.core.temporal import is_temporal, temporal_profile
+from sanitify.utils.tracing import NULL_TRACER
+
+# Metrics that can be selected with ``metrics=``. Column metrics land in
+# each column profile (numeric ones under ``"numeric"``); ``memory_bytes``
+# and ``duplicates`` are dataset-wide and always cover every column.
+BASE_METRICS = ("missing", "missing_pct", "unique", "is_constant", "top_values", "temporal")
+NUMERIC_METRICS = ("mean", "std", "min", "max", "median")
+DATASET_METRICS = ("memory_bytes", "duplicates")
+PROFILE_METRICS = BASE_METRICS + NUMERIC_METRICS + DATASET_METRICS
+
+# Column metrics only the full batched pass produces (a sort, a hash table
+# or a sketch per column); the others come from single reductions.
+# ``top_values`` exists for non-numeric columns only, ``temporal`` for
+# datetime and timedelta columns.
+SORTED_METRICS = frozenset({"unique", "is_constant", "top_values", "median"})
+
+# ProfileTable names that every profile carries.
+_ALWAYS = frozenset({"dtype", "is_numeric", "rows"})
+
+# Key order of a full column profile.
+_KEY_ORDER = {key: pos for pos, key in enumerate(("dtype",) + BASE_METRICS + ("numeric", "approximate", "sampled"))}
+
+
+def resolve_metrics(metrics: Optional[Iterable[str]]) -> Optional[FrozenSet[str]]:
+    """
+    Validate a ``metrics=`` selection. None (or every metric) means all.
+    """
+    if metrics is None:
+        return None
+    if isinstance(metrics, str):
+        metrics = (metrics,)
+    selected = frozenset(metrics)
+    unknown = selected.difference(PROFILE_METRICS)
+    if unknown:
+        raise ValueError(f"Unknown profile metrics: {sorted(unknown)}; expected some of {PROFILE_METRICS}")
+    return None if selected == frozenset(PROFILE_METRICS) else selected
+
+
+def metrics_for(requires: Optional[Iterable[str]]) -> Optional[FrozenSet[str]]:
+    """
+    Profile metrics behind ``ProfileTable`` metric names (as rules list
+    them in ``requires``), or None when one is not a profile metric.
+    """
+    if requires is None:
+        return None
+    needed = set()
+    for name in requires:
+        if name in _ALWAYS:
+            continue
+        name = name[:-len("_error")] if name.endswith("_error") else name
+        if name not in PROFILE_METRICS:
+            return None
+        needed.add(name)
+    return frozenset(needed)
+
+
+def profile_selected(
+    df: pd.DataFrame,
+    total_rows: int,
+    metrics: FrozenSet[str],
+    approximate: bool = False,
+    n_jobs: Optional[int] = None,
+    executor: Any = None,
+    tracer: Any = NULL_TRACER,
+    sample: Any = None,
+) -> Dict[Any, Dict[str, Any]]:
+    """
+    Column profiles of ``df`` holding only ``metrics`` (plus ``dtype``).
+
+    Columns that need a sorted metric (``unique``, ``is_constant``,
+    ``top_values``, ``median``, or a sampled ``std``) go through the full batched engine
+    and are trimmed. The rest cost one ``isna`` pass and, for numeric
+    columns, one block of NumPy reductions (``temporal`` reads int64
+    ticks); values are identical to the full profile's.
+    """
+    metrics = frozenset(metrics).difference(DATASET_METRICS)
+    sorted_metrics = SORTED_METRICS | ({"std"} if sample is not None else set())
+    numeric = metrics.intersection(NUMERIC_METRICS)
+
+    if metrics & sorted_metrics:
+        full = profile_columns_parallel(
+            df, total_rows, approximate=approximate, n_jobs=n_jobs,
+            executor=executor, tracer=tracer, sample=sample,
+        )
+        return {col: trim_column(meta, metrics) for col, meta in full.items()}
+
+    profiles: Dict[Any, Dict[str, Any]] = {
+        col: {"dtype": str(dtype)} for col, dtype in df.dtypes.items()
+    }
+    if not metrics:
+        return profiles
+
+    with tracer.span("metric.missing", columns=df.shape[1]):
+        missing = df.isna().sum(axis=0).to_numpy()
+    for (col, meta), count in zip(profiles.items(), missing):
+        if "missing" in metrics:
+            meta["missing"] = int(count)
+        if "missing_pct" in metrics:
+            meta["missing_pct"] = float(count / total_rows) if total_rows > 0 else 0.0
+
+    if "temporal" in metrics:
+        for col, meta in profiles.items():
+            if is_temporal(df[col].dtype):
+                with tracer.span("metric.temporal", column=str(col)):
+                    meta["temporal"], error = temporal_profile(df[col], approximate)
+                if error is not None:
+                    meta["approximate"] = {"temporal": error}
+
+    if numeric:
+        groups: Dict[str, List[int]] = {}
+        for pos, dtype in enumerate(df.dtypes):
+            if is_batchable(dtype):
+                groups.setdefault(str(dtype), []).append(pos)
+            elif missing[pos] == total_rows:
+                profiles[df.columns[pos]]["numeric"] = _numeric({}, numeric)
+        for positions in groups.values():
+            frame = df.iloc[:, positions]
+            with tracer.span("metric.moments", columns=len(positions)):
+                values = _reductions(to_block(frame), numeric)
+            for j, pos in enumerate(positions):
+                present = missing[pos] < total_rows
+                profiles[df.columns[pos]]["numeric"] = _numeric(
+                    {name: float(column[j]) for name, column in values.items()} if present else {},
+                    numeric,
+                )
+    return profiles
+
+
+def trim_column(meta: Dict[str, Any], metrics: FrozenSet[str]) -> Dict[str, Any]:
+    """
+    Keep only ``metrics`` of one column profile, with their error bounds
+    and sampling intervals.
+    """
+    trimmed: Dict[str, Any] = {"dtype": meta["dtype"]}
+    for name in BASE_METRICS:
+        if name in metrics and name in meta:
+            trimmed[name] = meta[name]
+    numeric = metrics.intersection(NUMERIC_METRICS)
+    if numeric and meta.get("numeric") is not None:
+        trimmed["numeric"] = {name: meta["numeric"].get(name) for name in NUMERIC_METRICS if name in numeric}
+    errors = {name: bound for name, bound in (meta.get("approximate") or {}).items() if name in metrics}
+    if errors:
+        trimmed["approximate"] = errors
+    sampled = meta.get("sampled")
+    if sampled and metrics & {"median", "std"}:
+        trimmed["sampled"] = {
+            key: value for key, value in sampled.items()
+            if key not in ("median", "std") or key in metrics
+        }
+    return trimmed
+
+
+def select_profile(
+    profile: Dict[str, Any],
+    columns: Optional[Iterable[Any]] = None,
+    metrics: Optional[FrozenSet[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Restrict a full profile to ``columns`` and ``metrics``, in the layout
+    a selective ``DataProfiler`` produces.
+    """
+    if columns is None and metrics is None:
+        return profile
+    if columns is not None:
+        missing = [col for col in columns if col not in profile["columns"]]
+        if missing:
+            raise KeyError(f"Columns not in profile: {missing}")
+    selected = list(profile["columns"]) if columns is None else list(columns)
+    every = frozenset(PROFILE_METRICS) if metrics is None else metrics
+
+    dataset = dict(profile["dataset"])
+    if "memory_bytes" not in every:
+        for key in ("memory_bytes", "memory_mode", "memory_error_bytes"):
+            dataset.pop(key, None)
+    duplicates = "duplicates" in every
+    return {
+        "profile_version": profile["profile_version"],
+        "dataset": dataset,
+        "columns": {col: trim_column(profile["columns"][col], every) for col in selected},
+        "duplicates": profile.get("duplicates") if duplicates else None,
+        "duplicate_detection": profile.get("duplicate_detection") if duplicates else None,
+        "selection": selection(columns, metrics),
+    }
+
+
+def selection(columns: Optional[Iterable[Any]], metrics: Optional[FrozenSet[str]]) -> Dict[str, Any]:
+    return {
+        "columns": None if columns is None else list(columns),
+        "metrics": [name for name in PROFILE_METRICS if metrics is None or name in metrics],
+    }
+
+
+class LazyProfile(Mapping):
+    """
+    Profile whose metrics are computed on first access and memoized.
+
+    Returned by ``DataProfiler.lazy()``. It reads like the dict from
+    ``run()``: ``profile["columns"]["age"]["missing_pct"]`` computes the
+    missing count of ``age`` alone, ``profile["duplicates"]`` counts
+    duplicate rows, and ``profile["dataset"]["memory_bytes"]`` measures
+    memory, each once. Only the metrics and columns selected on the
+    profiler are available.
+
+    Single accesses compute one column at a time; ``require(metrics,
+    columns)`` computes many in one batched pass, and ``to_dict()``
+    materializes the plain profile.
+    """
+
+    def __init__(self, profiler: Any):
+        self._profiler = profiler
+        self._metrics = frozenset(PROFILE_METRICS) if profiler.metrics is None else profiler.metrics
+        self._column_metrics = self._metrics.difference(DATASET_METRICS)
+        self._frame = profiler._original_df
+        self._names = list(self._frame.columns) if profiler.columns is None else list(profiler.columns)
+        self._metas: Dict[Any, Dict[str, Any]] = {}
+        self.computed: Dict[Any, Set[str]] = {col: set() for col in self._names}
+        self._dataset = _LazyDict(self._dataset_keys(), self._load_dataset)
+        self._columns = _LazyDict(self._names, lambda col: {col: _LazyColumn(self, col)})
+        self._duplicates: Optional[Dict[str, Any]] = None
+
+    # ------------------------
+    # Mapping
+    # ------------------------
+    def __getitem__(self, key: str) -> Any:
+        if key == "profile_version":
+            return self._profiler.PROFILE_VERSION
+        if key == "dataset":
+            return self._dataset
+        if key == "columns":
+            return self._columns
+        if key in ("duplicates", "duplicate_detection"):
+            if "duplicates" not in self._metrics:
+                return None
+            if self._duplicates is None:
+                with self._profiler._tracer.span("profile.duplicates"):
+                    self._duplicates = self._profiler._duplicates()
+            return self._duplicates["count" if key == "duplicates" else "detection"]
+        if key == "selection" and self._is_selective:
+            return selection(self._profiler.columns, self._profiler.metrics)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        keys = ["profile_version", "dataset", "columns", "duplicates", "duplicate_detection"]
+        return iter(keys + (["selection"] if self._is_selective else []))
+
+    def __len__(self) -> int:
+        return 5 + self._is_selective
+
+    # ------------------------
+    # Public API
+    # ------------------------
+    def require(
+        self,
+        metrics: Optional[Iterable[str]] = None,
+        columns: Optional[Iterable[Any]] = None,
+    ) -> "LazyProfile":
+        """
+        Compute ``metrics`` (default: all selected) for ``columns``
+        (default: all selected) in one batched pass, skipping memoized ones.
+        """
+        wanted = self._column_metrics if metrics is None else frozenset(metrics) & self._column_metrics
+        names = self._names if columns is None else list(columns)
+        pending = [col for col in names if not wanted <= self.computed[col]]
+        if not pending or not wanted:
+            return self
+
+        todo = frozenset().union(*(wanted - self.computed[col] for col in pending))
+        with self._profiler._tracer.span("profile.columns", columns=len(pending)):
+            profiles = self._profiler._profile_selected(pending, todo)
+        for col, meta in profiles.items():
+            _merge(self._metas.setdefault(col, {}), meta)
+            self.computed[col] |= todo
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Compute every selected metric and return the plain profile dict.
+        """
+        self.require()
+        profile = {
+            "profile_version": self["profile_version"],
+            "dataset": dict(self._dataset),
+            "columns": {col: self.column(col) for col in self._names},
+            "duplicates": self["duplicates"],
+            "duplicate_detection": self["duplicate_detection"],
+        }
+        if self._is_selective:
+            profile["selection"] = self["selection"]
+        return profile
+
+    def column(self, col: Any) -> Dict[str, Any]:
+        """
+        Plain profile of ``col`` with every selected metric.
+        """
+        self.require(columns=[col])
+        meta = self._metas.get(col) or {"dtype": str(self._frame[col].dtype)}
+        return dict(sorted(meta.items(), key=lambda item: _KEY_ORDER.get(item[0], len(_KEY_ORDER))))
+
+    # ------------------------
+    # Helpers
+    # ------------------------
+    @property
+    def _is_selective(self) -> bool:
+        return self._profiler.columns is not None or self._profiler.metrics is not None
+
+    def _dataset_keys(self) -> List[str]:
+        keys = ["rows", "columns"]
+        if "memory_bytes" in self._metrics:
+            keys += ["memory_bytes", "memory_mode", "memory_error_bytes"]
+        return keys + ["sampled", "sample_size", "sampling"]
+
+    def _load_dataset(self, key: str) -> Dict[str, Any]:
+        with self._profiler._tracer.span("profile.dataset"):
+            return self._profiler._dataset_summary(memory=key.startswith("memory_"))
+
+    def _metric(self, col: Any, metric: str) -> Dict[str, Any]:
+        self.require(_COMPUTED_WITH.get(metric, {metric}), [col])
+        return self._metas[col]
+
+
+class _LazyColumn(Mapping):
+    # One column of a ``LazyProfile``; numeric metrics are computed together.
+    def __init__(self, profile: LazyProfile, col: Any):
+        self._profile = profile
+        self._col = col
+
+    def __getitem__(self, key: str) -> Any:
+        profile = self._profile
+        if key == "dtype":
+            return str(profile._frame[self._col].dtype)
+        if key in BASE_METRICS and key in profile._column_metrics:
+            return profile._metric(self._col, key)[key]
+        if key == "numeric":
+            numeric = profile._column_metrics.intersection(NUMERIC_METRICS)
+            if numeric:
+                profile.require(numeric, [self._col])
+                value = profile._metas[self._col].get("numeric")
+                if value is not None:
+                    return value
+        if key in ("approximate", "sampled"):
+            meta = profile.column(self._col)
+            if key in meta:
+                return meta[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._profile.column(self._col))
+
+    def __len__(self) -> int:
+        return len(self._profile.column(self._col))
+
+
+class _LazyDict(Mapping):
+    # Mapping over known keys whose values ``load(key)`` computes on first
+    # access; it returns a dict that may fill several keys at once.
+    def __init__(self, keys: Iterable[Any], load: Any):
+        self._keys = list(keys)
+        self._known = set(self._keys)
+        self._load = load
+        self._values: Dict[Any, Any] = {}
+
+    def __getitem__(self, key: Any) -> Any:
+        if key not in self._values:
+            if key not in self._known:
+                raise KeyError(key)
+            self._values.update(self._load(key))
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+# Metrics that come out of the same computation.
+_COMPUTED_WITH = {
+    "missing": {"missing", "missing_pct"},
+    "missing_pct": {"missing", "missing_pct"},
+    "unique": {"unique", "is_constant", "top_values"},
+    "is_constant": {"unique", "is_constant", "top_values"},
+    "top_values": {"unique", "is_constant", "top_values"},
+}
+
+
+def _reductions(block: np.ndarray, numeric: FrozenSet[str]) -> Dict[str, np.ndarray]:
+    # The same reductions as the batched engine, so values match bit for bit.
+    values: Dict[str, np.ndarray] = {}
+    with warnings.catch_warnings(), np.errstate(invalid="ignore", divide="ignore"):
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        if "mean" in numeric or "std" in numeric:
+            values["mean"] = np.nanmean(block, axis=0, dtype=np.float64)
+            values["std"] = np.sqrt(np.nanvar(block, axis=0, dtype=np.float64, ddof=1))
+        if len(block) and ("min" in numeric or "max" in numeric):
+            floating = block.dtype.kind == "f"
+            values["min"] = np.nanmin(block, axis=0) if floating else block.min(axis=0)
+            values["max"] = np.nanmax(block, axis=0) if floating else block.max(axis=0)
+    return values
+
+
+def _numeric(values: Dict[str, float], numeric: FrozenSet[str]) -> Dict[str, Any]:
+    return {name: values.get(name, EMPTY_NUMERIC[name]) for name in NUMERIC_METRICS if name in numeric}
+
+
+def _merge(meta: Dict[str, Any], update: Dict[str, Any]) -> None:
+    for key, value in update.items():
+        if key in ("numeric", "approximate", "sampled") and isinstance(meta.get(key), dict) and value is not None:
+            meta[key].update(value)
+        elif isinstance(value, dict):
+            meta[key] = dict(value)
+        else:
+            meta[key] = value
@@ -0,0 +1,116 @@
+from __future__ import annotations
+import math
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Tuple
+
+MEMORY_MODES = ("exact", "sampled", "shallow")
+
+# Rows sized per object column in "sampled" mode, spread over contiguous
+# row strata so that layout drift along the frame is represented.
+MEMORY_SAMPLE_ROWS = 10_000
+MEMORY_STRATA = 16
+
+# Two-sided 95% normal quantile for the reported error.
+_Z_95 = 1.96
+
+
+def check_memory_mode(mode: str) -> str:
+    if mode not in MEMORY_MODES:
+        raise ValueError(f"memory_mode must be one of {MEMORY_MODES}, got {mode!r}")
+    return mode
+
+
+def estimate_memory(
+    df: pd.DataFrame,
+    mode: str = "exact",
+    index: bool = True,
+    sample_rows: int = MEMORY_SAMPLE_ROWS,
+    seed: int = 42,
+) -> Dict[str, Any]:
+    """
+    Memory footprint of ``df`` under one of ``MEMORY_MODES``.
+
+    - ``exact``: ``memory_usage(deep=True)``, which calls ``__sizeof__`` on
+      every Python object in object and python-backed string columns.
+    - ``sampled``: fixed-width and Arrow-backed columns are measured
+      exactly; object columns are sized from a stratified random sample of
+      ``sample_rows`` values and extrapolated per stratum.
+      ``memory_error_bytes`` is the 95% confidence half-width.
+    - ``shallow``: array buffers only (``deep=False``); Python objects are
+      counted as pointers, so this is a lower bound with no error estimate.
+    """
+    check_memory_mode(mode)
+
+    if mode == "exact":
+        total, error = float(df.memory_usage(deep=True, index=index).sum()), 0.0
+    elif mode == "shallow":
+        total, error = float(df.memory_usage(deep=False, index=index).sum()), None
+    else:
+        rng = np.random.default_rng(seed)
+        parts = [df.iloc[:, pos] for pos in range(df.shape[1])]
+        if index:
+            parts.append(df.index)
+
+        total, variance = 0.0, 0.0
+        for values in parts:
+            part_bytes, part_variance = _sampled_bytes(values, sample_rows, rng)
+            total += part_bytes
+            variance += part_variance
+        error = _Z_95 * math.sqrt(variance)
+
+    return {
+        "memory_bytes": int(round(total)),
+        "memory_mode": mode,
+        "memory_error_bytes": error,
+    }
+
+
+def holds_objects(dtype: Any) -> bool:
+    """
+    True for dtypes whose deep memory walks Python objects.
+    """
+    if isinstance(dtype, pd.StringDtype):
+        return dtype.storage == "python"
+    return dtype == object
+
+
+def _memory_usage(values: Any, deep: bool) -> int:
+    if isinstance(values, pd.Index):
+        return int(values.memory_usage(deep=deep))
+    return int(values.memory_usage(deep=deep, index=False))
+
+
+def _sampled_bytes(values: Any, sample_rows: int, rng: np.random.Generator) -> Tuple[float, float]:
+    """
+    Estimated deep bytes of one column or index and the variance of the
+    estimate.
+    """
+    if not holds_objects(values.dtype):
+        return float(_memory_usage(values, deep=True)), 0.0
+
+    # Pointer array, exact; only the referenced objects are estimated.
+    pointers = float(_memory_usage(values, deep=False))
+    objects = np.asarray(values, dtype=object)
+    rows = objects.size
+    if rows <= sample_rows:
+        return pointers + float(sum(value.__sizeof__() for value in objects)), 0.0
+
+    total, variance = 0.0, 0.0
+    bounds = np.linspace(0, rows, MEMORY_STRATA + 1).astype(np.int64)
+    per_stratum = max(sample_rows // MEMORY_STRATA, 2)
+
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        size = int(stop - start)
+        if size == 0:
+            continue
+        take = min(per_stratum, size)
+        positions = start + rng.choice(size, size=take, replace=False)
+        sizes = np.fromiter((objects[pos].__sizeof__() for pos in positions), dtype=np.float64, count=take)
+
+        total += size * float(sizes.mean())
+        if take < size:
+            # Stratified estimator variance with finite population correction.
+            variance += size ** 2 * float(sizes.var(ddof=1)) / take * (1 - take / size)
+
+    return pointers + total, variance
@@ -0,0 +1,260 @@
+from __future__ import annotations
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional
+
+from sanitify.core.temporal import detect_datetime
+
+# Operations proposed by ``memory_suggestions``.
+MEMORY_OPERATIONS = ("downcast", "to_datetime", "to_category", "to_arrow_string", "to_sparse")
+
+# Object columns whose distinct share of non-missing values is at most this
+# become categoricals; other string columns become Arrow strings.
+CATEGORY_MAX_RATIO = 0.5
+
+# Numeric columns at least this share missing become sparse.
+SPARSE_MIN_MISSING = 0.9
+
+# Values sampled per object column to size its strings.
+STRING_SAMPLE = 1_000
+
+_SIGNED = ("int8", "int16", "int32", "int64")
+_UNSIGNED = ("uint8", "uint16", "uint32", "uint64")
+_FLOAT32_MAX = float(np.finfo(np.float32).max)
+_NONE_BYTES = None.__sizeof__()
+
+
+def memory_suggestions(
+    profile: Dict[str, Any],
+    df: Optional[pd.DataFrame] = None,
+    min_savings_bytes: int = 0,
+    skip: Any = (),
+    seed: int = 42,
+    detect_dates: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Memory-optimizing fixes for the columns of ``profile``, largest
+    projected saving first.
+
+    - ``downcast``: int columns to the narrowest width holding the profiled
+      min/max (signedness kept); float64 to float32 when sampled values of
+      ``df`` convert exactly. Applying the fix verifies the cast round-trips
+      on every value and leaves the column otherwise.
+    - ``to_datetime``: string columns whose sampled values all parse as
+      dates (``detect_dates``), with the guessed ``format``. Applying the
+      fix keeps the column unless every value parses.
+    - ``to_category``: low-cardinality string columns, and other object
+      string columns when pyarrow is not installed.
+    - ``to_arrow_string``: other all-string object columns, proposed only
+      when pyarrow imports.
+    - ``to_sparse``: numeric columns that are mostly missing.
+
+    Numeric projections use the profile alone. String columns are sized
+    from a sample of ``STRING_SAMPLE`` values of ``df``; they and float
+    downcasts are skipped without it. Each suggestion carries
+    ``current_bytes`` and ``projected_savings_bytes``; those below
+    ``min_savings_bytes`` and columns in ``skip`` are left out.
+    """
+    rows = int(profile["dataset"]["rows"])
+    if rows == 0:
+        return []
+
+    rng = np.random.default_rng(seed)
+    suggestions: List[Dict[str, Any]] = []
+    for column, meta in profile["columns"].items():
+        if column in skip:
+            continue
+        try:
+            dtype = pd.api.types.pandas_dtype(meta["dtype"])
+        except TypeError:
+            continue
+
+        series = df[column] if df is not None and column in df.columns else None
+        numeric = meta.get("numeric")
+        if numeric is not None and dtype.kind in "iuf":
+            found = _numeric_fixes(column, meta, numeric, dtype, rows, series, rng)
+        elif series is not None and _is_string(dtype):
+            found = _string_fixes(column, meta, series, rows, rng, detect_dates)
+        else:
+            found = []
+        suggestions.extend(s for s in found if s["projected_savings_bytes"] >= max(min_savings_bytes, 1))
+
+    suggestions.sort(key=lambda s: -s["projected_savings_bytes"])
+    return suggestions
+
+
+def downcast_dtype(dtype: Any, minimum: float, maximum: float) -> Optional[str]:
+    """
+    Narrowest dtype of the same kind holding ``[minimum, maximum]``, or
+    None when ``dtype`` is already the narrowest.
+    """
+    dtype = pd.api.types.pandas_dtype(dtype)
+    nullable = isinstance(dtype, pd.api.extensions.ExtensionDtype)
+    numpy_dtype = np.dtype(dtype.numpy_dtype if nullable else dtype)
+
+    if numpy_dtype.kind == "f":
+        if numpy_dtype.itemsize > 4 and max(abs(minimum), abs(maximum)) <= _FLOAT32_MAX:
+            return "Float32" if nullable else "float32"
+        return None
+
+    for name in (_SIGNED if numpy_dtype.kind == "i" else _UNSIGNED):
+        candidate = np.dtype(name)
+        if candidate.itemsize >= numpy_dtype.itemsize:
+            return None
+        info = np.iinfo(candidate)
+        if info.min <= minimum and maximum <= info.max:
+            return name.capitalize().replace("Uint", "UInt") if nullable else name
+    return None
+
+
+def _numeric_fixes(
+    column: Any,
+    meta: Dict[str, Any],
+    numeric: Dict[str, Any],
+    dtype: Any,
+    rows: int,
+    series: Optional[pd.Series],
+    rng: np.random.Generator,
+) -> List[Dict[str, Any]]:
+    nullable = isinstance(dtype, pd.api.extensions.ExtensionDtype)
+    itemsize = np.dtype(dtype.numpy_dtype if nullable else dtype).itemsize
+    # Nullable arrays keep a one-byte mask per row.
+    current = rows * (itemsize + nullable)
+    fixes = []
+
+    missing_pct = float(meta.get("missing_pct", 0.0))
+    if dtype.kind == "f" and not nullable and missing_pct >= SPARSE_MIN_MISSING:
+        # Sparse arrays store the present values and an int32 index each.
+        projected = (rows - int(meta.get("missing", 0))) * (itemsize + 4)
+        fixes.append(_suggestion(
+            column, "to_sparse", {}, 0.8, current, projected,
+            f"Column is {missing_pct:.0%} missing; sparse storage keeps only present values",
+        ))
+        return fixes
+
+    minimum, maximum = numeric.get("min"), numeric.get("max")
+    if minimum is None or maximum is None:
+        return fixes
+    target = downcast_dtype(dtype, float(minimum), float(maximum))
+    if target is None:
+        return fixes
+    if dtype.kind == "f" and (series is None or not _float32_exact(series, rng)):
+        return fixes
+
+    integer = dtype.kind in "iu"
+    fixes.append(_suggestion(
+        column, "downcast", {"dtype": target}, 0.95 if integer else 0.8,
+        current, rows * (np.dtype(target.lower()).itemsize + nullable),
+        f"Values fit in {target}" + ("" if integer else " exactly in a sample"),
+    ))
+    return fixes
+
+
+def _string_fixes(
+    column: Any,
+    meta: Dict[str, Any],
+    series: pd.Series,
+    rows: int,
+    rng: np.random.Generator,
+    detect_dates: bool = True,
+) -> List[Dict[str, Any]]:
+    present = rows - int(meta.get("missing", 0))
+    unique = int(meta.get("unique", 0))
+    if present == 0:
+        return []
+
+    sample = _sample_present(series, rng)
+    if not all(isinstance(value, str) for value in sample):
+        return []
+    object_bytes = float(np.mean([value.__sizeof__() for value in sample])) if len(sample) else 0.0
+    utf8_bytes = float(np.mean([len(value.encode("utf-8")) for value in sample])) if len(sample) else 0.0
+
+    object_backed = series.dtype == object or getattr(series.dtype, "storage", None) == "python"
+    if object_backed:
+        # Pointer array plus one str object per present value.
+        current = int(rows * 8 + present * object_bytes + (rows - present) * _NONE_BYTES)
+    else:
+        current = int(series.memory_usage(deep=True, index=False))
+
+    params = detect_datetime(sample) if detect_dates else None
+    if params is not None:
+        # int64 ticks, NaT for missing values.
+        return [_suggestion(
+            column, "to_datetime", params, 0.8, current, rows * 8,
+            "Sampled values all parse as dates"
+            + (f" in format {params['format']!r}" if "format" in params else ""),
+        )]
+
+    repetitive = unique <= CATEGORY_MAX_RATIO * present
+    if object_backed and not repetitive and _pyarrow_available():
+        # 64-bit offsets, UTF-8 data and a validity bitmap.
+        projected = int(rows * 8 + present * utf8_bytes + rows / 8)
+        return [_suggestion(
+            column, "to_arrow_string", {}, 0.7, current, projected,
+            "Python string objects replaced by one Arrow buffer",
+        )]
+
+    if repetitive or object_backed:
+        # Without pyarrow, category is the only compact form of object
+        # strings; it saves memory only when values repeat.
+        codes = rows * _code_width(unique)
+        categories = unique * (8 + object_bytes) if object_backed else unique * (8 + utf8_bytes)
+        return [_suggestion(
+            column, "to_category", {}, 0.8 if repetitive else 0.6, current, int(codes + categories),
+            f"{unique} distinct values in {present} rows; category stores each once",
+        )]
+    return []
+
+
+def _sample_present(series: pd.Series, rng: np.random.Generator) -> List[Any]:
+    if len(series) > STRING_SAMPLE * 4:
+        positions = np.sort(rng.choice(len(series), size=STRING_SAMPLE * 4, replace=False))
+        series = series.iloc[positions]
+    return series.dropna().iloc[:STRING_SAMPLE].tolist()
+
+
+def _float32_exact(series: pd.Series, rng: np.random.Generator) -> bool:
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    if len(values) > STRING_SAMPLE:
+        values = values[rng.choice(len(values), size=STRING_SAMPLE, replace=False)]
+    return bool(np.array_equal(values.astype(np.float32).astype(np.float64), values, equal_nan=True))
+
+
+def _is_string(dtype: Any) -> bool:
+    return dtype == object or isinstance(dtype, pd.StringDtype)
+
+
+def _code_width(unique: int) -> int:
+    # pandas picks the narrowest signed code type for the categories.
+    for width, bound in ((1, 2 ** 7), (2, 2 ** 15), (4, 2 ** 31)):
+        if unique < bound:
+            return width
+    return 8
+
+
+def _pyarrow_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _suggestion(
+    column: Any,
+    operation: str,
+    params: Dict[str, Any],
+    confidence: float,
+    current: int,
+    projected: int,
+    reason: str,
+) -> Dict[str, Any]:
+    return {
+        "column": column,
+        "operation": operation,
+        "params": params,
+        "confidence": confidence,
+        "reason": reason,
+        "current_bytes": int(current),
+        "projected_savings_bytes": int(max(current - projected, 0)),
+    }
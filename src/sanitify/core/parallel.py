@@ -0,0 +1,187 @@
+from __future__ import annotations
+import os
+import pandas as pd
+import numpy as np
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, Any, List, Optional, Tuple
+
+from sanitify.core.sampling import RowSample
+from sanitify.core.batch import (
+    BATCH_COLUMNS,
+    approximate_block_metrics,
+    block_metrics,
+    is_batchable,
+    profile_columns,
+    to_block,
+)
+from sanitify.utils.tracing import NULL_TRACER
+
+
+def resolve_n_jobs(n_jobs: Optional[int]) -> int:
+    """
+    ``None`` and ``1`` mean serial, ``-1`` means one worker per CPU.
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        return max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+    if n_jobs == 0:
+        raise ValueError("n_jobs must be a non-zero integer")
+    return n_jobs
+
+
+def column_groups(df: pd.DataFrame, n_jobs: int) -> List[Tuple[bool, List[int]]]:
+    """
+    Split columns into independent work units as ``(is_numeric_block,
+    positions)`` pairs.
+
+    Numeric columns stay grouped by dtype so each unit is still one
+    vectorized block, but blocks shrink below ``BATCH_COLUMNS`` when that is
+    needed to give every worker something to do. Other columns are dealt
+    out in small slices for load balancing.
+    """
+    numeric: Dict[str, List[int]] = {}
+    others: List[int] = []
+    for pos, dtype in enumerate(df.dtypes):
+        if is_batchable(dtype):
+            numeric.setdefault(str(dtype), []).append(pos)
+        else:
+            others.append(pos)
+
+    groups: List[Tuple[bool, List[int]]] = []
+    for positions in numeric.values():
+        size = min(BATCH_COLUMNS, max(-(-len(positions) // n_jobs), 1))
+        for start in range(0, len(positions), size):
+            groups.append((True, positions[start:start + size]))
+
+    size = max(-(-len(others) // (n_jobs * 4)), 1)
+    for start in range(0, len(others), size):
+        groups.append((False, others[start:start + size]))
+
+    return groups
+
+
+def profile_columns_parallel(
+    df: pd.DataFrame,
+    total_rows: int,
+    approximate: bool = False,
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    tracer: Any = NULL_TRACER,
+    sample: Optional[RowSample] = None,
+) -> Dict[str, Any]:
+    """
+    Profile column groups concurrently and merge them in column order.
+
+    Runs on ``executor`` when given, otherwise on a thread pool of
+    ``n_jobs`` workers (NumPy sorts and reductions release the GIL). Work
+    for an ``executor`` is split for ``n_jobs`` workers, one per CPU by
+    default. With a ``ProcessPoolExecutor`` numeric blocks are handed to
+    workers through shared memory instead of being pickled.
+
+    Spans are recorded on ``tracer`` from every thread; work sent to other
+    processes is not traced.
+    """
+    workers = resolve_n_jobs(n_jobs)
+    if executor is None and workers == 1:
+        return profile_columns(df, total_rows, approximate=approximate, tracer=tracer, sample=sample)
+
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return _run_groups(pool, df, total_rows, approximate, workers, tracer, sample)
+
+    if n_jobs is None:
+        workers = resolve_n_jobs(-1)
+    return _run_groups(executor, df, total_rows, approximate, workers, tracer, sample)
+
+
+def _run_groups(
+    executor: Executor,
+    df: pd.DataFrame,
+    total_rows: int,
+    approximate: bool,
+    workers: int,
+    tracer: Any,
+    sample: Optional[RowSample] = None,
+) -> Dict[str, Any]:
+    use_shared_memory = isinstance(executor, ProcessPoolExecutor)
+    if use_shared_memory:
+        tracer = NULL_TRACER
+    segments: List[shared_memory.SharedMemory] = []
+    submitted = []
+
+    try:
+        for is_block, positions in column_groups(df, workers):
+            frame = df.iloc[:, positions]
+            if is_block and use_shared_memory:
+                block = to_block(frame)
+                segment, order = _share(block)
+                segments.append(segment)
+                future = executor.submit(
+                    _profile_shared_block,
+                    segment.name,
+                    block.shape,
+                    block.dtype.str,
+                    order,
+                    total_rows,
+                    str(frame.dtypes.iloc[0]),
+                    approximate,
+                    sample,
+                )
+            else:
+                future = executor.submit(_profile_frame, frame, total_rows, approximate, tracer, sample)
+            submitted.append((positions, future))
+
+        by_position: Dict[int, Dict[str, Any]] = {}
+        for positions, future in submitted:
+            by_position.update(zip(positions, future.result()))
+    finally:
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+
+    return {col: by_position[pos] for pos, col in enumerate(df.columns)}
+
+
+def _profile_frame(
+    frame: pd.DataFrame,
+    total_rows: int,
+    approximate: bool,
+    tracer: Any = NULL_TRACER,
+    sample: Optional[RowSample] = None,
+) -> List[Dict[str, Any]]:
+    profiles = profile_columns(frame, total_rows, approximate=approximate, tracer=tracer, sample=sample)
+    return list(profiles.values())
+
+
+def _share(block: np.ndarray) -> Tuple[shared_memory.SharedMemory, str]:
+    # Keep the memory layout so reductions sum in the same order as the
+    # serial path and results stay bit-identical.
+    order = "F" if block.flags.f_contiguous and not block.flags.c_contiguous else "C"
+    segment = shared_memory.SharedMemory(create=True, size=max(block.nbytes, 1))
+    view = np.ndarray(block.shape, dtype=block.dtype, buffer=segment.buf, order=order)
+    view[...] = block
+    del view
+    return segment, order
+
+
+def _profile_shared_block(
+    name: str,
+    shape: Tuple[int, int],
+    dtype: str,
+    order: str,
+    total_rows: int,
+    column_dtype: str,
+    approximate: bool,
+    sample: Optional[RowSample] = None,
+) -> List[Dict[str, Any]]:
+    segment = shared_memory.SharedMemory(name=name)
+    block = np.ndarray(shape, dtype=np.dtype(dtype), buffer=segment.buf, order=order)
+    try:
+        if approximate:
+            return approximate_block_metrics(block, total_rows, column_dtype, sample=sample)
+        return block_metrics(block, total_rows, column_dtype)
+    finally:
+        del block
+        segment.close()
@@ -1,129 +1,282 @@
 from __future__ import annotations
 import pandas as pd
 import numpy as np 
-from typing import Dict, Any, Tuple
+from concurrent.futures import Executor
+from typing import Dict, Any, Iterable, List, Optional
+
+from sanitify.core.parallel import profile_columns_parallel
+from sanitify.core.duplicates import DEFAULT_MEMORY_LIMIT, count_duplicates
+from sanitify.core.lazy import LazyProfile, profile_selected, resolve_metrics
+from sanitify.core.memory import check_memory_mode, estimate_memory
+from sanitify.core.sampling import RowSample, draw_sample
+from sanitify.utils.tracing import NULL_TRACER
 
 class DataProfiler:
     """
     Deterministic dataset profiler.
 
     Design principles:
-    - Sampling only affects heavy numeric computations.
+    - Sampling is opt-in (``approximate=True``) and only affects heavy
+      numeric computations (median, std).
     - Structural metrics (missing, unique, duplicates) use full dataset.
     - Output is stable and versioned.
     - No side effects.
+
+    With ``approximate=True`` distinct counts and medians come from
+    HyperLogLog and quantile sketches instead of hash sets and full sorts.
+    Columns whose sketched metrics are inexact record them under
+    ``"approximate"`` as a metric -> error bound mapping.
+
+    With ``approximate=True``, frames longer than ``max_sample_size`` rows
+    estimate median and std from a row sample instead of quantile sketches:
+    uniform, or stratified by the key column ``stratify_by``. Sampled
+    columns record the confidence intervals of their estimates under
+    ``"sampled"``. Exact profiles never sample; the sort they need for
+    distinct counts already yields the exact median.
+
+    ``n_jobs`` / ``executor`` spread independent column groups over a
+    thread pool (or any ``concurrent.futures`` executor); results are
+    merged back in column order.
+
+    Duplicates are counted on the full dataset from 64-bit row
+    fingerprints, spilling to disk beyond ``duplicate_memory_limit`` bytes;
+    ``"duplicate_detection"`` records whether the count is exact.
+
+    ``memory_mode`` selects how ``memory_bytes`` is measured: ``"exact"``
+    (deep ``memory_usage``), ``"sampled"`` (object columns extrapolated
+    from a stratified row sample) or ``"shallow"`` (buffers only, a lower
+    bound). The dataset summary records the mode and
+    ``memory_error_bytes``, the 95% error of the figure (None if unknown).
+
+    ``tracer`` (see ``sanitify.utils.tracing.Tracer``) receives one span per
+    profiling stage and per column metric.
+
+    ``columns`` and ``metrics`` (names from
+    ``sanitify.core.lazy.PROFILE_METRICS``) restrict the profile to a
+    subset; ``memory_bytes`` and ``duplicates`` always describe the whole
+    frame. Selective profiles omit unselected metrics, report
+    ``"duplicates": None`` unless selected, and record the selection under
+    ``"selection"``. ``lazy()`` computes metrics only when accessed.
     """
 
     PROFILE_VERSION = "1.0"
 
-    def __init__(self,df:pd.DataFrame, max_sample_size: int = 50_000):
+    def __init__(
+            self,
+            df:pd.DataFrame,
+            max_sample_size: int = 50_000,
+            approximate: bool = False,
+            n_jobs: Optional[int] = None,
+            executor: Optional[Executor] = None,
+            tracer: Any = NULL_TRACER,
+            duplicate_memory_limit: int = DEFAULT_MEMORY_LIMIT,
+            memory_mode: str = "exact",
+            stratify_by: Any = None,
+            columns: Optional[Iterable[Any]] = None,
+            metrics: Optional[Iterable[str]] = None,
+    ):
         if not isinstance(df, pd.DataFrame):
             raise TypeError("DataProfiler expects a pandas DataFrame")
+        if stratify_by is not None and stratify_by not in df.columns:
+            raise KeyError(f"stratify_by column {stratify_by!r} not found")
+        if columns is not None:
+            columns = list(columns)
+            unknown = [col for col in columns if col not in df.columns]
+            if unknown:
+                raise KeyError(f"Columns not found: {unknown}")
         
         self._original_df = df
         self._max_sample_size = max_sample_size
-        self._df, self._sampled = self._apply_sampling(df)
+        self._approximate = approximate
+        self._n_jobs = n_jobs
+        self._executor = executor
+        self._tracer = tracer
+        self._duplicate_memory_limit = duplicate_memory_limit
+        self._memory_mode = check_memory_mode(memory_mode)
+        self._stratify_by = stratify_by
+        self.columns = columns
+        self.metrics = resolve_metrics(metrics)
+        self._sample = self._draw_sample(df)
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[pd.DataFrame], **options: Any):
+        """
+        Profile an iterable of DataFrame chunks with bounded memory.
+
+        Returns a ``ChunkedProfiler`` whose ``run()`` yields the same
+        profile layout as ``DataProfiler.run()``.
+        """
+        from sanitify.core.streaming import ChunkedProfiler
+
+        return ChunkedProfiler(**options).consume(chunks)
+
+    @classmethod
+    def from_arrow(cls, source: Any, **options: Any):
+        """
+        Profile a ``pyarrow.Table``, ``RecordBatch`` or Parquet file with
+        Arrow compute kernels instead of pandas.
+
+        Returns an ``ArrowProfiler`` whose ``run()`` yields the same profile
+        layout as ``DataProfiler.run()``.
+        """
+        from sanitify.core.arrow import ArrowProfiler
+
+        return ArrowProfiler(source, **options)
 
     # ------------------------
     # Public API
     # ------------------------
     def run(self) -> Dict[str,Any]:
+        if self.columns is not None or self.metrics is not None:
+            with self._tracer.span("profile", rows=len(self._original_df)):
+                return self.lazy().to_dict()
+
+        tracer = self._tracer
+        with tracer.span("profile", rows=len(self._original_df)):
+            with tracer.span("profile.dataset"):
+                dataset = self._dataset_summary()
+            with tracer.span("profile.columns", columns=self._original_df.shape[1]):
+                columns = self._column_profiles()
+            with tracer.span("profile.duplicates"):
+                duplicates = self._duplicates()
+
         return{
             "profile_version": self.PROFILE_VERSION,
-            "dataset": self._dataset_summary(),
-            "columns": self._column_profiles(),
-            "duplicates": self._duplicates_count(),
+            "dataset": dataset,
+            "columns": columns,
+            "duplicates": duplicates["count"],
+            "duplicate_detection": duplicates["detection"],
         }
     
+    def lazy(self) -> LazyProfile:
+        """
+        Profile of the selected columns and metrics that computes each
+        metric on first access and memoizes it (see ``LazyProfile``).
+        """
+        return LazyProfile(self)
+
+    def refresh(
+            self,
+            previous: Dict[str,Any],
+            before: pd.DataFrame,
+            changed: Iterable[Any],
+    ) -> Dict[str,Any]:
+        """
+        Profile this frame by reusing ``previous`` wherever it still holds.
+
+        ``previous`` must describe ``before``, a frame with the same rows.
+        Only ``changed`` columns (and columns ``previous`` lacks) are
+        profiled again, dropped columns disappear, exact memory is adjusted
+        by the touched columns (estimates are redone), and duplicates are
+        recounted.
+        """
+        df = self._original_df
+        if len(before) != len(df):
+            raise ValueError("refresh expects frames with the same rows")
+
+        changed = set(changed)
+        stale: List[Any] = [
+            col for col in df.columns
+            if col in changed or col not in previous["columns"]
+        ]
+
+        tracer = self._tracer
+        with tracer.span("profile.refresh", columns=len(stale)):
+            with tracer.span("profile.columns", columns=len(stale)):
+                recomputed = profile_columns_parallel(
+                    df[stale],
+                    len(df),
+                    approximate=self._approximate,
+                    n_jobs=self._n_jobs,
+                    executor=self._executor,
+                    tracer=tracer,
+                    sample=self._sample,
+                ) if stale else {}
+
+            with tracer.span("profile.dataset"):
+                removed = [col for col in before.columns if col in changed or col not in df.columns]
+                dataset = dict(previous["dataset"])
+                dataset["columns"] = int(df.shape[1])
+                if self._memory_mode == "exact":
+                    dataset["memory_bytes"] = int(
+                        dataset["memory_bytes"]
+                        - before[removed].memory_usage(deep=True, index=False).sum()
+                        + df[stale].memory_usage(deep=True, index=False).sum()
+                    )
+                else:
+                    # Estimates are cheap and their errors do not subtract.
+                    dataset.update(estimate_memory(df, self._memory_mode))
+
+            with tracer.span("profile.duplicates"):
+                duplicates = self._duplicates()
+
+        return{
+            "profile_version": self.PROFILE_VERSION,
+            "dataset": dataset,
+            "columns": {
+                col: recomputed[col] if col in recomputed else previous["columns"][col]
+                for col in df.columns
+            },
+            "duplicates": duplicates["count"],
+            "duplicate_detection": duplicates["detection"],
+        }
+
     # ------------------------
     # Dataset Level
     # ------------------------
-    def _dataset_summary(self) -> Dict[str,Any]:
+    def _dataset_summary(self, memory: bool = True) -> Dict[str,Any]:
+        sample = self._sample
         return {
             "rows": int(self._original_df.shape[0]),
             "columns": int(self._original_df.shape[1]),
-            "memory_bytes": int(self._original_df.memory_usage(deep=True).sum()),
-            "sampled": self._sampled,
-            "sample_size": int(len(self._df)),
+            **(estimate_memory(self._original_df, self._memory_mode) if memory else {}),
+            "sampled": sample is not None,
+            "sample_size": sample.size if sample is not None else int(len(self._original_df)),
+            "sampling": sample.to_dict() if sample is not None else None,
         }
     
-    def _duplicates_count(self) -> int:
-        return int(self._df.duplicated().sum())
+    def _duplicates(self) -> Dict[str,Any]:
+        return count_duplicates(
+            self._original_df,
+            approximate=self._approximate,
+            memory_limit=self._duplicate_memory_limit,
+        )
     
     # ------------------------
     # Column Level
     # ------------------------
     def _column_profiles(self) -> Dict[str,Any]:
-        profiles: Dict[str,Any] = {}
-
-        total_rows = len(self._original_df)
+        # Numeric columns are reduced together in dtype-grouped NumPy blocks
+        # instead of one pandas pass per metric per column.
+        return profile_columns_parallel(
+            self._original_df,
+            len(self._original_df),
+            approximate=self._approximate,
+            n_jobs=self._n_jobs,
+            executor=self._executor,
+            tracer=self._tracer,
+            sample=self._sample,
+        )
 
-        for col in self._original_df.columns:
-            full_series = self._original_df[col]
-            # sampled series not required for the current metrics; keep using full_series
-
-            col_profile = self._base_column_metrics(
-                full_series,
-                total_rows                
-                )
-
-            if self._is_numeric(full_series) or full_series.dropna().empty:
-                col_profile['numeric'] = self._numeric_metrics(full_series)
-            
-            profiles[col] = col_profile
-
-        return profiles
-    
-    def _base_column_metrics(self, series: pd.Series, total_rows: int) -> Dict[str,Any]:
-        missing = series.isna().sum()
-        unique = series.nunique(dropna=True)
-
-        return {
-            "dtype": str(series.dtype),
-            "missing": int(missing),
-            "missing_pct": float(missing / total_rows) if total_rows > 0 else 0.0,
-            "unique": int(unique),
-            "is_constant": bool(unique <= 1),
-        }
-    
-    def _numeric_metrics(self, series: pd.Series) -> Dict[str,Any]:
-        clean = series.dropna()
-        
-        if clean.empty:
-            return {
-                "mean": None,
-                "std": None,
-                "min": None,
-                "max": None,
-                "median": None,
-            }
-        return {
-            "mean": float(clean.mean()),
-            "std": float(clean.std()),
-            "min": float(clean.min()),
-            "max": float(clean.max()),
-            "median": float(clean.median()),
-        }
+    def _profile_selected(self, columns: List[Any], metrics: Iterable[str]) -> Dict[str,Any]:
+        return profile_selected(
+            self._original_df[columns],
+            len(self._original_df),
+            frozenset(metrics),
+            approximate=self._approximate,
+            n_jobs=self._n_jobs,
+            executor=self._executor,
+            tracer=self._tracer,
+            sample=self._sample,
+        )
 
     # ------------------------
     # sampling
     # ------------------------
-    def _apply_sampling(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, bool]:
-
-        if len(df) > self._max_sample_size:
-            return (
-                df.sample(
-                n=self._max_sample_size,
-                random_state=42
-                )
-            ), True
-        
-        return df, False
-    
-    #------------------------
-    # type checks
-    #------------------------
-    @staticmethod
-    def _is_numeric(series: pd.Series) -> bool:
-        return pd.api.types.is_numeric_dtype(series)
-    
\ No newline at end of file
+    def _draw_sample(self, df: pd.DataFrame) -> Optional[RowSample]:
+
+        # Only the approximate path saves work by sampling.
+        if self._approximate and len(df) > self._max_sample_size:
+            return draw_sample(df, self._max_sample_size, stratify_by=self._stratify_by)
+
+        return None
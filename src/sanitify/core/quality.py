@@ -1,79 +1,166 @@
 from __future__ import annotations
-from typing import Dict, Any, List
+import logging
+import operator
+import numpy as np
+from typing import Callable, Dict, Any, FrozenSet, List, Optional, Sequence, Set, Tuple, Union
+
+from sanitify.core.lazy import metrics_for
+from sanitify.core.table import NUMERIC_METRICS, ProfileTable
+
+logger = logging.getLogger(__name__)
+
+# Comparison operators accepted by ``ThresholdRule``.
+OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
 
 
 class BaseRule:
+    """
+    ``requires`` names the profile metrics a rule reads (see
+    ``ProfileTable``); a ``RulePlan`` skips the rule when any is missing.
+    """
+
     name: str
+    requires: Tuple[str, ...] = ()
 
     def evaluate(self, profile: Dict[str, Any]) -> List[Dict[str, Any]]:
         raise NotImplementedError
 
 
-class HighMissingRule(BaseRule):
+class ColumnRule(BaseRule):
+    """
+    Per-column rule evaluated as a vectorized predicate over a
+    ``ProfileTable``.
+
+    Subclasses implement ``metric(table)``, returning one value per column;
+    columns where ``flags(table, values)`` holds (by default ``values >
+    threshold``) become issues. Only flagged columns cost Python work.
+    """
+
+    severity: str = "medium"
+    threshold: Optional[float] = None
+
+    def metric(self, table: ProfileTable) -> np.ndarray:
+        raise NotImplementedError
+
+    def flags(self, table: ProfileTable, values: np.ndarray) -> np.ndarray:
+        return values > self.threshold
+
+    def evaluate(self, profile: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return self.evaluate_table(ProfileTable.from_profile(profile))
+
+    def evaluate_table(self, table: ProfileTable) -> List[Dict[str, Any]]:
+        if len(table) == 0:
+            return []
+        values = self.metric(table)
+        return [
+            self.issue(table, int(pos), values[pos])
+            for pos in np.flatnonzero(self.flags(table, values))
+        ]
+
+    def issue(self, table: ProfileTable, pos: int, value: Any) -> Dict[str, Any]:
+        return {
+            "column": table.columns[pos],
+            "rule": self.name,
+            "severity": self.severity,
+            "metric": value.item() if isinstance(value, np.generic) else value,
+            "threshold": self.threshold,
+        }
+
+
+class ThresholdRule(ColumnRule):
+    """
+    Flags columns where ``table[metric] <op> threshold``.
+
+    A ``RulePlan`` evaluates all threshold rules on the same metric and
+    operator as one broadcast comparison.
+    """
+
+    def __init__(
+        self,
+        metric: str,
+        threshold: float,
+        op: str = ">",
+        severity: str = "medium",
+        name: str = "threshold",
+    ):
+        if op not in OPERATORS:
+            raise ValueError(f"Unsupported operator {op!r}; expected one of {sorted(OPERATORS)}")
+        self.metric_name = metric
+        self.threshold = threshold
+        self.op = op
+        self.severity = severity
+        self.name = name
+
+    @property
+    def requires(self) -> Tuple[str, ...]:
+        return (self.metric_name,)
+
+    def metric(self, table: ProfileTable) -> np.ndarray:
+        return table[self.metric_name]
+
+    def flags(self, table: ProfileTable, values: np.ndarray) -> np.ndarray:
+        return OPERATORS[self.op](values, self.threshold) & _present(self.metric_name, values)
+
+
+class HighMissingRule(ThresholdRule):
     name = "high_missing"
+    metric_name = "missing_pct"
+    op = ">"
+    severity = "medium"
 
     def __init__(self, threshold: float = 0.3):
         self.threshold = threshold
 
-    def evaluate(self, profile: Dict[str, Any]) -> List[Dict[str, Any]]:
-        results = []
-        for col, meta in profile["columns"].items():
-            if meta["missing_pct"] > self.threshold:
-                results.append({
-                    "column": col,
-                    "rule": self.name,
-                    "severity": "medium",
-                    "metric": meta["missing_pct"],
-                    "threshold": self.threshold,
-                })
-        return results
-
-
-class ConstantColumnRule(BaseRule):
+
+class ConstantColumnRule(ColumnRule):
     name = "constant_column"
+    severity = "low"
+    requires = ("is_constant",)
 
-    def evaluate(self, profile: Dict[str, Any]) -> List[Dict[str, Any]]:
-        results = []
-        for col, meta in profile["columns"].items():
-            if meta["is_constant"]:
-                results.append({
-                    "column": col,
-                    "rule": self.name,
-                    "severity": "low",
-                    "metric": 1,
-                    "threshold": None,
-                })
-        return results
-
-
-class HighCardinalityRule(BaseRule):
+    def metric(self, table: ProfileTable) -> np.ndarray:
+        return np.ones(len(table), dtype=np.int64)
+
+    def flags(self, table: ProfileTable, values: np.ndarray) -> np.ndarray:
+        return table["is_constant"]
+
+
+class HighCardinalityRule(ColumnRule):
     name = "high_cardinality"
+    requires = ("unique",)
 
     def __init__(self, threshold: float = 0.9):
         self.threshold = threshold
 
-    def evaluate(self, profile: Dict[str, Any]) -> List[Dict[str, Any]]:
-        results = []
-        rows = profile["dataset"]["rows"]
+    def metric(self, table: ProfileTable) -> np.ndarray:
+        if table.rows == 0:
+            return np.zeros(len(table))
+        # Sketched distinct counts can overshoot the row count slightly.
+        return np.minimum(table["unique"] / table.rows, 1.0)
 
-        if rows == 0:
-            return results
+    def flags(self, table: ProfileTable, values: np.ndarray) -> np.ndarray:
+        if table.rows == 0:
+            return np.zeros(len(table), dtype=bool)
+        return values > self.threshold
 
-        for col, meta in profile["columns"].items():
-            ratio = meta["unique"] / rows
-            if ratio > self.threshold:
-                results.append({
-                    "column": col,
-                    "rule": self.name,
-                    "severity": "medium",
-                    "metric": ratio,
-                    "threshold": self.threshold,
-                })
-        return results
+    def issue(self, table: ProfileTable, pos: int, value: Any) -> Dict[str, Any]:
+        issue = super().issue(table, pos, value)
+        error = table["unique_error"][pos]
+        if not np.isnan(error):
+            issue["approximate"] = True
+            issue["error_bound"] = float(error)
+        return issue
 
 
 class DuplicateRateRule(BaseRule):
     name = "high_duplicate_rate"
+    requires = ("duplicates",)
 
     def __init__(self, threshold: float = 0.1):
         self.threshold = threshold
@@ -88,23 +175,147 @@ class DuplicateRateRule(BaseRule):
         rate = duplicates / rows
 
         if rate > self.threshold:
-            return [{
+            issue = {
                 "column": None,
                 "rule": self.name,
                 "severity": "high",
                 "metric": rate,
                 "threshold": self.threshold,
-            }]
+            }
+            detection = profile.get("duplicate_detection") or {}
+            if detection.get("exact") is False:
+                issue["approximate"] = True
+                issue["error_bound"] = detection["error_bound"]
+            return [issue]
 
         return []
 
 
-class RuleEngine:
-    def __init__(self, rules: List[BaseRule]):
-        self.rules = rules
+class RulePlan:
+    """
+    Compiled evaluation plan for an ordered list of rules.
+
+    Built once per rule set and reused for every profile:
 
-    def run(self, profile: Dict[str, Any]) -> List[Dict[str, Any]]:
-        results = []
+    - one ``ProfileTable`` per run is shared by all rules that need it;
+    - ``ThresholdRule`` instances on the same metric and operator are
+      evaluated together as one (rules x columns) comparison;
+    - rules whose ``requires`` metrics the profile lacks are skipped;
+      ``requires`` on the plan lists what all of them read.
+
+    ``weights`` and ``caps`` carry per-rule scoring overrides from a rule
+    spec (see ``sanitify.core.rules``). Thresholds are read at run time,
+    so reconfigured rules need no recompilation.
+    """
+
+    def __init__(
+        self,
+        rules: Sequence[BaseRule],
+        weights: Optional[Dict[str, Any]] = None,
+        caps: Optional[Dict[str, Any]] = None,
+    ):
+        self.rules: List[BaseRule] = list(rules)
+        self.weights: Dict[str, Any] = dict(weights or {})
+        self.caps: Dict[str, Any] = dict(caps or {})
+
+        self._stacks: Dict[Tuple[str, str], List[int]] = {}
+        for index, rule in enumerate(self.rules):
+            if _stackable(rule):
+                self._stacks.setdefault((rule.metric_name, rule.op), []).append(index)
+
+    @property
+    def requires(self) -> Optional[Set[str]]:
+        """
+        Union of the rules' ``requires``, or None when a rule declares
+        nothing and may read any metric.
+        """
+        needed: Set[str] = set()
         for rule in self.rules:
-            results.extend(rule.evaluate(profile))
-        return results
+            if not rule.requires:
+                return None
+            needed.update(rule.requires)
+        return needed
+
+    @property
+    def needs_table(self) -> bool:
+        return any(isinstance(rule, ColumnRule) or rule.requires for rule in self.rules)
+
+    def skipped(self, table: ProfileTable) -> List[BaseRule]:
+        return [rule for rule in self.rules if not self._applies(rule, table)]
+
+    def run(self, profile: Dict[str, Any], table: Optional[ProfileTable] = None) -> List[Dict[str, Any]]:
+        if table is None and self.needs_table:
+            table = ProfileTable.from_profile(profile)
+
+        results: List[Optional[List[Dict[str, Any]]]] = [None] * len(self.rules)
+        for (metric, op), indices in self._stacks.items():
+            live = [i for i in indices if self._applies(self.rules[i], table)]
+            if live and len(table):
+                values = table[metric]
+                thresholds = np.array([self.rules[i].threshold for i in live], dtype=np.float64)
+                masks = OPERATORS[op](values[None, :], thresholds[:, None]) & _present(metric, values)
+                for i, mask in zip(live, masks):
+                    rule = self.rules[i]
+                    results[i] = [
+                        rule.issue(table, int(pos), values[pos]) for pos in np.flatnonzero(mask)
+                    ]
+
+        issues: List[Dict[str, Any]] = []
+        for index, rule in enumerate(self.rules):
+            if results[index] is not None:
+                issues.extend(results[index])
+            elif table is not None and not self._applies(rule, table):
+                logger.debug("Skipping rule %s: profile lacks %s", rule.name, rule.requires)
+            elif isinstance(rule, ColumnRule):
+                issues.extend(rule.evaluate_table(table))
+            else:
+                issues.extend(rule.evaluate(profile))
+        return issues
+
+    @staticmethod
+    def _applies(rule: BaseRule, table: Optional[ProfileTable]) -> bool:
+        return table is None or all(metric in table for metric in rule.requires)
+
+
+def _present(metric: str, values: np.ndarray) -> Any:
+    # Non-numeric columns carry NaN for numeric metrics, and NaN != x holds.
+    if metric in NUMERIC_METRICS:
+        return ~np.isnan(values)
+    return True
+
+
+def _stackable(rule: BaseRule) -> bool:
+    # Subclasses that redefine the metric or the predicate run on their own.
+    kind = type(rule)
+    return (
+        isinstance(rule, ThresholdRule)
+        and kind.metric is ThresholdRule.metric
+        and kind.flags is ThresholdRule.flags
+    )
+
+
+class RuleEngine:
+    """
+    Runs rules in order and concatenates their issues.
+
+    The rules are compiled into a ``RulePlan`` once, at construction; pass
+    a plan directly to reuse one compiled from a rule spec. Column rules
+    share one ``ProfileTable`` per run, so N rules over M columns cost N
+    vectorized predicates (fewer when threshold rules stack) instead of
+    N x M dict lookups. ``required_metrics()`` tells the profiler which
+    metrics to compute for them.
+    """
+
+    def __init__(self, rules: Union[List[BaseRule], RulePlan]):
+        self.plan = rules if isinstance(rules, RulePlan) else RulePlan(rules)
+        self.rules = self.plan.rules
+
+    def required_metrics(self) -> Optional[FrozenSet[str]]:
+        """
+        Profile metrics (``sanitify.core.lazy.PROFILE_METRICS``) the rules
+        read, for ``DataProfiler(metrics=...)``; None means all of them.
+        """
+        return metrics_for(self.plan.requires)
+
+    def run(self, profile: Dict[str, Any], table: Optional[ProfileTable] = None) -> List[Dict[str, Any]]:
+        return self.plan.run(profile, table)
@@ -0,0 +1,187 @@
+from __future__ import annotations
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from sanitify.core.quality import (
+    BaseRule,
+    ConstantColumnRule,
+    DuplicateRateRule,
+    HighCardinalityRule,
+    HighMissingRule,
+    RulePlan,
+    ThresholdRule,
+)
+
+# Spec keys handled by the compiler; everything else is passed to the
+# rule factory as keyword arguments.
+_RESERVED_KEYS = {"rule", "name", "severity", "weight", "cap"}
+
+RuleFactory = Callable[..., BaseRule]
+RuleSpec = Union[Dict[str, Any], List[Dict[str, Any]]]
+
+
+class RuleRegistry:
+    """
+    Maps rule kinds used in specs to rule factories.
+
+    Compiled plans are cached per registry, keyed by the canonical JSON of
+    the spec, so the hundreds of datasets sharing a rule set compile it
+    once. Registering a kind clears the cache. Cached plans and their rules
+    are shared; treat them as read-only.
+    """
+
+    def __init__(self, max_plans: int = 256):
+        self.max_plans = max_plans
+        self._factories: Dict[str, RuleFactory] = {}
+        self._plans: "OrderedDict[str, RulePlan]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def register(self, kind: str, factory: Optional[RuleFactory] = None):
+        """
+        Register ``factory`` under ``kind``; usable as a class decorator.
+        """
+        def add(target: RuleFactory) -> RuleFactory:
+            with self._lock:
+                self._factories[kind] = target
+                self._plans.clear()
+            return target
+
+        return add if factory is None else add(factory)
+
+    def __contains__(self, kind: str) -> bool:
+        return kind in self._factories
+
+    @property
+    def kinds(self) -> List[str]:
+        return sorted(self._factories)
+
+    def create(self, entry: Dict[str, Any]) -> BaseRule:
+        kind = entry.get("rule")
+        if kind not in self._factories:
+            raise ValueError(f"Unknown rule {kind!r}; registered rules: {', '.join(self.kinds)}")
+
+        options = {key: value for key, value in entry.items() if key not in _RESERVED_KEYS}
+        if self._factories[kind] is ThresholdRule:
+            # Generic rules take their name and severity as arguments.
+            options.update({key: entry[key] for key in ("name", "severity") if key in entry})
+        try:
+            rule = self._factories[kind](**options)
+        except TypeError as exc:
+            raise ValueError(f"Invalid options for rule {kind!r}: {exc}") from None
+
+        for key in ("name", "severity"):
+            if key in entry:
+                setattr(rule, key, entry[key])
+        return rule
+
+    def compile(self, spec: Any) -> RulePlan:
+        entries = _rule_entries(load_rule_spec(spec))
+        key = json.dumps(entries, sort_keys=True, default=repr)
+
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                return plan
+
+        rules = [self.create(entry) for entry in entries]
+        weights = {rule.name: entry["weight"] for rule, entry in zip(rules, entries) if "weight" in entry}
+        caps = {rule.name: entry["cap"] for rule, entry in zip(rules, entries) if "cap" in entry}
+        plan = RulePlan(rules, weights=weights, caps=caps)
+
+        with self._lock:
+            self._plans[key] = plan
+            while len(self._plans) > self.max_plans:
+                self._plans.popitem(last=False)
+        return plan
+
+
+DEFAULT_REGISTRY = RuleRegistry()
+DEFAULT_REGISTRY.register("high_missing", HighMissingRule)
+DEFAULT_REGISTRY.register("constant_column", ConstantColumnRule)
+DEFAULT_REGISTRY.register("high_cardinality", HighCardinalityRule)
+DEFAULT_REGISTRY.register("high_duplicate_rate", DuplicateRateRule)
+DEFAULT_REGISTRY.register("threshold", ThresholdRule)
+
+
+def register_rule(kind: str, factory: Optional[RuleFactory] = None):
+    """
+    Register a rule kind in the default registry.
+    """
+    return DEFAULT_REGISTRY.register(kind, factory)
+
+
+def compile_rules(spec: Any, registry: Optional[RuleRegistry] = None) -> RulePlan:
+    """
+    Compile a rule spec (dict, list, JSON/YAML text or file path) into a
+    cached ``RulePlan``.
+    """
+    return (registry or DEFAULT_REGISTRY).compile(spec)
+
+
+def load_rule_spec(source: Any) -> RuleSpec:
+    """
+    Parse a rule spec.
+
+    Accepts an already-parsed dict or list, a path to a ``.json``,
+    ``.yaml`` or ``.yml`` file, or JSON/YAML text. A spec is a list of rule
+    entries or a mapping with a ``rules`` list; each entry names its
+    ``rule`` kind and may set ``name``, ``severity``, scoring ``weight`` and
+    ``cap``, plus options for the rule (e.g. ``threshold``)::
+
+        rules:
+          - rule: high_missing
+            threshold: 0.2
+            weight: 15
+          - rule: threshold
+            name: extreme_spread
+            metric: std
+            op: ">"
+            threshold: 1.0e6
+            severity: low
+
+    YAML needs PyYAML (``pip install 'sanitify[yaml]'``).
+    """
+    if isinstance(source, (dict, list)):
+        return source
+
+    if isinstance(source, Path) or (isinstance(source, str) and _looks_like_path(source)):
+        path = Path(source)
+        text = path.read_text(encoding="utf-8")
+        if path.suffix.lower() in (".yaml", ".yml"):
+            return _parse_yaml(text)
+        return json.loads(text)
+
+    if not isinstance(source, str):
+        raise TypeError("rule spec must be a dict, list, path or JSON/YAML text")
+    try:
+        return json.loads(source)
+    except json.JSONDecodeError:
+        return _parse_yaml(source)
+
+
+def _looks_like_path(text: str) -> bool:
+    return "\n" not in text and Path(text).suffix.lower() in (".json", ".yaml", ".yml")
+
+
+def _parse_yaml(text: str) -> RuleSpec:
+    try:
+        import yaml
+    except ImportError as exc:
+        raise ImportError(
+            "YAML rule specs require PyYAML. Install it with: pip install 'sanitify[yaml]'"
+        ) from exc
+    return yaml.safe_load(text)
+
+
+def _rule_entries(spec: RuleSpec) -> List[Dict[str, Any]]:
+    entries = spec.get("rules") if isinstance(spec, dict) else spec
+    if not isinstance(entries, list):
+        raise ValueError("rule spec must be a list of rules or a mapping with a 'rules' list")
+    for position, entry in enumerate(entries):
+        if not isinstance(entry, dict) or "rule" not in entry:
+            raise ValueError(f"rule spec entry {position} must be a mapping with a 'rule' key")
+    return entries
@@ -0,0 +1,185 @@
+from __future__ import annotations
+import math
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Optional
+
+# Confidence level of the intervals reported for sampled estimates.
+CONFIDENCE = 0.95
+_Z = 1.959963984540054
+
+
+class RowSample:
+    """
+    Rows drawn from a frame for heavy metrics.
+
+    ``positions`` are sorted row positions and ``weights`` the design
+    weight of each sampled row (how many population rows it stands for).
+    Uniform samples weigh every row alike; stratified samples weigh rows by
+    ``stratum size / stratum sample size``.
+    """
+
+    def __init__(
+        self,
+        positions: np.ndarray,
+        weights: np.ndarray,
+        population: int,
+        method: str,
+        stratify_by: Any = None,
+        strata: int = 1,
+    ):
+        self.positions = positions
+        self.weights = weights
+        self.population = population
+        self.method = method
+        self.stratify_by = stratify_by
+        self.strata = strata
+
+    @property
+    def size(self) -> int:
+        return int(self.positions.size)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "method": self.method,
+            "stratify_by": self.stratify_by,
+            "strata": int(self.strata),
+            "confidence": CONFIDENCE,
+        }
+
+
+def draw_sample(
+    df: pd.DataFrame,
+    size: int,
+    stratify_by: Any = None,
+    seed: int = 42,
+) -> RowSample:
+    """
+    Uniform sample of ``size`` rows without replacement, or a stratified
+    one when ``stratify_by`` names a key column.
+
+    Stratified samples allocate rows proportionally to stratum size
+    (largest remainders first) and keep at least one row per stratum;
+    missing keys form their own stratum.
+    """
+    rows = len(df)
+    rng = np.random.default_rng(seed)
+    size = min(size, rows)
+
+    if stratify_by is None:
+        positions = np.sort(rng.choice(rows, size=size, replace=False))
+        weights = np.full(size, rows / size if size else 0.0)
+        return RowSample(positions, weights, rows, "uniform")
+
+    if stratify_by not in df.columns:
+        raise KeyError(f"stratify_by column {stratify_by!r} not found")
+
+    codes, _ = pd.factorize(df[stratify_by], use_na_sentinel=False)
+    counts = np.bincount(codes)
+    if counts.size > size:
+        raise ValueError(
+            f"stratify_by column {stratify_by!r} has {counts.size} strata, "
+            f"more than the sample size {size}"
+        )
+
+    quotas = size * counts / rows
+    allocation = np.minimum(np.maximum(np.floor(quotas), 1), counts).astype(np.int64)
+    spare = size - int(allocation.sum())
+    if spare > 0:
+        room = allocation < counts
+        order = np.argsort(-(quotas - np.floor(quotas)) * room, kind="stable")
+        allocation[order[:spare]] += room[order[:spare]]
+
+    by_stratum = np.argsort(codes, kind="stable")
+    starts = np.r_[0, np.cumsum(counts)[:-1]]
+    picked, weights = [], []
+    for start, count, take in zip(starts, counts, allocation):
+        members = by_stratum[start:start + count]
+        picked.append(members[rng.choice(count, size=take, replace=False)])
+        weights.append(np.full(take, count / take))
+
+    positions = np.concatenate(picked)
+    order = np.argsort(positions, kind="stable")
+    return RowSample(
+        positions[order],
+        np.concatenate(weights)[order],
+        rows,
+        "stratified",
+        stratify_by=stratify_by,
+        strata=counts.size,
+    )
+
+
+def sample_estimates(
+    values: np.ndarray,
+    weights: np.ndarray,
+    population: int,
+) -> Optional[Dict[str, Any]]:
+    """
+    Weighted median and standard deviation of one column's sampled values
+    with normal-approximation confidence intervals.
+
+    ``population`` is the number of non-missing values in the full column
+    and drives the finite population correction. The median interval comes
+    from the quantiles ``0.5 -/+ z * sqrt(0.25 / n_eff)`` of the weighted
+    sample; the std interval from the large-sample variance of ``s**2``
+    (fourth central moment, delta method). None when every sampled value
+    is missing.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    keep = ~np.isnan(values)
+    values, weights = values[keep], np.asarray(weights, dtype=np.float64)[keep]
+    n = int(values.size)
+    if n == 0:
+        return None
+
+    order = np.argsort(values, kind="stable")
+    values, weights = values[order], weights[order]
+    total = float(weights.sum())
+    n_eff = total ** 2 / float((weights ** 2).sum())
+    fpc = max(1.0 - n / population, 0.0) if population else 0.0
+
+    # Midpoint plotting positions: with equal weights the 0.5 quantile is
+    # the usual median (mean of the two middle values for even n).
+    plotting = (np.cumsum(weights) - weights / 2) / total
+    median = float(np.interp(0.5, plotting, values))
+    half = _Z * math.sqrt(0.25 * fpc / n_eff)
+    median_interval = [
+        float(np.interp(0.5 - half, plotting, values)),
+        float(np.interp(0.5 + half, plotting, values)),
+    ]
+
+    estimates: Dict[str, Any] = {"size": n, "median": median, "median_interval": median_interval}
+    if n < 2:
+        estimates.update(std=float("nan"), std_interval=None)
+        return estimates
+
+    mean = float((weights * values).sum() / total)
+    deviations = values - mean
+    m2 = float((weights * deviations ** 2).sum() / total)
+    m4 = float((weights * deviations ** 4).sum() / total)
+    variance = m2 * n / (n - 1)
+    std = math.sqrt(variance)
+
+    variance_error = math.sqrt(max(m4 - variance ** 2 * (n - 3) / (n - 1), 0.0) * fpc / n_eff)
+    std_error = variance_error / (2 * std) if std > 0 else 0.0
+    estimates.update(
+        std=std,
+        std_interval=[max(std - _Z * std_error, 0.0), std + _Z * std_error],
+    )
+    return estimates
+
+
+def apply_estimates(col_profile: Dict[str, Any], estimates: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Replace the heavy metrics of ``col_profile`` with sample estimates and
+    record their confidence intervals under ``"sampled"``.
+    """
+    numeric = col_profile["numeric"]
+    entry: Dict[str, Any] = {"size": estimates["size"], "confidence": CONFIDENCE}
+    for metric in ("median", "std"):
+        if metric in estimates:
+            numeric[metric] = estimates[metric]
+            entry[metric] = estimates[f"{metric}_interval"]
+    col_profile["sampled"] = entry
+    return col_profile
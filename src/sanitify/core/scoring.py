@@ -23,6 +23,7 @@ class QualityScorer:
     - Deducts weighted penalties
     - Caps total penalty per rule
     - Fully explainable output
+    - Counts issues that rest on approximate (sketched) metrics
     """
 
     def __init__(
@@ -33,6 +34,17 @@ class QualityScorer:
         self.weights = weights or DEFAULT_WEIGHTS
         self.caps = caps or DEFAULT_CAPS
 
+    @classmethod
+    def from_plan(cls, plan: Any) -> "QualityScorer":
+        """
+        Scorer with the default weights and caps, overridden by those a
+        compiled ``RulePlan`` carries from its rule spec.
+        """
+        return cls(
+            weights={**DEFAULT_WEIGHTS, **plan.weights},
+            caps={**DEFAULT_CAPS, **plan.caps},
+        )
+
     def score(
             self,
             profile: Dict[str,Any],
@@ -41,6 +53,7 @@ class QualityScorer:
         
         base_score = 100
         penalties_by_rule: Dict[str,Any] = {}
+        approximate_by_rule: Dict[str,int] = {}
 
         for issue in issues:
             rule = issue['rule']
@@ -49,6 +62,11 @@ class QualityScorer:
             penalties_by_rule.setdefault(rule,0)
             penalties_by_rule[rule] += weight
 
+            # issues derived from sketched metrics (approximate profiling)
+            approximate_by_rule.setdefault(rule,0)
+            if issue.get("approximate"):
+                approximate_by_rule[rule] += 1
+
         #apply caps
         breakdown = []
         total_penalty = 0
@@ -62,6 +80,7 @@ class QualityScorer:
                 "raw_penalty": raw_penalty,
                 "applied_penalty": applied_penalty,
                 "cap": cap,
+                "approximate_issues": approximate_by_rule[rule],
             })
 
             total_penalty += applied_penalty
@@ -0,0 +1,460 @@
+from __future__ import annotations
+import math
+import pandas as pd
+import numpy as np
+from typing import Any, List, Optional, Tuple
+
+
+# Floats within this magnitude hold every integer exactly.
+_EXACT_FLOAT_INT = 2 ** 53
+
+# Key of a missing value; the hash of a float64 NaN.
+_MISSING_KEY = pd.util.hash_array(np.array([np.nan]))[0]
+
+
+def numeric_keys(values: np.ndarray) -> np.ndarray:
+    """
+    uint64 keys of numeric or boolean ``values`` under which equal numbers
+    match whatever their dtype.
+
+    Integers keep their 64-bit pattern and floats that are integral within
+    ``+-2 ** 53`` (so exactly convertible) use the pattern of that integer;
+    other floats, and NaN, are keyed by a hash of their float64 bits.
+    """
+    if values.dtype.kind in "biu":
+        integer = np.uint64 if values.dtype.kind == "u" else np.int64
+        return values.astype(integer, copy=False).view(np.uint64)
+
+    values = values.astype(np.float64, copy=False)
+    keys = pd.util.hash_array(values)
+    with np.errstate(invalid="ignore"):
+        integral = (np.abs(values) <= _EXACT_FLOAT_INT) & (values == np.trunc(values))
+    keys[integral] = values[integral].astype(np.int64).view(np.uint64)
+    return keys
+
+
+def normalize_for_hashing(series: pd.Series) -> pd.Series:
+    """
+    Numeric and boolean values are replaced by their ``numeric_keys`` so
+    that a column read as int64 in one chunk and float64 in the next hashes
+    identically, without rounding large integers through float64.
+    """
+    if not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_complex_dtype(series):
+        return series
+
+    if isinstance(series.dtype, np.dtype):
+        keys = numeric_keys(series.to_numpy())
+    elif pd.api.types.is_float_dtype(series):
+        keys = numeric_keys(series.to_numpy(dtype=np.float64, na_value=np.nan))
+    else:
+        # Nullable integers and booleans: missing values get the NaN key.
+        unsigned = pd.api.types.is_unsigned_integer_dtype(series)
+        keys = numeric_keys(series.to_numpy(dtype=np.uint64 if unsigned else np.int64, na_value=0))
+        keys = np.where(series.isna().to_numpy(), _MISSING_KEY, keys)
+    return pd.Series(keys, index=series.index, name=series.name, copy=False)
+
+
+def hash_values(series: pd.Series) -> np.ndarray:
+    """
+    64-bit value hashes that are stable across chunks. Missing values are
+    dropped.
+    """
+    clean = normalize_for_hashing(series.dropna())
+    return pd.util.hash_pandas_object(clean, index=False).to_numpy()
+
+
+class HyperLogLog:
+    """
+    Mergeable distinct-count sketch.
+
+    Keeps an exact set of hashes until ``exact_limit`` distinct values are
+    seen, then switches to ``2 ** precision`` HyperLogLog registers with a
+    relative standard error of ``1.04 / sqrt(2 ** precision)``.
+    """
+
+    def __init__(self, precision: int = 14, exact_limit: int = 4096):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+
+        self.precision = precision
+        self.exact_limit = exact_limit
+        self._exact: Optional[np.ndarray] = np.empty(0, dtype=np.uint64)
+        self._registers: Optional[np.ndarray] = None
+
+    # ------------------------
+    # Public API
+    # ------------------------
+    @property
+    def is_exact(self) -> bool:
+        return self._registers is None
+
+    @property
+    def relative_error(self) -> float:
+        if self.is_exact:
+            return 0.0
+        return 1.04 / math.sqrt(1 << self.precision)
+
+    def update(self, series: pd.Series) -> None:
+        self.update_hashes(hash_values(series))
+
+    def update_hashes(self, hashes: np.ndarray) -> None:
+        if hashes.size == 0:
+            return
+
+        if self._registers is not None:
+            self._add_to_registers(hashes)
+            return
+
+        # Grow the exact set in bounded slices so that a high-cardinality
+        # input switches to registers without sorting all of its hashes.
+        step = max(self.exact_limit, 1024)
+        for start in range(0, hashes.size, step):
+            self._exact = np.union1d(self._exact, hashes[start:start + step])
+            if self._exact.size > self.exact_limit:
+                self._to_registers()
+                self._add_to_registers(hashes[start + step:])
+                return
+
+    def merge(self, other: "HyperLogLog") -> None:
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+
+        if other._registers is None:
+            self.update_hashes(other._exact)
+            return
+
+        if self._registers is None:
+            self._to_registers()
+        np.maximum(self._registers, other._registers, out=self._registers)
+
+    def count(self) -> int:
+        if self._registers is None:
+            return int(self._exact.size)
+
+        m = float(1 << self.precision)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self._registers.astype(np.int64)))
+
+        zeros = int(np.count_nonzero(self._registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+
+        return int(round(estimate))
+
+    # ------------------------
+    # Registers
+    # ------------------------
+    def _to_registers(self) -> None:
+        self._registers = np.zeros(1 << self.precision, dtype=np.uint8)
+        self._add_to_registers(self._exact)
+        self._exact = None
+
+    def _add_to_registers(self, hashes: np.ndarray) -> None:
+        suffix_bits = 64 - self.precision
+        index = (hashes >> np.uint64(suffix_bits)).astype(np.intp)
+        suffix = hashes & np.uint64((1 << suffix_bits) - 1)
+
+        # Rank of the leftmost set bit in the suffix; bit lengths below
+        # 2 ** 53 are exact through the float64 exponent.
+        _, bit_length = np.frexp(suffix.astype(np.float64))
+        rank = (suffix_bits - bit_length + 1).astype(np.uint8)
+
+        np.maximum.at(self._registers, index, rank)
+
+
+class QuantileSketch:
+    """
+    Mergeable KLL-style quantile sketch.
+
+    Values are buffered in levels of capacity ``k``; a full level is sorted
+    and every other item is promoted to the next level with twice the weight.
+    Each compaction at level ``h`` shifts any rank by at most ``2 ** h``, so
+    the accumulated shift divided by the count is a deterministic bound on
+    the normalized rank error (``rank_error``). Until the first compaction
+    the sketch holds every value and quantiles are exact.
+
+    Memory is bounded by ``batch_size`` plus ``k`` items per level.
+    """
+
+    def __init__(self, k: int = 2048, seed: int = 42, batch_size: int = 1 << 16):
+        self.k = k
+        self.batch_size = batch_size
+        self.count = 0
+        self._levels: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._error_weight = 0
+        self._rng = np.random.default_rng(seed)
+
+    # ------------------------
+    # Public API
+    # ------------------------
+    @property
+    def is_exact(self) -> bool:
+        return self._error_weight == 0
+
+    @property
+    def rank_error(self) -> float:
+        if self.count == 0:
+            return 0.0
+        return self._error_weight / self.count
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+
+        self.count += int(values.size)
+
+        # Large inputs are absorbed in slices so no sort ever spans more
+        # than ``batch_size`` values.
+        for start in range(0, values.size, self.batch_size):
+            piece = values[start:start + self.batch_size]
+            self._levels[0] = np.concatenate([self._levels[0], piece])
+            self._compact()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0, dtype=np.float64))
+
+        for h, items in enumerate(other._levels):
+            self._levels[h] = np.concatenate([self._levels[h], items])
+
+        self.count += other.count
+        self._error_weight += other._error_weight
+        self._compact()
+
+    def quantile(self, q: float) -> Optional[float]:
+        if self.count == 0:
+            return None
+
+        if self.is_exact:
+            return float(np.quantile(self._levels[0], q))
+
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([
+            np.full(level.size, 1 << h, dtype=np.int64)
+            for h, level in enumerate(self._levels)
+        ])
+        order = np.argsort(items, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        target = q * cumulative[-1]
+        position = int(np.searchsorted(cumulative, target, side="left"))
+        return float(items[order[min(position, items.size - 1)]])
+
+    # ------------------------
+    # Compaction
+    # ------------------------
+    def _compact(self) -> None:
+        h = 0
+        while h < len(self._levels):
+            level = self._levels[h]
+            if level.size > self.k:
+                level = np.sort(level)
+                keep = level[-1:] if level.size % 2 else level[:0]
+                paired = level[:level.size - keep.size]
+                promoted = paired[int(self._rng.integers(2))::2]
+
+                if h + 1 == len(self._levels):
+                    self._levels.append(np.empty(0, dtype=np.float64))
+
+                self._levels[h] = keep
+                self._levels[h + 1] = np.concatenate([self._levels[h + 1], promoted])
+                self._error_weight += 1 << h
+            h += 1
+
+
+class ReservoirSample:
+    """
+    Mergeable uniform sample of at most ``size`` values from a stream.
+
+    Chunks are absorbed with a vectorized Algorithm R: the ``i``-th value
+    seen replaces a random slot with probability ``size / (i + 1)``.
+    Merging two reservoirs draws how many values come from each side from
+    the hypergeometric distribution, so the result is again a uniform
+    sample of the combined stream.
+    """
+
+    def __init__(self, size: int = 10_000, seed: int = 42):
+        if size < 1:
+            raise ValueError("size must be positive")
+        self.size = size
+        self.count = 0
+        self._values = np.empty(0, dtype=np.float64)
+        self._rng = np.random.default_rng(seed)
+
+    # ------------------------
+    # Public API
+    # ------------------------
+    @property
+    def is_exact(self) -> bool:
+        """
+        True while the reservoir still holds every value seen.
+        """
+        return self.count <= self.size
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+
+        fill = min(self.size - self._values.size, values.size)
+        if fill > 0:
+            self._values = np.concatenate([self._values, values[:fill]])
+            values = values[fill:]
+            self.count += fill
+
+        if values.size:
+            seen = self.count + np.arange(1, values.size + 1)
+            slots = self._rng.integers(0, seen)
+            accepted = slots < self.size
+            # Later values overwrite earlier ones in the same slot, as in
+            # the sequential algorithm.
+            self._values[slots[accepted]] = values[accepted]
+            self.count += int(values.size)
+
+    def merge(self, other: "ReservoirSample") -> None:
+        if other.count == 0:
+            return
+        if self.count + other.count <= self.size:
+            self._values = np.concatenate([self._values, other._values])
+            self.count += other.count
+            return
+
+        take = min(self.size, self.count + other.count)
+        from_self = int(self._rng.hypergeometric(self.count, other.count, take))
+        self._values = np.concatenate([
+            self._rng.choice(self._values, size=from_self, replace=False),
+            self._rng.choice(other._values, size=take - from_self, replace=False),
+        ])
+        self.count += other.count
+
+
+class TopK:
+    """
+    Mergeable heavy-hitter summary (Misra-Gries) of the most frequent values.
+
+    Every distinct value is counted exactly until more than ``capacity``
+    are held. Each prune then subtracts the ``(capacity + 1)``-th largest
+    count from all counters and drops those that reach zero, so a kept
+    count is low by at most ``error`` <= seen / (capacity + 1), and any
+    value more frequent than that is kept. Until the first prune the
+    summary is exact.
+
+    Memory is bounded by ``batch_size`` rows plus ``capacity`` counters.
+    """
+
+    def __init__(self, k: int = 10, capacity: int = 1024, batch_size: int = 1 << 16):
+        if capacity < k:
+            raise ValueError("capacity must be at least k")
+        self.k = k
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.count = 0
+        self.error = 0
+        self._counts = pd.Series(dtype=np.int64)
+
+    # ------------------------
+    # Public API
+    # ------------------------
+    @property
+    def is_exact(self) -> bool:
+        return self.error == 0
+
+    @property
+    def relative_error(self) -> float:
+        """
+        Largest undercount of any value, as a share of the values seen.
+        """
+        return self.error / self.count if self.count else 0.0
+
+    def update(self, series: pd.Series) -> None:
+        for start in range(0, len(series), self.batch_size):
+            self.update_counts(value_counts(series.iloc[start:start + self.batch_size]))
+
+    def update_counts(self, counts: pd.Series) -> None:
+        """
+        Absorb exact ``value -> count`` pairs, e.g. from ``value_counts``.
+        """
+        self.count += int(counts.sum())
+        self._add(counts)
+
+    def merge(self, other: "TopK") -> None:
+        self.count += other.count
+        self.error += other.error
+        self._add(other._counts)
+
+    def top(self, n: Optional[int] = None) -> List[Tuple[Any, int]]:
+        """
+        The ``n`` (default ``k``) most frequent values as ``(value, count)``.
+        """
+        return top_values(self._counts, self.k if n is None else n)
+
+    def _add(self, counts: pd.Series) -> None:
+        if counts.empty:
+            return
+        merged = counts if self._counts.empty else self._counts.add(counts, fill_value=0)
+        merged = merged.astype(np.int64)
+        if len(merged) > self.capacity:
+            values = merged.to_numpy()
+            cut = int(np.partition(values, len(values) - self.capacity - 1)[len(values) - self.capacity - 1])
+            merged = merged[values > cut] - cut
+            self.error += cut
+        self._counts = merged
+
+
+# Tied candidates beyond this are ordered by first occurrence, not value.
+_RANK_SORT_LIMIT = 4096
+
+
+def value_counts(series: pd.Series) -> pd.Series:
+    """
+    Counts of the non-missing values of ``series`` (unused categories
+    dropped), in first-occurrence order.
+    """
+    counts = series.value_counts(dropna=True, sort=False)
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        counts = counts[counts.to_numpy() > 0]
+    return counts
+
+
+def top_values(counts: pd.Series, n: int) -> List[Tuple[Any, int]]:
+    """
+    The ``n`` largest entries of ``counts`` as ``(value, count)`` pairs,
+    most frequent first and equal counts in ascending value order (as
+    ``Series.mode`` orders them) where the values compare.
+    """
+    if counts.empty or n <= 0:
+        return []
+    values = counts.to_numpy()
+    if len(values) > n:
+        kth = np.partition(values, len(values) - n)[len(values) - n]
+        counts = counts[values >= kth]
+
+    if len(counts) > _RANK_SORT_LIMIT:
+        ranked = list(counts.sort_values(ascending=False, kind="stable").items())
+    else:
+        items = list(counts.items())
+        try:
+            ranked = sorted(items, key=lambda item: (-item[1], item[0]))
+        except TypeError:
+            ranked = sorted(items, key=lambda item: -item[1])
+    return [(value, int(count)) for value, count in ranked[:n]]
+
+
+def profile_mode(meta: dict) -> Any:
+    """
+    Most frequent value of a column profile from its exact ``top_values``,
+    or None when they are sketched, absent or tied at the top (the tie
+    order of ``Series.mode`` cannot be checked then).
+    """
+    top = meta.get("top_values")
+    if not top or "top_values" in (meta.get("approximate") or {}):
+        return None
+    if len(top) > 1 and top[1][1] == top[0][1]:
+        return None
+    return top[0][0]
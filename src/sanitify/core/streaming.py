@@ -0,0 +1,369 @@
+from __future__ import annotations
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, Iterable, List, Optional
+
+from sanitify.core.profiler import DataProfiler
+from sanitify.core.sampling import CONFIDENCE, apply_estimates, sample_estimates
+from sanitify.core.sketches import HyperLogLog, QuantileSketch, ReservoirSample, TopK
+from sanitify.core.batch import TOP_K, EMPTY_NUMERIC, add_top_values, approximation_errors, base_metrics
+from sanitify.core.temporal import TemporalSummary, is_temporal
+from sanitify.core.duplicates import (
+    DEFAULT_MEMORY_LIMIT,
+    DuplicateCounter,
+    detection_info,
+    row_fingerprints,
+)
+from sanitify.utils.tracing import NULL_TRACER
+
+
+class ColumnAccumulator:
+    """
+    Mergeable per-column profile state.
+
+    Tracks counts, Welford mean/variance, min/max, a distinct-count sketch,
+    a quantile sketch and, for non-numeric values, a top-k summary
+    (datetime and timedelta values get a ``TemporalSummary`` instead). Two
+    accumulators built over consecutive chunks merge into the accumulator
+    of their concatenation.
+
+    With ``sample_size`` a reservoir sample of the values replaces the
+    quantile sketch, and the median comes with a confidence interval.
+    """
+
+    def __init__(
+        self,
+        precision: int = 14,
+        exact_limit: int = 4096,
+        k: int = 2048,
+        sample_size: Optional[int] = None,
+    ):
+        self.rows = 0
+        self.missing = 0
+        self.memory_bytes = 0
+        self.dtypes: List[str] = []
+
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+        self.distinct = HyperLogLog(precision=precision, exact_limit=exact_limit)
+        self.frequent = TopK(k=TOP_K)
+        self.temporal = TemporalSummary()
+        self.quantiles: Optional[QuantileSketch] = None
+        self.reservoir: Optional[ReservoirSample] = None
+        if sample_size is None:
+            self.quantiles = QuantileSketch(k=k)
+        else:
+            self.reservoir = ReservoirSample(size=sample_size)
+
+    # ------------------------
+    # Accumulation
+    # ------------------------
+    def update(self, series: pd.Series) -> None:
+        dtype = str(series.dtype)
+        if dtype not in self.dtypes:
+            self.dtypes.append(dtype)
+
+        missing = int(series.isna().sum())
+        self.rows += int(len(series))
+        self.missing += missing
+        self.memory_bytes += int(series.memory_usage(deep=True, index=False))
+        self.distinct.update(series)
+
+        if missing == len(series):
+            return
+        if is_temporal(series.dtype):
+            self.temporal.update(series)
+            return
+        if not _is_numeric(series):
+            self.frequent.update(series)
+            return
+
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values[~np.isnan(values)]
+
+        chunk_mean = float(values.mean())
+        chunk_m2 = float(((values - chunk_mean) ** 2).sum())
+        self._combine_moments(int(values.size), chunk_mean, chunk_m2)
+
+        chunk_min, chunk_max = float(values.min()), float(values.max())
+        self.min = chunk_min if self.min is None else min(self.min, chunk_min)
+        self.max = chunk_max if self.max is None else max(self.max, chunk_max)
+
+        self._heavy().update(values)
+
+    def merge(self, other: "ColumnAccumulator") -> None:
+        for dtype in other.dtypes:
+            if dtype not in self.dtypes:
+                self.dtypes.append(dtype)
+
+        self.rows += other.rows
+        self.missing += other.missing
+        self.memory_bytes += other.memory_bytes
+        self.distinct.merge(other.distinct)
+        self.frequent.merge(other.frequent)
+        self.temporal.merge(other.temporal)
+
+        if other.n:
+            self._combine_moments(other.n, other.mean, other.m2)
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+            self._heavy().merge(other._heavy())
+
+    def _heavy(self):
+        # The structure that holds values for the median.
+        return self.quantiles if self.reservoir is None else self.reservoir
+
+    def _combine_moments(self, n: int, mean: float, m2: float) -> None:
+        # Chan et al. pairwise update of Welford's running moments.
+        total = self.n + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta * delta * self.n * n / total
+        self.n = total
+
+    # ------------------------
+    # Output
+    # ------------------------
+    @property
+    def dtype(self) -> str:
+        if len(self.dtypes) == 1:
+            return self.dtypes[0]
+        try:
+            resolved = [np.dtype(d) for d in self.dtypes]
+        except TypeError:
+            return "object"
+        if all(d.kind in "biuf" for d in resolved):
+            return str(np.result_type(*resolved))
+        return "object"
+
+    def to_profile(self, total_rows: int) -> Dict[str, Any]:
+        # Rows from chunks that did not contain this column count as missing.
+        missing = self.missing + (total_rows - self.rows)
+        dtype = self.dtype
+        col_profile = base_metrics(dtype, missing, self.distinct.count(), total_rows)
+
+        if _is_numeric_dtype_name(dtype) or missing == total_rows:
+            if self.n == 0:
+                col_profile["numeric"] = dict(EMPTY_NUMERIC)
+            else:
+                col_profile["numeric"] = {
+                    "mean": float(self.mean),
+                    "std": float(np.sqrt(self.m2 / (self.n - 1))) if self.n > 1 else float("nan"),
+                    "min": float(self.min),
+                    "max": float(self.max),
+                    "median": self.quantiles.quantile(0.5) if self.quantiles is not None else None,
+                }
+                if self.reservoir is not None:
+                    self._apply_reservoir(col_profile)
+
+        elif self.frequent.count:
+            add_top_values(col_profile, self.frequent.top())
+
+        temporal = is_temporal(dtype)
+        if temporal:
+            col_profile["temporal"] = self.temporal.to_dict()
+
+        errors = approximation_errors(self.distinct, self.quantiles)
+        if col_profile.get("top_values") and not self.frequent.is_exact:
+            errors["top_values"] = self.frequent.relative_error
+        if temporal and self.temporal.error is not None:
+            errors["temporal"] = self.temporal.error
+        if errors:
+            col_profile["approximate"] = errors
+        return col_profile
+
+    def _apply_reservoir(self, col_profile: Dict[str, Any]) -> None:
+        estimates = sample_estimates(
+            self.reservoir.values, np.ones(self.reservoir.values.size), self.n
+        )
+        if self.reservoir.is_exact:
+            col_profile["numeric"]["median"] = estimates["median"]
+            return
+        # The standard deviation stays exact from the running moments.
+        estimates.pop("std")
+        apply_estimates(col_profile, estimates)
+
+
+class ChunkedProfiler:
+    """
+    Streaming dataset profiler.
+
+    Builds the same ``profile_version`` dictionary as ``DataProfiler`` from
+    an iterable of DataFrame chunks. Only one chunk is held in memory at a
+    time; everything else lives in mergeable accumulators whose size does not
+    depend on the number of rows. Distinct counts and medians are exact on
+    small data and approximate once the sketches saturate. Duplicates are
+    always exact: row fingerprints spill to ``spill_dir`` once they exceed
+    ``duplicate_memory_limit`` bytes.
+
+    The profiler doubles as incremental profile state: ``update()`` merges
+    appended rows without rescanning earlier ones, and ``refresh()``
+    rebuilds only the columns a fix changed.
+
+    ``sample_size`` swaps the quantile sketches for per-column reservoir
+    samples of that many values: medians then carry a confidence interval
+    under ``"sampled"`` instead of a rank-error bound.
+    """
+
+    PROFILE_VERSION = DataProfiler.PROFILE_VERSION
+
+    def __init__(
+        self,
+        precision: int = 14,
+        exact_limit: int = 4096,
+        quantile_k: int = 2048,
+        tracer: Any = NULL_TRACER,
+        duplicate_memory_limit: int = DEFAULT_MEMORY_LIMIT,
+        spill_dir: Optional[str] = None,
+        sample_size: Optional[int] = None,
+    ):
+        self._precision = precision
+        self._sample_size = sample_size
+        self._tracer = tracer
+        self._exact_limit = exact_limit
+        self._quantile_k = quantile_k
+        self._duplicate_memory_limit = duplicate_memory_limit
+        self._spill_dir = spill_dir
+
+        self._rows = 0
+        self._index_bytes = 0
+        self._columns: Dict[Any, ColumnAccumulator] = {}
+        self._duplicates = self._new_duplicate_counter()
+
+    # ------------------------
+    # Public API
+    # ------------------------
+    def update(self, chunk: pd.DataFrame) -> "ChunkedProfiler":
+        if not isinstance(chunk, pd.DataFrame):
+            raise TypeError("ChunkedProfiler expects pandas DataFrame chunks")
+
+        tracer = self._tracer
+        with tracer.span("profile.chunk", rows=len(chunk)):
+            self._rows += int(len(chunk))
+            self._index_bytes += int(chunk.index.memory_usage(deep=True))
+
+            for col in chunk.columns:
+                if col not in self._columns:
+                    self._columns[col] = self._new_accumulator()
+                with tracer.span("profile.column", column=str(col)):
+                    self._columns[col].update(chunk[col])
+
+            with tracer.span("profile.duplicates"):
+                self._duplicates.update(row_fingerprints(chunk))
+        return self
+
+    def consume(self, chunks: Iterable[pd.DataFrame]) -> "ChunkedProfiler":
+        for chunk in chunks:
+            self.update(chunk)
+        return self
+
+    def refresh(self, df: pd.DataFrame, columns: Iterable[Any]) -> "ChunkedProfiler":
+        """
+        Rebuild the state of ``columns`` from ``df`` after they were edited.
+
+        ``df`` must hold every row profiled so far, in order. Columns it no
+        longer has are dropped and all other columns keep their state. The
+        duplicate count is recounted from ``df`` because row fingerprints
+        span every column.
+        """
+        if len(df) != self._rows:
+            raise ValueError("refresh expects a frame holding exactly the profiled rows")
+
+        columns = set(columns)
+        tracer = self._tracer
+        with tracer.span("profile.refresh", columns=len(columns)):
+            accumulators: Dict[Any, ColumnAccumulator] = {}
+            for col in df.columns:
+                acc = self._columns.get(col)
+                if acc is None or col in columns:
+                    acc = self._new_accumulator()
+                    with tracer.span("profile.column", column=str(col)):
+                        acc.update(df[col])
+                accumulators[col] = acc
+            self._columns = accumulators
+
+            with tracer.span("profile.duplicates"):
+                self._duplicates.close()
+                self._duplicates = self._new_duplicate_counter().update_frame(df)
+        return self
+
+    def merge(self, other: "ChunkedProfiler") -> "ChunkedProfiler":
+        for col, acc in other._columns.items():
+            if col not in self._columns:
+                self._columns[col] = self._new_accumulator()
+            self._columns[col].merge(acc)
+
+        self._rows += other._rows
+        self._index_bytes += other._index_bytes
+        self._duplicates.merge(other._duplicates)
+        return self
+
+    def run(self) -> Dict[str, Any]:
+        with self._tracer.span("profile.finalize", rows=self._rows):
+            return {
+                "profile_version": self.PROFILE_VERSION,
+                "dataset": self._dataset_summary(),
+                "columns": self._column_profiles(),
+                "duplicates": self._duplicates.count(),
+                "duplicate_detection": detection_info(
+                    "fingerprint", True, None, self._duplicates.spilled
+                ),
+            }
+
+    # ------------------------
+    # Dataset Level
+    # ------------------------
+    def _dataset_summary(self) -> Dict[str, Any]:
+        sampled = any(
+            acc.reservoir is not None and not acc.reservoir.is_exact
+            for acc in self._columns.values()
+        )
+        return {
+            "rows": int(self._rows),
+            "columns": int(len(self._columns)),
+            "memory_bytes": int(
+                self._index_bytes + sum(acc.memory_bytes for acc in self._columns.values())
+            ),
+            "memory_mode": "exact",
+            "memory_error_bytes": 0.0,
+            "sampled": sampled,
+            "sample_size": int(min(self._sample_size, self._rows)) if sampled else int(self._rows),
+            "sampling": {
+                "method": "reservoir",
+                "stratify_by": None,
+                "strata": 1,
+                "confidence": CONFIDENCE,
+            } if sampled else None,
+        }
+
+    def _column_profiles(self) -> Dict[str, Any]:
+        return {
+            col: acc.to_profile(self._rows)
+            for col, acc in self._columns.items()
+        }
+
+    def _new_duplicate_counter(self) -> DuplicateCounter:
+        return DuplicateCounter(memory_limit=self._duplicate_memory_limit, spill_dir=self._spill_dir)
+
+    def _new_accumulator(self) -> ColumnAccumulator:
+        return ColumnAccumulator(
+            precision=self._precision,
+            exact_limit=self._exact_limit,
+            k=self._quantile_k,
+            sample_size=self._sample_size,
+        )
+
+
+def _is_numeric(series: pd.Series) -> bool:
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_complex_dtype(series)
+
+
+def _is_numeric_dtype_name(dtype: str) -> bool:
+    try:
+        return _is_numeric(pd.Series([], dtype=dtype))
+    except (TypeError, ValueError):
+        return False
@@ -1,15 +1,36 @@
 from __future__ import annotations
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+import pandas as pd
+
+from sanitify.core.optimize import memory_suggestions
+from sanitify.core.sketches import profile_mode
 
 class DeterministicSuggestionEngine:
     """
     Generates deteministic fix suggestions based on quality issues and dataset profile metdata.
+
+    With ``memory_fixes`` it also proposes memory optimizations (downcast,
+    datetime casts, category, Arrow strings, sparse) for columns no other
+    suggestion touches, each with ``projected_savings_bytes`` of at least
+    ``min_memory_savings``. String columns are only sized when ``df`` is
+    passed; ``detect_dates=False`` skips checking them for dates.
+
+    ``impute_mode`` suggestions carry the profiled mode as their ``value``
+    param when the column's exact ``top_values`` settle it, so applying
+    them needs no second pass over the column.
     """
 
+    def __init__(self, memory_fixes: bool = True, min_memory_savings: int = 1 << 20, detect_dates: bool = True):
+        self.memory_fixes = memory_fixes
+        self.min_memory_savings = min_memory_savings
+        self.detect_dates = detect_dates
+
     def generate(
             self,
             profile: Dict[str, Any],
             issues: List[Dict[str, Any]],
+            df: Optional[pd.DataFrame] = None,
     ) -> List[Dict[str, Any]]:
         
         suggestions = []
@@ -23,6 +44,7 @@ class DeterministicSuggestionEngine:
             if rule == "high_missing" and column:
                 col_meta = profile["columns"][column]
                 dtype = col_meta["dtype"]
+                params = {}
 
                 if col_meta["missing_pct"] == 1.0:
                     op = "drop_column"
@@ -37,13 +59,19 @@ class DeterministicSuggestionEngine:
                     op = "impute_mode"
                     reason = "Categorical column with high missing ratio"
                     confidence = 1.0
+                    mode = profile_mode(col_meta)
+                    if mode is not None:
+                        params = {"value": mode}
+                        present = profile["dataset"]["rows"] - col_meta["missing"]
+                        share = col_meta["top_values"][0][1] / present if present else 0.0
+                        reason += f"; mode {mode!r} covers {share:.1%} of present values"
 
                 key = (column, op)
                 if key not in seen:
                     suggestions.append({
                         "column": column,
                         "operation": op,
-                        "params": {},
+                        "params": params,
                         "confidence": confidence,
                         "reason": reason,
                     })
@@ -96,4 +124,13 @@ class DeterministicSuggestionEngine:
                     "reason": reason,
                 })
                 seen.add(key)
+
+        if self.memory_fixes:
+            suggestions.extend(memory_suggestions(
+                profile,
+                df,
+                min_savings_bytes=self.min_memory_savings,
+                skip={column for column, _ in seen},
+                detect_dates=self.detect_dates,
+            ))
         return suggestions
\ No newline at end of file
@@ -0,0 +1,123 @@
+from __future__ import annotations
+import numpy as np
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+# Metrics lifted from each column profile, with their array dtype and the
+# value used when a column does not carry the metric.
+_BASE_METRICS = (
+    ("missing", np.int64, 0),
+    ("missing_pct", np.float64, 0.0),
+    ("unique", np.int64, 0),
+    ("is_constant", np.bool_, False),
+)
+NUMERIC_METRICS = ("mean", "std", "min", "max", "median")
+
+# Metrics whose sketch error bounds are recorded under "approximate".
+_ERROR_METRICS = ("unique", "median")
+
+
+class ProfileTable:
+    """
+    Columnar view of a profile: one row per profiled column, one NumPy
+    array per metric.
+
+    ``table["missing_pct"]`` is a float64 array aligned with
+    ``table.columns``. Numeric metrics are NaN for columns without them;
+    ``is_numeric`` marks which columns have them. Sketch error bounds from
+    ``"approximate"`` are exposed as ``<metric>_error`` (NaN when exact).
+    Rules can evaluate every column with a few array operations instead of
+    a Python loop per rule.
+
+    ``metric in table`` tells whether the profile actually carries a
+    metric (for some column, or at dataset level for ``rows`` and
+    ``duplicates``); absent metrics still have default-filled arrays.
+    """
+
+    def __init__(
+        self,
+        columns: List[Any],
+        metrics: Dict[str, np.ndarray],
+        rows: int,
+        duplicates: Optional[int],
+        available: Optional[Set[str]] = None,
+    ):
+        self.columns = np.empty(len(columns), dtype=object)
+        self.columns[:] = columns
+        self.rows = rows
+        self.duplicates = duplicates
+        self._metrics = metrics
+        self.available = set(metrics) if available is None else set(available)
+
+    @classmethod
+    def from_profile(cls, profile: Dict[str, Any]) -> "ProfileTable":
+        columns = list(profile["columns"])
+        metas = list(profile["columns"].values())
+        size = len(metas)
+
+        metrics: Dict[str, np.ndarray] = {}
+        available: Set[str] = {"dtype", "is_numeric", "rows"}
+        for name, dtype, default in _BASE_METRICS:
+            if any(name in meta for meta in metas):
+                available.add(name)
+            metrics[name] = np.fromiter(
+                (meta.get(name, default) for meta in metas), dtype=dtype, count=size
+            )
+
+        dtypes = np.empty(size, dtype=object)
+        dtypes[:] = [meta.get("dtype") for meta in metas]
+        metrics["dtype"] = dtypes
+
+        numerics = [meta.get("numeric") for meta in metas]
+        metrics["is_numeric"] = np.fromiter(
+            (numeric is not None for numeric in numerics), dtype=np.bool_, count=size
+        )
+        for name in NUMERIC_METRICS:
+            metrics[name] = np.fromiter(
+                (_number(numeric.get(name) if numeric else None) for numeric in numerics),
+                dtype=np.float64,
+                count=size,
+            )
+            if any(numeric and name in numeric for numeric in numerics):
+                available.add(name)
+
+        errors = [meta.get("approximate") or {} for meta in metas]
+        for name in _ERROR_METRICS:
+            metrics[f"{name}_error"] = np.fromiter(
+                (_number(error.get(name)) for error in errors), dtype=np.float64, count=size
+            )
+            available.add(f"{name}_error")
+
+        duplicates = profile.get("duplicates")
+        if duplicates is not None:
+            available.add("duplicates")
+
+        return cls(
+            columns,
+            metrics,
+            rows=int(profile["dataset"]["rows"]),
+            duplicates=None if duplicates is None else int(duplicates),
+            available=available,
+        )
+
+    def __len__(self) -> int:
+        return int(self.columns.size)
+
+    def __getitem__(self, metric: str) -> np.ndarray:
+        try:
+            return self._metrics[metric]
+        except KeyError:
+            raise KeyError(f"Unknown profile metric: {metric!r}") from None
+
+    def __contains__(self, metric: str) -> bool:
+        return metric in self.available
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._metrics)
+
+    @property
+    def metrics(self) -> List[str]:
+        return list(self._metrics)
+
+
+def _number(value: Any) -> float:
+    return np.nan if value is None else float(value)
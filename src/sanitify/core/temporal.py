@@ -0,0 +1,233 @@
+from __future__ import annotations
+import re
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from sanitify.core.sketches import QuantileSketch
+
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:  # pandas < 2.2
+    guess_datetime_format = None
+
+# Items kept by the gap sketch of streamed and approximate profiles.
+GAP_SKETCH_K = 2048
+
+EMPTY_TEMPORAL = {
+    "min": None,
+    "max": None,
+    "span_seconds": None,
+    "monotonic_increasing": None,
+    "monotonic_decreasing": None,
+    "median_gap_seconds": None,
+    "max_gap_seconds": None,
+}
+
+_NAT = np.iinfo(np.int64).min
+
+# Year-first or day/month-first dates with an optional time and offset.
+# Bare numbers never match, so "2021" or "20210101" stay strings.
+_DATE_LIKE = re.compile(
+    r"(?:\d{4}[-/.]\d{1,2}[-/.]\d{1,2}|\d{1,2}[-/.]\d{1,2}[-/.]\d{4})"
+    r"(?:[T ]\d{1,2}:\d{2}(?::\d{2}(?:\.\d{1,9})?)?)?"
+    r"(?:Z|[+-]\d{2}:?\d{2})?"
+)
+
+
+def is_temporal(dtype: Any) -> bool:
+    """
+    Whether ``dtype`` (a dtype or its name) is a datetime, tz-aware
+    datetime or timedelta dtype with an int64 representation.
+    """
+    if isinstance(dtype, str):
+        try:
+            dtype = pd.api.types.pandas_dtype(dtype)
+        except TypeError:
+            return False
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return True
+    return isinstance(dtype, np.dtype) and dtype.kind in "mM"
+
+
+def int64_ticks(series: pd.Series) -> Tuple[np.ndarray, str, str, Optional[str]]:
+    """
+    Present values of a temporal ``series`` as int64 ticks in row order,
+    with the dtype kind (``"M"`` or ``"m"``), tick unit and time zone.
+
+    The ticks are a view of the column's buffer; only NaT is filtered out.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        kind, unit, tz = "M", getattr(dtype, "unit", "ns"), str(dtype.tz)
+    else:
+        kind, unit, tz = dtype.kind, np.datetime_data(dtype)[0], None
+    ticks = np.asarray(series.array.asi8)
+    return ticks[ticks != _NAT], kind, unit, tz
+
+
+class TemporalSummary:
+    """
+    Mergeable range, order and spacing of datetime or timedelta values.
+
+    Values are read as int64 ticks of their unit, so every metric is a
+    vectorized reduction and nothing is sorted. Gaps are the nonzero steps
+    between consecutive present values in row order. They are reported only
+    for monotonic columns, where they are the sampling interval. The median
+    gap comes from a quantile sketch of ``k`` items, exact until it
+    compacts (``error`` is then its rank error).
+
+    Chunks must share one dtype and arrive in row order; ``merge`` appends
+    ``other`` after this summary.
+    """
+
+    def __init__(
+        self,
+        kind: Optional[str] = None,
+        unit: Optional[str] = None,
+        tz: Optional[str] = None,
+        k: int = GAP_SKETCH_K,
+    ):
+        self.kind = kind
+        self.unit = unit
+        self.tz = tz
+        self.count = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+        self.first: Optional[int] = None
+        self.last: Optional[int] = None
+        self.increasing = True
+        self.decreasing = True
+        self.max_gap = 0
+        self.gaps = QuantileSketch(k=k)
+
+    # ------------------------
+    # Public API
+    # ------------------------
+    @property
+    def is_ordered(self) -> bool:
+        return self.increasing or self.decreasing
+
+    @property
+    def error(self) -> Optional[float]:
+        if self.count and self.is_ordered and not self.gaps.is_exact:
+            return self.gaps.rank_error
+        return None
+
+    def update(self, series: pd.Series) -> None:
+        ticks, self.kind, self.unit, self.tz = int64_ticks(series)
+        self.update_ticks(ticks)
+
+    def update_ticks(self, ticks: np.ndarray) -> None:
+        if ticks.size == 0:
+            return
+
+        low, high = int(ticks.min()), int(ticks.max())
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+        if self.first is None:
+            self.first = int(ticks[0])
+
+        if self.last is not None:
+            ticks = np.concatenate([[self.last], ticks])
+        self.last = int(ticks[-1])
+        self.count += int(ticks.size) - (self.count > 0)
+
+        if self.is_ordered and ticks.size > 1:
+            steps = np.diff(ticks)
+            self.increasing = self.increasing and bool((steps >= 0).all())
+            self.decreasing = self.decreasing and bool((steps <= 0).all())
+            if self.is_ordered:
+                self._add_gaps(np.abs(steps[steps != 0]))
+
+    def merge(self, other: "TemporalSummary") -> None:
+        if not other.count:
+            return
+        if not self.count:
+            self.kind, self.unit, self.tz = other.kind, other.unit, other.tz
+            self.first = other.first
+
+        boundary = other.first - self.last if self.count else 0
+        self.increasing = self.increasing and other.increasing and boundary >= 0
+        self.decreasing = self.decreasing and other.decreasing and boundary <= 0
+        if self.is_ordered:
+            self.gaps.merge(other.gaps)
+            self.max_gap = max(self.max_gap, other.max_gap)
+            if boundary:
+                self._add_gaps(np.array([abs(boundary)]))
+
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self.last = other.last
+        self.count += other.count
+
+    def to_dict(self) -> Dict[str, Any]:
+        if not self.count:
+            return dict(EMPTY_TEMPORAL)
+
+        # Dividing by ticks per second keeps whole seconds exact.
+        per_second = float(np.timedelta64(1, "s") / np.timedelta64(1, self.unit))
+        gaps = self.is_ordered and self.gaps.count > 0
+        return {
+            "min": self._format(self.min),
+            "max": self._format(self.max),
+            "span_seconds": (self.max - self.min) / per_second,
+            "monotonic_increasing": bool(self.increasing),
+            "monotonic_decreasing": bool(self.decreasing),
+            "median_gap_seconds": self.gaps.quantile(0.5) / per_second if gaps else None,
+            "max_gap_seconds": self.max_gap / per_second if gaps else None,
+        }
+
+    # ------------------------
+    # Helpers
+    # ------------------------
+    def _add_gaps(self, gaps: np.ndarray) -> None:
+        if gaps.size:
+            self.max_gap = max(self.max_gap, int(gaps.max()))
+            self.gaps.update(gaps)
+
+    def _format(self, tick: int) -> str:
+        # ISO 8601, so profiles stay JSON and pandas parses the bounds back.
+        if self.kind == "m":
+            return pd.Timedelta(tick, unit=self.unit).isoformat()
+        stamp = pd.Timestamp(tick, unit=self.unit)
+        if self.tz is not None:
+            stamp = stamp.tz_localize("UTC").tz_convert(self.tz)
+        return stamp.isoformat()
+
+
+def temporal_profile(series: pd.Series, approximate: bool = False) -> Tuple[Dict[str, Any], Optional[float]]:
+    """
+    ``temporal`` metrics of one column and the rank error of its median gap
+    (None when exact). Exact profiles size the gap sketch to hold every gap.
+    """
+    summary = TemporalSummary(k=GAP_SKETCH_K if approximate else max(len(series), 1))
+    summary.update(series)
+    return summary.to_dict(), summary.error
+
+
+def detect_datetime(values: Sequence[Any]) -> Optional[Dict[str, Any]]:
+    """
+    ``to_datetime`` params for sampled string ``values`` when every one
+    looks like and parses as a date, else None.
+
+    A vectorized pattern check rejects most text columns before any
+    parsing; the sample is then parsed once with the format guessed from
+    its first value.
+    """
+    if not len(values):
+        return None
+    strings = pd.Series(values, dtype=object)
+    if not strings.map(lambda value: isinstance(value, str)).all():
+        return None
+    if not strings.str.fullmatch(_DATE_LIKE).all():
+        return None
+
+    fmt = guess_datetime_format(strings.iloc[0]) if guess_datetime_format is not None else None
+    try:
+        parsed = pd.to_datetime(strings, format=fmt, errors="coerce")
+    except (TypeError, ValueError, OverflowError):
+        return None
+    if not is_temporal(parsed.dtype) or parsed.isna().any():
+        return None
+    return {"format": fmt} if fmt is not None else {}
@@ -1,14 +1,29 @@
 from __future__ import annotations
 import pandas as pd
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 from sanitify.core.profiler import DataProfiler
+from sanitify.core.lazy import DATASET_METRICS, resolve_metrics, select_profile
+from sanitify.core.cache import ProfileCache, file_fingerprint, frame_fingerprint
+from sanitify.core.rules import compile_rules
 from sanitify.core.scoring import QualityScorer
+from sanitify.core.table import ProfileTable
 from sanitify.cleaning.deterministic import FixApplier
+from sanitify.cleaning.planner import changed_columns
+from sanitify.cleaning.streaming import StreamingFixApplier
+from sanitify.core.duplicates import DEFAULT_MEMORY_LIMIT
 from sanitify.core.suggestions import DeterministicSuggestionEngine
-from sanitify.report.exporter import ReportBuilder, JSONExporter
+from sanitify.report.exporter import ReportBuilder, get_exporter
+from sanitify.utils.io import file_format, iter_chunks
+from sanitify.core.arrow import iter_arrow_chunks
+from sanitify.utils.frames import copy_on_write_enabled
+from sanitify.utils.tracing import NULL_TRACER
 from sanitify.core.quality import (
+    BaseRule,
     RuleEngine,
+    RulePlan,
     HighCardinalityRule,
     HighMissingRule,
     ConstantColumnRule,
@@ -18,94 +33,659 @@ from sanitify.core.quality import (
 import logging
 logger = logging.getLogger(__name__)
 
-logger.debug("Running profile computation")
+
+def default_rules() -> List[BaseRule]:
+    return [
+        HighMissingRule(),
+        ConstantColumnRule(),
+        HighCardinalityRule(),
+        DuplicateRateRule(),
+    ]
+
+
+def config_key(obj: Any) -> Tuple[Any, ...]:
+    """
+    Hashable fingerprint of an object's class and public configuration.
+    """
+    settings = tuple(
+        (name, repr(value))
+        for name, value in sorted(vars(obj).items())
+        if not name.startswith("_")
+    )
+    return (type(obj).__module__, type(obj).__qualname__, settings)
+
+
+def _is_default_index(index: pd.Index, start: int = 0) -> bool:
+    return isinstance(index, pd.RangeIndex) and index.start == start and index.step == 1
+
+
+class _PipelineCache:
+    """
+    Memoizes pipeline stages (profile -> issues -> score -> suggestions).
+
+    Each stage stores its result together with the key it was computed
+    for. Keys chain the upstream key with the stage configuration, so a
+    new profile or a reconfigured rule invalidates everything downstream.
+    Every recomputed stage is timed as a ``pipeline.<stage>`` span.
+    """
+
+    def __init__(self, tracer: Any = NULL_TRACER):
+        self._entries: Dict[str, Tuple[Any, Any]] = {}
+        self._tracer = tracer
+
+    def get(self, stage: str, key: Any, compute: Callable[[], Any]) -> Any:
+        entry = self._entries.get(stage)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+
+        logger.debug("Computing pipeline stage %s", stage)
+        with self._tracer.span(f"pipeline.{stage}"):
+            value = compute()
+        self._entries[stage] = (key, value)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
 
 class DataCleaner:
     """
     Public entry point for Sanitify.
     Stable API surface. Avoid breaking changes.
+
+    Analysis stages are memoized: repeated calls to ``check_quality``,
+    ``quality_score``, ``suggest_fixes`` and ``export_report`` reuse earlier
+    results until the profile, the rules or the scorer configuration change.
+    Fixes applied in place re-profile only the columns they touched, and
+    ``update()`` merges appended rows into mergeable profile state.
+
+    With a ``ProfileCache`` as ``cache``, profiles persist on disk across
+    instances and processes, keyed by a content fingerprint of the frame
+    (or file) and the profiling options.
+
+    ``rules`` is a list of rule objects, a declarative rule spec (dict,
+    list, JSON/YAML text or file path; see ``sanitify.core.rules``) or an
+    already compiled ``RulePlan``. It is compiled into a plan once; spec
+    weights and caps feed the default scorer.
+
+    Pass a ``sanitify.utils.tracing.Tracer`` as ``tracer`` to time every
+    stage and column metric; the trace is then included in ``export_report``.
     """
-    
-    def __init__(self,df:pd.DataFrame):
+
+    def __init__(
+            self,
+            df:pd.DataFrame,
+            rules: Any = None,
+            scorer: Optional[QualityScorer] = None,
+            copy: bool = True,
+            tracer: Any = NULL_TRACER,
+            cache: Optional[ProfileCache] = None,
+    ):
+        """
+        ``copy=False`` keeps a reference to ``df`` instead of a private copy.
+        Sanitify never writes into it; call ``invalidate()`` if the caller
+        mutates it afterwards. Under pandas copy-on-write the private copy
+        is lazy and costs no memory until either side is modified.
+        """
         if not isinstance(df, pd.DataFrame):
             raise TypeError("DataCleaner expects a pandas DataFrame")
-        
-        self._df = df.copy()
+
+        if not copy:
+            self._df = df
+        elif copy_on_write_enabled():
+            self._df = df.copy(deep=False)
+        else:
+            self._df = df.copy()
+        self._source: Optional[Dict[str,Any]] = None
+        self._init_pipeline(rules, scorer, tracer, cache)
+
+    @classmethod
+    def from_path(
+        cls,
+        path: str,
+        chunksize: int = 100_000,
+        rules: Any = None,
+        scorer: Optional[QualityScorer] = None,
+        tracer: Any = NULL_TRACER,
+        cache: Optional[ProfileCache] = None,
+        **read_kwargs,
+    ):
+        """
+        Build a streaming DataCleaner over a CSV or Parquet file.
+
+        The file is read in chunks of ``chunksize`` rows whenever a profile
+        is needed, so peak memory depends on the chunk size rather than the
+        file size. ``stream_fixes`` writes cleaned output the same way;
+        ``apply_fixes`` requires an in-memory DataFrame.
+        """
+        file_format(path)
+
+        instance = cls.__new__(cls)
+        instance._df = None
+        instance._source = {
+            "path": path,
+            "chunksize": chunksize,
+            "read_kwargs": read_kwargs,
+        }
+        instance._init_pipeline(rules, scorer, tracer, cache)
+        return instance
+
+    @classmethod
+    def from_arrow(
+        cls,
+        source: Any,
+        batch_size: int = 100_000,
+        rules: Any = None,
+        scorer: Optional[QualityScorer] = None,
+        tracer: Any = NULL_TRACER,
+        cache: Optional[ProfileCache] = None,
+    ):
+        """
+        Build a DataCleaner over a ``pyarrow.Table``, ``RecordBatch`` or
+        Parquet file that is profiled with Arrow compute kernels, without
+        converting it to pandas. Use ``stream_fixes`` to write cleaned
+        output; ``apply_fixes`` requires an in-memory DataFrame.
+        """
+        instance = cls.__new__(cls)
+        instance._df = None
+        instance._source = {
+            "arrow": source,
+            "chunksize": batch_size,
+        }
+        instance._init_pipeline(rules, scorer, tracer, cache)
+        return instance
+
+    def _init_pipeline(
+            self,
+            rules: Any,
+            scorer: Optional[QualityScorer],
+            tracer: Any,
+            cache: Optional[ProfileCache] = None,
+    ) -> None:
+        self._tracer = tracer
+        self._disk_cache = cache
+        self._fingerprint: Optional[Tuple[int, Optional[str]]] = None
+        if rules is None:
+            rules = default_rules()
+        if isinstance(rules, RulePlan):
+            plan = rules
+        elif isinstance(rules, list) and all(isinstance(rule, BaseRule) for rule in rules):
+            plan = RulePlan(rules)
+        else:
+            plan = compile_rules(rules)
+        self._engine = RuleEngine(plan)
+        self._rules = plan.rules
+        self._scorer = scorer or QualityScorer.from_plan(plan)
+        self._suggestion_engine = DeterministicSuggestionEngine()
+
+        self._cache = _PipelineCache(tracer)
+        self._frame_version = 0
+        self._profile_key: Optional[Tuple[Any, ...]] = None
         self._profile_cache: Optional[Dict[str,Any]] = None
+        self._profile_state = None
+
+    def invalidate(self) -> None:
+        """
+        Drop every memoized stage, e.g. after mutating the frame externally.
+        """
+        self._profile_state = None
+        self._reset_stages()
+
+    def _reset_stages(self) -> None:
+        self._frame_version += 1
+        self._profile_key = None
+        self._profile_cache = None
+        self._cache.clear()
 
     # ------Profilling------
-    def profile(self, max_sample_size: int = 50_000):
-        profiler = DataProfiler(self._df, max_sample_size=max_sample_size)
+    def profile(
+            self,
+            max_sample_size: int = 50_000,
+            approximate: bool = False,
+            n_jobs: Optional[int] = None,
+            executor: Optional[Executor] = None,
+            memory_mode: str = "exact",
+            stratify_by: Any = None,
+            columns: Optional[List[Any]] = None,
+            metrics: Any = None,
+    ):
+        """
+        ``memory_mode`` (``"exact"``, ``"sampled"`` or ``"shallow"``) trades
+        the accuracy of ``memory_bytes`` for speed on object-heavy frames.
+        With ``approximate=True``, frames longer than ``max_sample_size``
+        rows estimate median and std from a sample, stratified by the
+        ``stratify_by`` column when given.
+        See ``DataProfiler``.
 
-        self._profile_cache = profiler.run()
+        ``columns`` and ``metrics`` restrict the profile to a subset;
+        ``metrics="rules"`` computes only what the configured rules read.
+        File sources then read only the selected columns (unless a
+        dataset-wide metric is selected). ``suggest_fixes`` and
+        ``export_report`` replace a selective profile with a full one.
+        """
+        if isinstance(metrics, str) and metrics == "rules":
+            metrics = self._engine.required_metrics()
+        metrics = resolve_metrics(metrics)
+        selection = (
+            None if columns is None else tuple(columns),
+            None if metrics is None else tuple(sorted(metrics)),
+        )
+
+        if self._profile_state is not None:
+            # Incremental state already covers every row; options that only
+            # shape a from-scratch run do not apply to it.
+            key = ("profile", self._frame_version, "state", selection)
+            compute = lambda: {
+                **select_profile(self._profile_state.run(), columns, metrics),
+                "incremental": True,
+            }
+        else:
+            # Parallelism does not change the result, so it is not part of the key.
+            options = (max_sample_size, approximate, memory_mode, stratify_by)
+            key = ("profile", self._frame_version, *options, selection)
+            compute = lambda: self._compute_profile(*options, n_jobs, executor, columns, metrics)
+
+        self._profile_cache = self._cache.get("profile", key, compute)
+        self._profile_key = key
         return self._profile_cache
-    
+
+    def update(self, new_chunk: pd.DataFrame, incremental: bool = False) -> Dict[str,Any]:
+        """
+        Append rows and return the updated profile.
+
+        Appended chunks are kept as they are and concatenated once, when
+        the frame is next needed. When the frame and the chunk both have a
+        default RangeIndex the chunk's rows are labelled by position after
+        the existing rows, so the index stays a default RangeIndex;
+        otherwise the chunk keeps its own labels.
+
+        By default the profile is recomputed exactly. With
+        ``incremental=True`` the rows are merged into mergeable per-column
+        state instead (built once from the current rows), without rescanning
+        earlier rows. Such profiles come from ``ChunkedProfiler`` sketches,
+        which turn approximate once they saturate, and carry
+        ``"incremental": True``; the cleaner stays incremental until
+        ``invalidate()``. File-backed cleaners are always incremental, as
+        appended rows live only in the profile state.
+        """
+        if not isinstance(new_chunk, pd.DataFrame):
+            raise TypeError("update expects a pandas DataFrame")
+
+        if incremental or self._df is None or self._profile_state is not None:
+            if self._profile_state is None:
+                self._profile_state = self._new_state()
+            self._profile_state.update(new_chunk)
+
+        if self._df is not None:
+            if self._default_index() and _is_default_index(new_chunk.index):
+                rows = len(self._frame) + sum(len(chunk) for chunk in self._appended)
+                new_chunk = new_chunk.set_axis(pd.RangeIndex(rows, rows + len(new_chunk)), axis=0)
+            self._appended.append(new_chunk)
+
+        self._reset_stages()
+        return self.profile()
+
+    @property
+    def _df(self) -> Optional[pd.DataFrame]:
+        # Appended chunks are concatenated on first use, once.
+        if self._appended:
+            default = self._default_index()
+            self._frame = pd.concat([self._frame, *self._appended], ignore_index=default)
+            self._appended = []
+        return self._frame
+
+    @_df.setter
+    def _df(self, frame: Optional[pd.DataFrame]) -> None:
+        self._frame = frame
+        self._appended: List[pd.DataFrame] = []
+
+    def _default_index(self) -> bool:
+        # Whether the frame with its pending chunks has a default RangeIndex.
+        offset = 0
+        for part in [self._frame, *self._appended]:
+            if not _is_default_index(part.index, offset):
+                return False
+            offset += len(part)
+        return True
+
+    def _new_state(self):
+        if self._df is None:
+            return DataProfiler.from_chunks(self._iter_source(), tracer=self._tracer)
+        return DataProfiler.from_chunks([self._df], tracer=self._tracer)
+
+    def _iter_source(self):
+        if "arrow" in self._source:
+            return iter_arrow_chunks(self._source["arrow"], self._source["chunksize"])
+        return iter_chunks(
+            self._source["path"],
+            chunksize=self._source["chunksize"],
+            **self._source["read_kwargs"],
+        )
+
+    def _compute_profile(
+            self,
+            max_sample_size: int,
+            approximate: bool,
+            memory_mode: str,
+            stratify_by: Any,
+            n_jobs: Optional[int],
+            executor: Optional[Executor],
+            columns: Optional[List[Any]] = None,
+            metrics: Optional[FrozenSet[str]] = None,
+    ) -> Dict[str,Any]:
+        cache_key = None
+        if self._disk_cache is not None:
+            cache_key = self._disk_cache_key(max_sample_size, approximate, memory_mode, stratify_by)
+            if cache_key and (columns is not None or metrics is not None):
+                cache_key = ProfileCache.key(
+                    cache_key,
+                    columns=None if columns is None else list(columns),
+                    metrics=None if metrics is None else sorted(metrics),
+                )
+            cached = self._disk_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                return cached
+
+        profile = self._run_profiler(
+            max_sample_size, approximate, memory_mode, stratify_by, n_jobs, executor, columns, metrics
+        )
+        if cache_key:
+            self._disk_cache.put(cache_key, profile)
+        return profile
+
+    def _disk_cache_key(
+            self,
+            max_sample_size: int,
+            approximate: bool,
+            memory_mode: str,
+            stratify_by: Any,
+    ) -> Optional[str]:
+        if self._fingerprint is None or self._fingerprint[0] != self._frame_version:
+            with self._tracer.span("pipeline.fingerprint"):
+                if self._df is not None:
+                    fingerprint = frame_fingerprint(self._df)
+                elif "arrow" in self._source:
+                    # In-memory Arrow tables are not fingerprinted.
+                    source = self._source["arrow"]
+                    fingerprint = file_fingerprint(source) if isinstance(source, (str, Path)) else None
+                else:
+                    fingerprint = file_fingerprint(self._source["path"])
+            self._fingerprint = (self._frame_version, fingerprint)
+
+        fingerprint = self._fingerprint[1]
+        if fingerprint is None:
+            return None
+        if self._df is None and "arrow" in self._source:
+            return ProfileCache.key(fingerprint, engine="arrow")
+        if self._df is None:
+            # Streamed profiles do not sample, but chunking shapes the sketches.
+            return ProfileCache.key(
+                fingerprint,
+                chunksize=self._source["chunksize"],
+                read_kwargs=self._source["read_kwargs"],
+            )
+        return ProfileCache.key(
+            fingerprint,
+            max_sample_size=max_sample_size,
+            approximate=approximate,
+            memory_mode=memory_mode,
+            stratify_by=stratify_by,
+        )
+
+    def _run_profiler(
+            self,
+            max_sample_size: int,
+            approximate: bool,
+            memory_mode: str,
+            stratify_by: Any,
+            n_jobs: Optional[int],
+            executor: Optional[Executor],
+            columns: Optional[List[Any]] = None,
+            metrics: Optional[FrozenSet[str]] = None,
+    ) -> Dict[str,Any]:
+        selective = columns is not None or metrics is not None
+
+        if self._df is None and "arrow" in self._source:
+            profile = DataProfiler.from_arrow(
+                self._source["arrow"],
+                batch_size=self._source["chunksize"],
+                tracer=self._tracer,
+            ).run()
+            return select_profile(profile, columns, metrics)
+
+        if self._df is None and selective:
+            # Dataset-wide metrics need every column; the rest only the selected ones.
+            whole = metrics is None or not metrics.isdisjoint(DATASET_METRICS)
+            chunks = iter_chunks(
+                self._source["path"],
+                chunksize=self._source["chunksize"],
+                columns=None if whole or columns is None else list(columns),
+                **self._source["read_kwargs"],
+            )
+            profile = DataProfiler.from_chunks(chunks, tracer=self._tracer).run()
+            return select_profile(profile, columns, metrics)
+
+        if self._df is None:
+            self._profile_state = self._new_state()
+            return self._profile_state.run()
+
+        profiler = DataProfiler(
+            self._df,
+            max_sample_size=max_sample_size,
+            approximate=approximate,
+            n_jobs=n_jobs,
+            executor=executor,
+            tracer=self._tracer,
+            memory_mode=memory_mode,
+            stratify_by=stratify_by,
+            columns=columns,
+            metrics=metrics,
+        )
+        return profiler.run()
+
+    def _ensure_profile(self, complete: bool = False) -> Dict[str,Any]:
+        if self._profile_cache is None or (complete and "selection" in self._profile_cache):
+            self.profile()
+        return self._profile_cache
+
+    def _issues_key(self) -> Tuple[Any, ...]:
+        return (self._profile_key, tuple(config_key(rule) for rule in self._rules))
+
     # ------Quality------
     def check_quality(self):
-        if self._profile_cache is None:
-            self.profile()
-        
-        rules = [
-            HighMissingRule(),
-            ConstantColumnRule(),
-            HighCardinalityRule(),
-            DuplicateRateRule(),
-        ]
+        profile = self._ensure_profile()
 
-        engine = RuleEngine(rules)
-        return engine.run(self._profile_cache)
-    
-    def quality_score(self):
-        if self._profile_cache is None:
-            self.profile()
+        return self._cache.get(
+            "issues",
+            self._issues_key(),
+            lambda: self._engine.run(profile, self._profile_table()),
+        )
 
+    def _profile_table(self) -> Optional[ProfileTable]:
+        # Columnar view shared by every column rule; rebuilt only with the profile.
+        if not self._engine.plan.needs_table:
+            return None
+        return self._cache.get(
+            "table",
+            self._profile_key,
+            lambda: ProfileTable.from_profile(self._profile_cache),
+        )
+
+    def quality_score(self):
+        profile = self._ensure_profile()
         issues = self.check_quality()
 
-        scorer = QualityScorer()
-        return scorer.score(self._profile_cache, issues)
-    
+        return self._cache.get(
+            "score",
+            (self._issues_key(), config_key(self._scorer)),
+            lambda: self._scorer.score(profile, issues),
+        )
+
     # ------ML Suggestions------
     def suggest_fixes(self, confidence_threshold: float = 0.0):
-        if self._profile_cache is None:
-            self.profile()
-
+        profile = self._ensure_profile(complete=True)
         issues = self.check_quality()
 
-        engine = DeterministicSuggestionEngine()
-        suggestions = engine.generate(self._profile_cache, issues)
+        suggestions = self._cache.get(
+            "suggestions",
+            (self._issues_key(), config_key(self._suggestion_engine)),
+            lambda: self._suggestion_engine.generate(profile, issues, self._df),
+        )
 
         return [
             s for s in suggestions
             if s["confidence"] >= confidence_threshold
         ]
-    
+
     # ------Apply------
-    def apply_fixes(self, approved):
+    def plan_fixes(self, approved):
+        """
+        Return the execution plan ``apply_fixes(approved, optimize=True)``
+        would run, with per-step cost estimates.
+        """
+        self._check_approved(approved)
+        return FixApplier().plan(self._df, approved, profile=self._profile_cache)
+
+    def apply_fixes(self, approved, inplace: bool = False, optimize: bool = False):
+        """
+        Apply approved fixes and return the cleaned frame.
+
+        With ``optimize=True`` the whole list is planned first: drops run
+        first, imputations reuse profile statistics and are fused, and
+        duplicates are dropped last. With ``inplace=True`` the cleaned frame
+        replaces the one held by this DataCleaner; unless rows were removed,
+        only the columns the fixes touched are profiled again.
+        """
+        self._check_approved(approved)
+
+        applier = FixApplier()
+        with self._tracer.span("pipeline.apply", fixes=len(approved), optimize=optimize):
+            cleaned = applier.apply(
+                self._df,
+                approved,
+                profile=self._profile_cache,
+                optimize=optimize,
+            )
+
+        if inplace:
+            self._replace_frame(cleaned, approved)
+
+        return cleaned
+
+    def stream_fixes(
+        self,
+        approved,
+        output: str | Path,
+        chunksize: Optional[int] = None,
+        memory_limit: int = DEFAULT_MEMORY_LIMIT,
+        **write_options,
+    ) -> Dict[str, Any]:
+        """
+        Apply approved fixes chunk by chunk and write the cleaned rows to
+        ``output`` (CSV/TSV, optionally compressed, or Parquet), without
+        holding the source or the result in memory.
+
+        Works for file and Arrow sources as well as DataFrames. The file
+        holds the rows of ``apply_fixes(approved, optimize=True)``; duplicate
+        detection spills to disk past ``memory_limit`` bytes. Imputation
+        values come from the current profile when it holds them exactly and
+        from one extra pass over the imputed columns otherwise; a median
+        computed in that pass loads its column, listed in the summary under
+        ``materialized``. Returns a summary of rows read, rows written and
+        statistics used.
+        """
         if not isinstance(approved, list):
             raise TypeError("approved must be a list of fix dictionaries")
 
-        applier = FixApplier()
-        return applier.apply(self._df, approved)
+        if self._df is not None:
+            df = self._df
+            size = chunksize or 100_000
+
+            def read(columns):
+                frame = df if columns is None else df[columns]
+                return (frame.iloc[start:start + size] for start in range(0, len(frame), size))
+        elif "arrow" in self._source:
+            source, size = self._source["arrow"], chunksize or self._source["chunksize"]
+
+            def read(columns):
+                return iter_arrow_chunks(source, size, columns=columns)
+        else:
+            path, size = self._source["path"], chunksize or self._source["chunksize"]
+            read_kwargs = self._source["read_kwargs"]
+
+            def read(columns):
+                return iter_chunks(path, chunksize=size, columns=columns, **read_kwargs)
+
+        applier = StreamingFixApplier(memory_limit=memory_limit, tracer=self._tracer)
+        with self._tracer.span("pipeline.stream_apply", fixes=len(approved)):
+            return applier.apply(read, approved, output, profile=self._profile_cache, **write_options)
+
+    def _replace_frame(self, cleaned: pd.DataFrame, fixes) -> None:
+        before = self._df
+        previous, previous_key = self._profile_cache, self._profile_key
+        changed = changed_columns(before, cleaned, fixes)
+
+        self._df = cleaned
+        self._reset_stages()
+
+        if changed is None:
+            self._profile_state = None
+        elif self._profile_state is not None:
+            with self._tracer.span("pipeline.refresh", columns=len(changed)):
+                self._profile_state.refresh(cleaned, changed)
+        elif previous is not None and "selection" not in previous:
+            _, _, max_sample_size, approximate, memory_mode, stratify_by, _ = previous_key
+            if stratify_by is not None and stratify_by not in cleaned.columns:
+                return
+            profiler = DataProfiler(
+                cleaned,
+                max_sample_size=max_sample_size,
+                approximate=approximate,
+                tracer=self._tracer,
+                memory_mode=memory_mode,
+                stratify_by=stratify_by,
+            )
+            key = ("profile", self._frame_version, *previous_key[2:])
+            self._profile_cache = self._cache.get(
+                "profile",
+                key,
+                lambda: profiler.refresh(previous, before, changed),
+            )
+            self._profile_key = key
+
+    def _check_approved(self, approved) -> None:
+        if not isinstance(approved, list):
+            raise TypeError("approved must be a list of fix dictionaries")
+
+        if self._df is None:
+            raise ValueError(
+                "apply_fixes requires an in-memory DataFrame; "
+                "construct DataCleaner from a DataFrame to apply fixes"
+            )
 
     # ------Reporting------
-    def export_report(self, format: str = "json", path: str | None = None):
-        if self._profile_cache is None:
-            self.profile()
+    def export_report(self, format: str = "json", path: str | None = None, compact: bool = False):
+        """
+        Build the report and, with ``path``, write it as ``"json"`` (pretty,
+        or minified with ``compact=True``), ``"msgpack"`` or ``"parquet"``
+        (the per-column profile table). Files are written incrementally.
+        """
+        exporter = get_exporter(format, compact)
+        profile = self._ensure_profile(complete=True)
 
         issues = self.check_quality()
         score = self.quality_score()
         suggestions = self.suggest_fixes()
 
         report = ReportBuilder.build(
-            profile = self._profile_cache,
+            profile = profile,
             issues = issues,
             score = score,
-            suggestions = suggestions
+            suggestions = suggestions,
+            trace = self._tracer.to_dict() if self._tracer.enabled else None,
         )
 
-        if format == "json":
-            exporter = JSONExporter()
-        else:
-            raise ValueError(f"Unsupported report format: {format}")
-        
-        return exporter.export(report, path)
\ No newline at end of file
+        # Serialization runs after the trace snapshot, so its span is only
+        # visible on the tracer itself.
+        with self._tracer.span("pipeline.export", format=format):
+            return exporter.export(report, path)
@@ -1,8 +1,41 @@
 from __future__ import annotations
-from typing import Dict, Any, Optional
+from typing import Dict, Any, IO, Optional, Tuple
+import datetime
 import json
 from pathlib import Path
 
+import numpy as np
+
+# Report containers written item by item; everything below them (one
+# column profile, one issue) is encoded in a single call.
+STREAMED_PATHS = {
+    (),
+    ("profile",),
+    ("profile", "columns"),
+    ("quality_issues",),
+    ("suggested_fixes",),
+}
+
+
+def to_native(value: Any) -> Any:
+    """
+    ``default`` hook for encoders: NumPy scalars and arrays, dates and
+    timedeltas as plain Python values. Float and string NumPy scalars
+    subclass the Python types and never reach the hook.
+    """
+    if isinstance(value, (np.datetime64, np.timedelta64)):
+        return str(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, datetime.timedelta):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 class ReportBuilder:
     """
     Aggregates all analysis output into a structured report dictionary.
@@ -13,14 +46,18 @@ class ReportBuilder:
         issues: Any,
         score: Dict[str, Any],
         suggestions: Any,
+        trace: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        return {
+        report = {
             "profile": profile,
             "quality_issues": issues,
             "quality_score": score,
             "suggested_fixes": suggestions,
         }
-    
+        if trace is not None:
+            report["trace"] = trace
+        return report
+
 class BaseExporter:
     """
     Base class for report exporters.
@@ -31,20 +68,172 @@ class BaseExporter:
             path: Optional[str] = None,
     ) -> Dict[str, Any]:
         raise NotImplementedError
-    
+
 class JSONExporter(BaseExporter):
     """
     Export report to JSON
+
+    The file is written incrementally: the report, the profile and its
+    columns are streamed entry by entry, and each column profile or issue
+    is encoded in one call, so the full document is never held as a
+    string. ``indent=None`` writes compact JSON through the C encoder,
+    several times faster than pretty-printing. Output is identical to
+    ``json.dump`` with the same indent.
     """
+    def __init__(self, indent: Optional[int] = 4):
+        self.indent = indent
+        separators = (",", ": ") if indent is not None else (",", ":")
+        self._encoder = json.JSONEncoder(indent=indent, separators=separators, default=to_native)
+
     def export(
         self,
         report: Dict[str, Any],
         file_path: Optional[str] = None,
     ) -> Dict[str, Any]:
-        
+
         if file_path:
             output_path = Path(file_path)
             with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(report, f, indent=4)
+                self.write(report, f)
+
+        return report
+
+    def write(self, report: Dict[str, Any], out: IO[str]) -> None:
+        self._write(out, report, (), 0)
+
+    def _write(self, out: IO[str], value: Any, path: Tuple[Any, ...], level: int) -> None:
+        if path not in STREAMED_PATHS or not isinstance(value, (dict, list)) or not value:
+            text = self._encoder.encode(value)
+            if self.indent is not None and level:
+                # JSON strings escape newlines, so only layout lines shift.
+                text = text.replace("\n", "\n" + " " * (self.indent * level))
+            out.write(text)
+            return
+
+        is_dict = isinstance(value, dict)
+        opening, closing = ("{", "}") if is_dict else ("[", "]")
+        if self.indent is None:
+            inner = separator = ","
+            end = closing
+        else:
+            inner = "\n" + " " * (self.indent * (level + 1))
+            separator = "," + inner
+            end = "\n" + " " * (self.indent * level) + closing
+
+        out.write(opening + ("" if self.indent is None else inner))
+        items = value.items() if is_dict else enumerate(value)
+        for position, (key, item) in enumerate(items):
+            if position:
+                out.write(separator)
+            if is_dict:
+                out.write(json.dumps(_json_key(key)) + (":" if self.indent is None else ": "))
+            self._write(out, item, path + (key,) if is_dict else path + ("*",), level + 1)
+        out.write(end)
+
+
+class MsgpackExporter(BaseExporter):
+    """
+    Export report to MessagePack, streamed like ``JSONExporter``.
+
+    Requires ``msgpack`` (``pip install 'sanitify[msgpack]'``). NumPy
+    values are packed through ``to_native``; column keys keep their type.
+    """
+    def export(
+        self,
+        report: Dict[str, Any],
+        file_path: Optional[str] = None,
+    ) -> Dict[str, Any]:
+
+        if file_path:
+            packer = _require("msgpack").Packer(default=to_native, use_bin_type=True)
+            with open(Path(file_path), "wb") as f:
+                self._write(f, packer, report, ())
+
+        return report
+
+    def _write(self, out: IO[bytes], packer: Any, value: Any, path: Tuple[Any, ...]) -> None:
+        if path not in STREAMED_PATHS or not isinstance(value, (dict, list)):
+            out.write(packer.pack(value))
+            return
+        if isinstance(value, dict):
+            out.write(packer.pack_map_header(len(value)))
+            for key, item in value.items():
+                out.write(packer.pack(key))
+                self._write(out, packer, item, path + (key,))
+            return
+        out.write(packer.pack_array_header(len(value)))
+        for item in value:
+            self._write(out, packer, item, path + ("*",))
+
+
+class ParquetExporter(BaseExporter):
+    """
+    Export the per-column profile as a Parquet table, one row per column.
+
+    Columns hold the metrics of ``ProfileTable`` (``missing``, ``unique``,
+    ``mean``, ...); the rest of the report (dataset summary, issues, score,
+    suggestions) is stored as compact JSON in the ``sanitify.report``
+    schema metadata. Requires pyarrow (``pip install 'sanitify[parquet]'``).
+    """
+    def export(
+        self,
+        report: Dict[str, Any],
+        file_path: Optional[str] = None,
+    ) -> Dict[str, Any]:
+
+        if file_path:
+            pa = _require("pyarrow")
+            pq = _require("pyarrow.parquet")
+            from sanitify.core.table import ProfileTable
+
+            profile = report["profile"]
+            table = ProfileTable.from_profile(profile)
+            arrays = {"column": pa.array([str(col) for col in table.columns], pa.string())}
+            for metric in table:
+                values = table[metric]
+                if values.dtype == object:
+                    values = [None if value is None else str(value) for value in values]
+                arrays[metric] = pa.array(values)
+
+            rest = dict(report, profile={k: v for k, v in profile.items() if k != "columns"})
+            metadata = {b"sanitify.report": JSONExporter(indent=None)._encoder.encode(rest).encode("utf-8")}
+            pq.write_table(pa.table(arrays).replace_schema_metadata(metadata), str(file_path))
+
+        return report
+
+
+EXPORTERS = {
+    "json": JSONExporter,
+    "msgpack": MsgpackExporter,
+    "parquet": ParquetExporter,
+}
+
+
+def get_exporter(format: str, compact: bool = False) -> BaseExporter:
+    if format not in EXPORTERS:
+        raise ValueError(f"Unsupported report format: {format}")
+    if format == "json":
+        return JSONExporter(indent=None if compact else 4)
+    return EXPORTERS[format]()
+
+
+def _json_key(key: Any) -> Any:
+    # Same key coercion as json.dump for the common key types.
+    if isinstance(key, np.generic):
+        key = key.item()
+    if isinstance(key, (str, int, float, bool)) or key is None:
+        return key if isinstance(key, str) else json.dumps(key)
+    return str(key)
+
+
+def _require(module: str) -> Any:
+    import importlib
 
-        return report
\ No newline at end of file
+    try:
+        return importlib.import_module(module)
+    except ImportError as exc:
+        extra = "msgpack" if module == "msgpack" else "parquet"
+        raise ImportError(
+            f"This report format requires {module.split('.')[0]}. "
+            f"Install it with: pip install 'sanitify[{extra}]'"
+        ) from exc
@@ -0,0 +1,65 @@
+from __future__ import annotations
+import pandas as pd
+from typing import Any, Dict, Iterable
+
+
+def copy_on_write_enabled() -> bool:
+    """
+    True when pandas copy-on-write is active (always on from pandas 3.0,
+    opt-in through ``mode.copy_on_write`` on 2.x).
+    """
+    major = int(pd.__version__.split(".")[0])
+    if major >= 3:
+        return True
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except (KeyError, pd.errors.OptionError):
+        return False
+
+
+def shallow_copy(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    New frame object sharing the column arrays of ``df``.
+
+    Safe to modify through column assignment (``out[col] = values``), which
+    replaces the column array instead of writing into it (pandas >= 1.5).
+    """
+    return df.copy(deep=False)
+
+
+def drop_columns(df: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
+    """
+    Drop ``columns`` without duplicating the data of the remaining ones.
+
+    Under copy-on-write ``DataFrame.drop`` is already lazy. Otherwise the
+    columns are deleted from a shallow copy, which splits blocks into views
+    instead of the block ``take`` that ``drop`` performs. Every column with
+    a dropped label goes, as with ``drop``.
+    """
+    dropped = [c for c in dict.fromkeys(columns) if c in df.columns]
+    if copy_on_write_enabled():
+        return df.drop(columns=dropped)
+
+    out = shallow_copy(df)
+    for column in dropped:
+        del out[column]
+    return out
+
+
+def fill_missing(df: pd.DataFrame, values: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Fill missing values of several columns in one call.
+
+    Uses a single ``fillna(mapping)`` under copy-on-write; otherwise fills
+    column by column on a shallow copy so only the filled columns are
+    materialized.
+    """
+    if not values:
+        return df
+    if copy_on_write_enabled():
+        return df.fillna(values)
+
+    out = shallow_copy(df)
+    for column, value in values.items():
+        out[column] = out[column].fillna(value)
+    return out
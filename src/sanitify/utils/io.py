@@ -0,0 +1,68 @@
+from __future__ import annotations
+import pandas as pd
+from pathlib import Path
+from typing import Any, Iterator, List, Optional
+
+CSV_SUFFIXES = {".csv", ".txt"}
+TSV_SUFFIXES = {".tsv"}
+PARQUET_SUFFIXES = {".parquet", ".pq"}
+COMPRESSION_SUFFIXES = {".gz", ".bz2", ".zip", ".xz", ".zst"}
+
+
+def file_format(path: str | Path) -> str:
+    """
+    Infer the tabular format of ``path`` from its suffix, ignoring a
+    trailing compression suffix (``data.csv.gz`` is ``csv``).
+    """
+    suffixes = [s.lower() for s in Path(path).suffixes]
+    if suffixes and suffixes[-1] in COMPRESSION_SUFFIXES:
+        suffixes = suffixes[:-1]
+
+    suffix = suffixes[-1] if suffixes else ""
+    if suffix in CSV_SUFFIXES:
+        return "csv"
+    if suffix in TSV_SUFFIXES:
+        return "tsv"
+    if suffix in PARQUET_SUFFIXES:
+        return "parquet"
+
+    raise ValueError(f"Unsupported file format: {path}")
+
+
+def iter_chunks(
+    path: str | Path,
+    chunksize: int = 100_000,
+    columns: Optional[List[Any]] = None,
+    **read_kwargs: Any,
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield a CSV/TSV/Parquet file as DataFrames of at most ``chunksize`` rows,
+    reading only ``columns`` when given.
+    """
+    if chunksize <= 0:
+        raise ValueError("chunksize must be a positive integer")
+
+    fmt = file_format(path)
+
+    if fmt in ("csv", "tsv"):
+        if fmt == "tsv":
+            read_kwargs.setdefault("sep", "\t")
+        if columns is not None:
+            read_kwargs["usecols"] = columns
+        with pd.read_csv(path, chunksize=chunksize, **read_kwargs) as reader:
+            yield from reader
+        return
+
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError(
+            "Reading Parquet files requires pyarrow. "
+            "Install it with: pip install 'sanitify[parquet]'"
+        ) from exc
+
+    parquet_file = pq.ParquetFile(path)
+    if columns is not None:
+        read_kwargs["columns"] = columns
+    for batch in parquet_file.iter_batches(batch_size=chunksize, **read_kwargs):
+        yield batch.to_pandas()
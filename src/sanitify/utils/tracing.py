@@ -0,0 +1,277 @@
+from __future__ import annotations
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+import urllib.request
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+DEFAULT_OTLP_ENDPOINT = "http://localhost:4318/v1/traces"
+
+
+class Span:
+    """
+    One timed pipeline stage or metric computation.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str],
+        attributes: Dict[str, Any],
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.attributes = attributes
+
+        self.start_unix_nano = 0
+        self.end_unix_nano = 0
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.peak_bytes: Optional[int] = None
+
+        # memory bookkeeping while the span is open
+        self._start_bytes = 0
+        self._peak_seen = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_unix_nano": self.start_unix_nano,
+            "end_unix_nano": self.end_unix_nano,
+            "wall_seconds": self.wall_seconds,
+            "cpu_seconds": self.cpu_seconds,
+            "peak_bytes": self.peak_bytes,
+            "attributes": dict(self.attributes),
+        }
+
+
+class Tracer:
+    """
+    Context-manager tracer for pipeline stages and column metrics.
+
+    Every ``span()`` records wall time, process CPU time and, with
+    ``track_memory=True``, the peak memory allocated above the level at span
+    start (via tracemalloc, which slows allocation-heavy code noticeably).
+    tracemalloc keeps a single process-wide peak, so memory figures are only
+    meaningful for serial runs. CPU time is process-wide as well.
+    Hooks are called with each finished span. Spans can be exported into the
+    report dict (``to_dict``) or as OTLP/JSON to a local collector.
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        track_memory: bool = False,
+        hooks: Optional[List[Callable[[Span], None]]] = None,
+        service_name: str = "sanitify",
+    ):
+        self.track_memory = track_memory
+        self.service_name = service_name
+        self.trace_id = os.urandom(16).hex()
+        self._hooks: List[Callable[[Span], None]] = list(hooks or [])
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._memory_owner: Optional[Span] = None
+
+    # ------------------------
+    # Public API
+    # ------------------------
+    @property
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def add_hook(self, hook: Callable[[Span], None]) -> None:
+        self._hooks.append(hook)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        stack = self._stack()
+        parent = stack[-1] if stack else None
+        span = Span(name, self.trace_id, parent.span_id if parent else None, attributes)
+
+        if self.track_memory:
+            self._memory_enter(span, parent)
+
+        stack.append(span)
+        span.start_unix_nano = time.time_ns()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield span
+        finally:
+            span.wall_seconds = time.perf_counter() - wall_start
+            span.cpu_seconds = time.process_time() - cpu_start
+            span.end_unix_nano = time.time_ns()
+            stack.pop()
+
+            if self.track_memory:
+                self._memory_exit(span, parent)
+
+            with self._lock:
+                self._spans.append(span)
+            for hook in self._hooks:
+                hook(span)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Totals per span name: call count, wall/CPU seconds, max peak bytes.
+        """
+        totals: Dict[str, Dict[str, Any]] = {}
+        for span in self.spans:
+            entry = totals.setdefault(span.name, {
+                "count": 0,
+                "wall_seconds": 0.0,
+                "cpu_seconds": 0.0,
+                "peak_bytes": None,
+            })
+            entry["count"] += 1
+            entry["wall_seconds"] += span.wall_seconds
+            entry["cpu_seconds"] += span.cpu_seconds
+            if span.peak_bytes is not None:
+                entry["peak_bytes"] = max(entry["peak_bytes"] or 0, span.peak_bytes)
+        return totals
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "spans": [span.to_dict() for span in self.spans],
+            "summary": self.summary(),
+        }
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """
+        Spans in the OTLP/JSON trace format (``ExportTraceServiceRequest``).
+        """
+        spans = []
+        for span in self.spans:
+            attributes = dict(span.attributes)
+            attributes["sanitify.wall_seconds"] = span.wall_seconds
+            attributes["sanitify.cpu_seconds"] = span.cpu_seconds
+            if span.peak_bytes is not None:
+                attributes["sanitify.peak_bytes"] = span.peak_bytes
+
+            spans.append({
+                "traceId": span.trace_id,
+                "spanId": span.span_id,
+                "parentSpanId": span.parent_id or "",
+                "name": span.name,
+                "kind": 1,
+                "startTimeUnixNano": str(span.start_unix_nano),
+                "endTimeUnixNano": str(span.end_unix_nano),
+                "attributes": [_otlp_attribute(k, v) for k, v in attributes.items()],
+            })
+
+        return {
+            "resourceSpans": [{
+                "resource": {
+                    "attributes": [_otlp_attribute("service.name", self.service_name)],
+                },
+                "scopeSpans": [{
+                    "scope": {"name": "sanitify"},
+                    "spans": spans,
+                }],
+            }],
+        }
+
+    def export_otlp(self, endpoint: str = DEFAULT_OTLP_ENDPOINT, timeout: float = 5.0) -> int:
+        """
+        POST the spans to an OTLP/HTTP JSON collector; returns the HTTP status.
+        """
+        body = json.dumps(self.to_otlp()).encode("utf-8")
+        request = urllib.request.Request(
+            endpoint,
+            data=body,
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return int(response.status)
+
+    # ------------------------
+    # Internals
+    # ------------------------
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _memory_enter(self, span: Span, parent: Optional[Span]) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._memory_owner = span
+
+        current, peak = tracemalloc.get_traced_memory()
+        if parent is not None:
+            parent._peak_seen = max(parent._peak_seen, peak)
+        tracemalloc.reset_peak()
+
+        span._start_bytes = current
+        span._peak_seen = current
+
+    def _memory_exit(self, span: Span, parent: Optional[Span]) -> None:
+        _, peak = tracemalloc.get_traced_memory()
+        span._peak_seen = max(span._peak_seen, peak)
+        span.peak_bytes = max(span._peak_seen - span._start_bytes, 0)
+
+        if parent is not None:
+            parent._peak_seen = max(parent._peak_seen, span._peak_seen)
+            tracemalloc.reset_peak()
+        elif span is self._memory_owner:
+            tracemalloc.stop()
+            self._memory_owner = None
+
+
+class NullTracer:
+    """
+    Tracer stand-in that records nothing.
+    """
+
+    enabled = False
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[None]:
+        yield None
+
+
+NULL_TRACER = NullTracer()
+
+
+def logging_hook(logger: logging.Logger, level: int = logging.DEBUG) -> Callable[[Span], None]:
+    """
+    Hook that logs every finished span.
+    """
+    def hook(span: Span) -> None:
+        logger.log(
+            level,
+            "%s took %.4fs wall, %.4fs cpu, peak %s bytes",
+            span.name,
+            span.wall_seconds,
+            span.cpu_seconds,
+            span.peak_bytes,
+        )
+    return hook
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
@@ -0,0 +1,136 @@
+import asyncio
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sanitify import DataCleaner
+from sanitify.api import JobRejected, ProfilingService, estimate_source, serve
+
+
+def _csv(path, rows=5_000, seed=0):
+    rng = np.random.default_rng(seed)
+    pd.DataFrame({
+        "x": rng.normal(size=rows),
+        "flat": np.ones(rows),
+        "tag": rng.choice(["a", "b", None], size=rows),
+    }).to_csv(path, index=False)
+    return str(path)
+
+
+async def _request(port, method, path, body=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    payload = b"" if body is None else json.dumps(body).encode()
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(payload)}\r\n\r\n".encode()
+        + payload
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+
+    head, _, body = response.partition(b"\r\n\r\n")
+    lines = head.decode().split("\r\n")
+    headers = dict(line.split(": ", 1) for line in lines[1:])
+    return int(lines[0].split()[1]), headers, body
+
+
+def test_jobs_run_over_http_and_stream_progress(tmp_path):
+    path = _csv(tmp_path / "data.csv")
+
+    async def scenario():
+        async with ProfilingService(max_workers=1) as service:
+            server = await serve(service, port=0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                status, headers, body = await _request(
+                    port, "POST", "/jobs", {"path": path, "chunksize": 500, "partial_interval": 0}
+                )
+                assert status == 202
+                job = json.loads(body)
+                assert headers["Location"] == f"/jobs/{job['id']}"
+                assert job["estimated_rows"] == pytest.approx(5_000, rel=0.05)
+
+                status, _, body = await _request(port, "GET", f"/jobs/{job['id']}/stream")
+                events = [json.loads(line) for line in body.splitlines()]
+
+                status, _, body = await _request(port, "GET", f"/jobs/{job['id']}")
+                return events, json.loads(body)
+
+    events, final = asyncio.run(scenario())
+
+    assert events[-1]["status"] == "done"
+    rows = [event["progress"]["rows"] for event in events]
+    assert rows == sorted(rows) and rows[-1] == 5_000
+    partials = [event["profile"] for event in events if "profile" in event]
+    assert partials and all(p["dataset"]["rows"] <= 5_000 for p in partials)
+
+    dc = DataCleaner.from_path(path)
+    assert final["result"]["issues"] == json.loads(json.dumps(dc.check_quality()))
+    assert final["result"]["score"]["score"] == dc.quality_score()["score"]
+    assert final["progress"]["fraction"] == 1.0
+
+
+def test_admission_control_rejects_large_and_excess_jobs(tmp_path):
+    big = _csv(tmp_path / "big.csv", rows=300_000)
+    small = _csv(tmp_path / "small.csv", rows=100)
+    size = estimate_source(big)["bytes"]
+
+    async def scenario():
+        async with ProfilingService(max_workers=1, max_job_bytes=2 * size, max_pending_bytes=size) as service:
+            with pytest.raises(JobRejected) as too_large:
+                service.max_job_bytes = size // 2
+                await service.submit(big)
+            service.max_job_bytes = 2 * size
+
+            first = await service.submit(big)
+            with pytest.raises(JobRejected) as busy:
+                await service.submit(big)
+            assert service.stats()["pending_bytes"] == size
+
+            await service.wait(first.id)
+            # Idle again: the next job is admitted.
+            second = await service.submit(small)
+            await service.wait(second.id)
+            return too_large.value, busy.value, first, second
+
+    too_large, busy, first, second = asyncio.run(scenario())
+    assert too_large.status == 413
+    assert busy.status == 429 and busy.retry_after == 1
+    assert first.status == second.status == "done"
+
+
+def test_waiting_jobs_can_be_cancelled_and_failures_are_reported(tmp_path):
+    big = _csv(tmp_path / "big.csv", rows=300_000)
+    bad = tmp_path / "bad.csv"
+    bad.write_text("a,b\n1,2\n1,2,3,4\n")
+
+    async def scenario():
+        async with ProfilingService(max_workers=1) as service:
+            server = await serve(service, port=0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                running = await service.submit(big)
+                waiting = await service.submit(big)
+                failing = await service.submit(str(bad))
+
+                cancel = await _request(port, "DELETE", f"/jobs/{waiting.id}")
+                await service.wait(running.id)
+                conflict = await _request(port, "DELETE", f"/jobs/{running.id}")
+                await service.wait(failing.id)
+
+                missing = await _request(port, "GET", "/jobs/nope")
+                bad_path = await _request(port, "POST", "/jobs", {"path": str(tmp_path / "none.csv")})
+                bad_option = await _request(port, "POST", "/jobs", {"path": big, "chunk": 10})
+                health = await _request(port, "GET", "/health")
+                return cancel, conflict, missing, bad_path, bad_option, health, failing
+
+    cancel, conflict, missing, bad_path, bad_option, health, failing = asyncio.run(scenario())
+    assert cancel[0] == 200 and json.loads(cancel[2])["status"] == "cancelled"
+    assert conflict[0] == 409
+    assert missing[0] == 404
+    assert bad_path[0] == 400 and "FileNotFoundError" in json.loads(bad_path[2])["error"]
+    assert bad_option[0] == 400
+    assert json.loads(health[2])["jobs"] == {"queued": 0, "running": 0, "done": 1, "failed": 1, "cancelled": 1}
+    assert failing.status == "failed" and "ParserError" in failing.error
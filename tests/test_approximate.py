@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sanitify import DataCleaner
+from sanitify.core.profiler import DataProfiler
+
+
+def test_approximate_small_data_is_exact():
+    df = pd.DataFrame({"A": [1.0, 2.0, None, 2.0], "B": ["x", "y", "x", None]})
+
+    exact = DataProfiler(df).run()
+    approx = DataProfiler(df, approximate=True).run()
+
+    assert approx["columns"] == exact["columns"]
+
+
+def test_approximate_high_cardinality_records_error_bound():
+    n = 20_000
+    df = pd.DataFrame({
+        "id": [f"user_{i}" for i in range(n)],
+        "value": np.random.default_rng(0).normal(size=n),
+    })
+
+    profile = DataProfiler(df, approximate=True).run()
+    ids = profile["columns"]["id"]
+    values = profile["columns"]["value"]
+
+    assert "unique" in ids["approximate"]
+    assert ids["unique"] == pytest.approx(n, rel=4 * ids["approximate"]["unique"])
+    assert set(values["approximate"]) == {"unique", "median"}
+    assert values["numeric"]["min"] == df["value"].min()
+    assert values["numeric"]["median"] == pytest.approx(df["value"].median(), abs=0.05)
+
+
+def test_high_cardinality_issue_flags_approximate_metric():
+    n = 20_000
+    df = pd.DataFrame({"id": [f"user_{i}" for i in range(n)]})
+    dc = DataCleaner(df)
+    dc.profile(approximate=True)
+
+    issues = dc.check_quality()
+    issue = next(i for i in issues if i["rule"] == "high_cardinality")
+
+    assert issue["approximate"] is True
+    assert issue["metric"] <= 1.0
+    assert issue["error_bound"] > 0
+
+    penalties = dc.quality_score()["penalties"]
+    entry = next(p for p in penalties if p["rule"] == "high_cardinality")
+    assert entry["approximate_issues"] == 1
+
+
+def test_approximate_distinct_counts_keep_large_integer_ids_apart():
+    df = pd.DataFrame({"id": np.arange(100, dtype=np.int64) + 2 ** 60})
+    column = DataProfiler(df, approximate=True).run()["columns"]["id"]
+
+    assert column["unique"] == 100
+    assert not column["is_constant"]
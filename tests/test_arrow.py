@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from sanitify import DataCleaner
+from sanitify.core.profiler import DataProfiler
+from sanitify.utils.tracing import Tracer
+
+
+def _table(n=500):
+    rng = np.random.default_rng(11)
+    ints = rng.integers(0, 50, n)
+    return pa.table({
+        "x": pa.array(np.where(rng.random(n) < 0.1, np.nan, rng.normal(size=n))),
+        "k": pa.array(ints, mask=rng.random(n) < 0.2),
+        "full": pa.array(ints),
+        "flag": pa.array(rng.random(n) < 0.5),
+        "s": pa.array(rng.choice(["a", "b", "c"], n), mask=rng.random(n) < 0.3),
+        "cat": pa.array(rng.choice(["u", "v"], n)).dictionary_encode(),
+        "const": pa.array(np.full(n, 4, dtype=np.int64)),
+        "empty": pa.array([None] * n, pa.float64()),
+        "nothing": pa.array([None] * n, pa.int32()),
+    })
+
+
+def _assert_matches(got, expected):
+    assert got["dataset"]["rows"] == expected["dataset"]["rows"]
+    assert got["duplicates"] == expected["duplicates"]
+    assert list(got["columns"]) == list(expected["columns"])
+    for col, meta in expected["columns"].items():
+        other = got["columns"][col]
+        assert {k: v for k, v in other.items() if k != "numeric"} == \
+            {k: v for k, v in meta.items() if k != "numeric"}
+        assert ("numeric" in other) == ("numeric" in meta)
+        for key, value in (meta.get("numeric") or {}).items():
+            assert other["numeric"][key] == pytest.approx(value, nan_ok=True)
+
+
+def test_table_profile_matches_pandas_profile():
+    table = _table()
+    expected = DataProfiler(table.to_pandas()).run()
+
+    _assert_matches(DataProfiler.from_arrow(table).run(), expected)
+    _assert_matches(DataProfiler.from_arrow(table.to_batches()[0]).run(), expected)
+
+
+def test_parquet_statistics_skip_data_pages(tmp_path):
+    path = tmp_path / "data.parquet"
+    table = _table()
+    pq.write_table(table, path, row_group_size=128)
+
+    tracer = Tracer()
+    profile = DataProfiler.from_arrow(str(path), tracer=tracer).run()
+    _assert_matches(profile, DataProfiler(table.to_pandas()).run())
+
+    read = {span.attributes["column"] for span in tracer.spans if span.name == "profile.read"}
+    assert "const" not in read
+    assert "nothing" not in read
+    assert {"x", "k", "s"} <= read
+
+
+def test_cleaner_from_arrow(tmp_path):
+    path = tmp_path / "data.parquet"
+    pq.write_table(_table(), path)
+
+    dc = DataCleaner.from_arrow(str(path))
+    rules = {issue["rule"] for issue in dc.check_quality()}
+    assert "high_missing" in rules
+
+    with pytest.raises(ValueError):
+        dc.apply_fixes([])
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sanitify.core.batch import profile_columns
+
+
+def test_batched_numeric_matches_pandas():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=101)
+    values[::7] = np.nan
+    df = pd.DataFrame({
+        "f": values,
+        "i": rng.integers(0, 10, 101),
+        "b": rng.integers(0, 2, 101).astype(bool),
+    })
+
+    profiles = profile_columns(df, len(df))
+
+    for col in ["f", "i"]:
+        clean = df[col].dropna()
+        numeric = profiles[col]["numeric"]
+        assert profiles[col]["missing"] == int(df[col].isna().sum())
+        assert profiles[col]["unique"] == int(df[col].nunique())
+        assert numeric["mean"] == pytest.approx(clean.mean())
+        assert numeric["std"] == pytest.approx(clean.std())
+        assert numeric["min"] == clean.min()
+        assert numeric["max"] == clean.max()
+        assert numeric["median"] == pytest.approx(clean.median())
+
+    assert profiles["b"]["unique"] == 2
+
+
+def test_batched_preserves_column_order_and_dtype():
+    df = pd.DataFrame({
+        "s": ["a", "b", None],
+        "x": [1.0, None, 3.0],
+        "n": pd.array([1, None, 1], dtype="Int64"),
+    })
+
+    profiles = profile_columns(df, len(df))
+
+    assert list(profiles) == ["s", "x", "n"]
+    assert profiles["n"]["dtype"] == "Int64"
+    assert profiles["n"]["is_constant"] is True
+    assert "numeric" not in profiles["s"]
+
+
+def test_batched_all_missing_numeric():
+    df = pd.DataFrame({"x": [np.nan, np.nan]})
+
+    profiles = profile_columns(df, len(df))
+
+    assert profiles["x"]["unique"] == 0
+    assert profiles["x"]["numeric"]["median"] is None
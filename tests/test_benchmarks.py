@@ -0,0 +1,27 @@
+import json
+
+from benchmarks import compare, pipeline
+from benchmarks.synthetic import make_frame
+
+
+def test_make_frame_shape_and_missing_rate():
+    df = make_frame(2_000, 10, missing_rate=0.2, cardinality=50, duplicate_rate=0.1)
+
+    assert df.shape == (2_000, 10)
+    assert 0.1 < df.isna().to_numpy().mean() < 0.3
+    assert df.duplicated().sum() >= 200
+
+
+def test_pipeline_benchmark_roundtrip(tmp_path):
+    output = tmp_path / "run.json"
+    report = pipeline.main([
+        "--rows", "500", "--columns", "5", "--repeat", "1", "--output", str(output),
+    ])
+
+    stages = report["results"][0]["stages"]
+    assert set(stages) == set(pipeline.STAGES)
+    assert all("peak_bytes" in timing for timing in stages.values())
+
+    saved = json.loads(output.read_text())
+    assert compare.main([str(output), str(output)]) == 0
+    assert all(row["ratio"] == 1.0 for row in compare.compare(saved, saved))
@@ -0,0 +1,89 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+import sanitify
+from sanitify import DataCleaner, profile_many
+from sanitify.core.rules import compile_rules
+
+
+def _frames(count=6):
+    return {
+        f"t{i}": pd.DataFrame({"a": [1.0, None, 3.0, float(i)], "b": ["x", "x", "x", "x"]})
+        for i in range(count)
+    }
+
+
+def test_results_match_single_cleaner_runs():
+    frames = _frames()
+    results = {r["name"]: r for r in profile_many(frames, n_jobs=3)}
+
+    assert set(results) == set(frames)
+    for name, df in frames.items():
+        dc = DataCleaner(df)
+        assert results[name]["ok"]
+        assert results[name]["issues"] == dc.check_quality()
+        assert results[name]["score"] == dc.quality_score()
+        assert results[name]["suggestions"] == dc.suggest_fixes()
+        assert results[name]["seconds"] >= 0
+
+
+def test_failing_tables_do_not_abort_the_batch(tmp_path):
+    good = tmp_path / "good.csv"
+    pd.DataFrame({"a": [1, 2, 2]}).to_csv(good, index=False)
+    sources = [pd.DataFrame({"a": [1, 1]}), str(tmp_path / "missing.csv"), 42, good]
+
+    results = list(profile_many(sources, n_jobs=2, ordered=True))
+
+    assert [r["name"] for r in results] == [0, str(tmp_path / "missing.csv"), 2, str(good)]
+    assert [r["ok"] for r in results] == [True, False, False, True]
+    assert results[2]["error"].startswith("TypeError")
+    assert "Traceback" in results[1]["traceback"]
+    assert results[3]["profile"]["dataset"]["rows"] == 3
+
+
+def test_sources_are_consumed_lazily():
+    consumed = []
+
+    def tables():
+        for i in range(20):
+            consumed.append(i)
+            yield pd.DataFrame({"a": [i, i + 1]})
+
+    results = profile_many(tables(), n_jobs=2, ordered=True)
+    first = next(results)
+    assert first["name"] == 0
+    # At most two tables per worker are drawn ahead of the consumer.
+    assert len(consumed) <= 5
+    assert [r["name"] for r in results] == list(range(1, 20))
+
+
+def test_rules_compile_once_and_scorer_is_shared(monkeypatch):
+    spec = [{"rule": "constant_column", "weight": 50, "cap": 50}]
+    seen = set()
+    lock = threading.Lock()
+
+    original = DataCleaner._init_pipeline
+
+    def spy(self, *args, **kwargs):
+        original(self, *args, **kwargs)
+        with lock:
+            seen.add((id(self._engine.plan), id(self._scorer)))
+
+    monkeypatch.setattr(DataCleaner, "_init_pipeline", spy)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = list(profile_many(_frames(), executor=pool, rules=spec, suggestions=False))
+
+    assert len(seen) == 1
+    assert next(iter(seen))[0] == id(compile_rules(spec))
+    for result in results:
+        assert [i["rule"] for i in result["issues"]] == ["constant_column"]
+        assert result["score"]["score"] == 50
+        assert result["suggestions"] is None
+
+
+def test_profile_options_are_forwarded():
+    (result,) = profile_many([pd.DataFrame({"a": range(1000)})], max_sample_size=100, approximate=True)
+    assert result["profile"]["dataset"]["sample_size"] == 100
+    assert sanitify.__all__ == ["DataCleaner", "profile_many"]
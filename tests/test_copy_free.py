@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sanitify import DataCleaner
+from sanitify.cleaning.deterministic import FixApplier
+from sanitify.utils import frames
+from sanitify.utils.frames import drop_columns
+
+
+def _frame():
+    return pd.DataFrame({
+        "A": [1.0, None, 3.0],
+        "B": [4.0, 5.0, 6.0],
+        "C": ["x", "y", "z"],
+    })
+
+
+def test_apply_shares_untouched_columns():
+    df = _frame()
+
+    out = FixApplier().apply(df, [{"column": "A", "operation": "impute_mean"}])
+
+    assert out["A"].isna().sum() == 0
+    assert df["A"].isna().sum() == 1
+    assert np.shares_memory(out["B"].to_numpy(), df["B"].to_numpy())
+
+
+def test_drop_columns_does_not_copy_remaining():
+    df = _frame()
+
+    out = drop_columns(df, ["A"])
+
+    assert list(out.columns) == ["B", "C"]
+    assert np.shares_memory(out["B"].to_numpy(), df["B"].to_numpy())
+
+
+@pytest.mark.parametrize("copy_on_write", [True, False])
+def test_drop_columns_with_duplicate_labels(monkeypatch, copy_on_write):
+    monkeypatch.setattr(frames, "copy_on_write_enabled", lambda: copy_on_write)
+    df = pd.DataFrame(np.arange(12.0).reshape(3, 4), columns=["a", "a", "b", "c"])
+
+    out = drop_columns(df, ["b", "missing"])
+
+    assert list(out.columns) == ["a", "a", "c"]
+    assert out.to_numpy().tolist() == df.iloc[:, [0, 1, 3]].to_numpy().tolist()
+    assert list(drop_columns(df, ["a"]).columns) == ["b", "c"]
+    assert list(df.columns) == ["a", "a", "b", "c"]
+
+
+def test_drop_all_columns():
+    out = drop_columns(_frame(), ["A", "B", "C"])
+
+    assert out.shape == (3, 0)
+
+
+def test_datacleaner_copy_false_keeps_reference():
+    df = _frame()
+    dc = DataCleaner(df, copy=False)
+
+    clean = dc.apply_fixes([{"column": "A", "operation": "impute_median"}])
+
+    assert clean["A"].tolist() == [1.0, 2.0, 3.0]
+    assert df["A"].isna().sum() == 1
+    assert dc._df is df
@@ -0,0 +1,82 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from sanitify.core.duplicates import DuplicateCounter, count_duplicates, row_fingerprints
+from sanitify.core.profiler import DataProfiler
+from sanitify.core.quality import DuplicateRateRule
+
+
+def _frame(rows=2_000, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "a": rng.integers(0, rows // 2, size=rows),
+        "b": rng.choice(["x", "y", None], size=rows),
+        "c": rng.integers(0, 4, size=rows).astype(float),
+    })
+    df.loc[::7, "c"] = np.nan
+    return df
+
+
+def test_duplicates_use_full_dataset_not_sample():
+    df = _frame()
+    profile = DataProfiler(df, max_sample_size=100, approximate=True).run()
+
+    assert profile["dataset"]["sampled"]
+    assert profile["duplicates"] == int(df.duplicated().sum())
+    assert profile["duplicate_detection"]["exact"]
+
+
+def test_counter_spills_and_merges(tmp_path):
+    df = _frame(rows=20_000, seed=1)
+    expected = int(df.duplicated().sum())
+
+    counter = DuplicateCounter(memory_limit=8 * 300, spill_dir=str(tmp_path))
+    other = DuplicateCounter(memory_limit=8 * 300, spill_dir=str(tmp_path))
+    for start in range(0, 10_000, 1_000):
+        counter.update(row_fingerprints(df.iloc[start:start + 1_000]))
+    other.update_frame(df.iloc[10_000:])
+
+    counter.merge(other)
+    assert counter.spilled
+    assert counter.count() == expected
+
+    counter.close()
+    other.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_streamed_duplicates_are_exact():
+    df = _frame(rows=5_000, seed=2)
+    chunks = (df.iloc[i:i + 512] for i in range(0, len(df), 512))
+    profile = DataProfiler.from_chunks(chunks, duplicate_memory_limit=8 * 200).run()
+
+    assert profile["duplicates"] == int(df.duplicated().sum())
+    assert profile["duplicate_detection"]["exact"]
+    assert profile["duplicate_detection"]["spilled"]
+
+
+def test_estimated_duplicates_are_flagged():
+    df = pd.DataFrame({"a": np.arange(20_000) % 10_000})
+    result = count_duplicates(df, approximate=True)
+
+    assert not result["detection"]["exact"]
+    assert abs(result["count"] - 10_000) < 500
+
+    profile = DataProfiler(df, approximate=True).run()
+    issues = DuplicateRateRule().evaluate(profile)
+    assert issues[0]["approximate"]
+    assert issues[0]["error_bound"] == profile["duplicate_detection"]["error_bound"]
+
+
+def test_large_integer_ids_are_not_duplicates():
+    df = pd.DataFrame({"id": [2 ** 60 + i for i in range(4)], "flag": [True] * 4})
+    profile = DataProfiler(df).run()
+
+    assert profile["duplicates"] == df.duplicated().sum() == 0
+    assert profile["duplicate_detection"]["exact"]
+    assert len(np.unique(row_fingerprints(df))) == 4
+    # Chunks read as int64 and as float64 still fingerprint alike.
+    ints, floats = pd.DataFrame({"k": [1, 2]}), pd.DataFrame({"k": [1.0, 2.0]})
+    assert (row_fingerprints(ints) == row_fingerprints(floats)).all()
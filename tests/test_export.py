@@ -0,0 +1,69 @@
+import io
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sanitify import DataCleaner
+from sanitify.report.exporter import JSONExporter, get_exporter
+
+
+def _frame():
+    return pd.DataFrame({
+        "a": [1.0, None, 4.0, 4.0],
+        "b": ["x", "x", "x", "x"],
+        3: [1, 2, 3, 4],
+        "when": pd.to_datetime(["2024-01-01", None, "2024-01-03", "2024-01-03"]),
+    })
+
+
+def test_streamed_json_matches_json_dump(tmp_path):
+    report = DataCleaner(_frame()).export_report()
+    report["extra"] = {"count": np.int64(3), "ratio": np.float32(0.5), "flags": np.array([True, False])}
+    reference = json.loads(json.dumps(report, default=lambda v: v.tolist()))
+
+    for indent, separators in ((4, None), (2, None), (None, (",", ":"))):
+        out = io.StringIO()
+        JSONExporter(indent=indent).write(report, out)
+        expected = json.dumps(reference, indent=indent, separators=separators)
+        assert out.getvalue() == expected
+
+    path = tmp_path / "report.json"
+    DataCleaner(_frame()).export_report(path=str(path), compact=True)
+    assert "\n" not in path.read_text()
+    assert json.loads(path.read_text())["profile"]["columns"]["3"]["unique"] == 4
+
+
+def test_msgpack_export_round_trips(tmp_path):
+    msgpack = pytest.importorskip("msgpack")
+    path = tmp_path / "report.msgpack"
+    dc = DataCleaner(_frame())
+    report = dc.export_report(format="msgpack", path=str(path))
+
+    loaded = msgpack.unpackb(path.read_bytes(), raw=False, strict_map_key=False)
+    assert loaded["profile"]["columns"][3]["unique"] == 4
+    assert loaded["quality_issues"] == json.loads(json.dumps(report["quality_issues"]))
+
+
+def test_parquet_export_writes_column_table(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "profile.parquet"
+    dc = DataCleaner(_frame())
+    report = dc.export_report(format="parquet", path=str(path))
+
+    table = pq.read_table(path)
+    assert table.column("column").to_pylist() == ["a", "b", "3", "when"]
+    assert table.column("missing").to_pylist() == [1, 0, 0, 1]
+    assert table.column("median").to_pylist()[0] == 4.0
+
+    rest = json.loads(table.schema.metadata[b"sanitify.report"])
+    assert "columns" not in rest["profile"]
+    assert rest["quality_score"] == json.loads(json.dumps(report["quality_score"]))
+
+
+def test_unknown_formats_are_rejected():
+    with pytest.raises(ValueError, match="Unsupported report format"):
+        get_exporter("xml")
+    with pytest.raises(ValueError, match="Unsupported report format"):
+        DataCleaner(_frame()).export_report(format="xml")
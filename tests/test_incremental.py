@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sanitify import DataCleaner
+from sanitify.core.profiler import DataProfiler
+from sanitify.utils.tracing import Tracer
+
+
+def _frame(n=600, seed=3):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "x": np.where(rng.random(n) < 0.3, np.nan, rng.normal(size=n)),
+        "k": rng.integers(0, 40, n),
+        "s": rng.choice([" a", "b ", None], n),
+        "empty": np.full(n, np.nan),
+    })
+
+
+def _assert_same_profile(got, expected):
+    assert got["dataset"] == expected["dataset"]
+    assert got["duplicates"] == expected["duplicates"]
+    assert list(got["columns"]) == list(expected["columns"])
+    for col, meta in expected["columns"].items():
+        other = got["columns"][col]
+        assert {k: v for k, v in other.items() if k != "numeric"} == \
+            {k: v for k, v in meta.items() if k != "numeric"}
+        for key, value in (meta.get("numeric") or {}).items():
+            assert other["numeric"][key] == pytest.approx(value, nan_ok=True)
+
+
+def test_fixes_reprofile_only_touched_columns():
+    tracer = Tracer()
+    dc = DataCleaner(_frame(), tracer=tracer)
+    dc.profile()
+
+    fixes = [
+        {"column": "x", "operation": "impute_mean"},
+        {"column": "empty", "operation": "drop_column"},
+    ]
+    cleaned = dc.apply_fixes(fixes, inplace=True)
+    refreshed = dc.profile()
+
+    _assert_same_profile(refreshed, DataProfiler(cleaned).run())
+    assert "empty" not in refreshed["columns"]
+
+    refresh = [span for span in tracer.spans if span.name == "profile.refresh"]
+    assert len(refresh) == 1
+    assert refresh[0].attributes["columns"] == 1
+
+
+def test_row_changing_fixes_reprofile_everything():
+    df = pd.concat([_frame(), _frame().iloc[:20]], ignore_index=True)
+    dc = DataCleaner(df)
+    dc.profile()
+
+    cleaned = dc.apply_fixes([{"column": None, "operation": "drop_duplicates"}], inplace=True)
+    profile = dc.profile()
+
+    assert profile["dataset"]["rows"] == len(cleaned) < len(df)
+    _assert_same_profile(profile, DataProfiler(cleaned).run())
+
+
+def test_update_merges_appended_rows():
+    first, second = _frame(seed=1), _frame(n=250, seed=2)
+    dc = DataCleaner(first)
+    dc.profile()
+
+    profile = dc.update(second, incremental=True)
+    expected = DataProfiler(pd.concat([first, second])).run()
+
+    assert profile["incremental"]
+    assert profile["dataset"]["rows"] == 850
+    assert profile["duplicates"] == expected["duplicates"]
+    for col, meta in expected["columns"].items():
+        assert profile["columns"][col]["missing"] == meta["missing"]
+        assert profile["columns"][col]["unique"] == meta["unique"]
+    assert profile["columns"]["x"]["numeric"]["std"] == pytest.approx(
+        expected["columns"]["x"]["numeric"]["std"]
+    )
+
+    # fixes after an append refresh the mergeable state
+    dc.apply_fixes([{"column": "x", "operation": "impute_median"}], inplace=True)
+    assert dc.profile()["columns"]["x"]["missing"] == 0
+    assert dc.profile()["columns"]["k"] == profile["columns"]["k"]
+    assert len(dc.apply_fixes([])) == 850
+
+
+def test_update_appends_lazily_with_a_continued_index():
+    first, second = _frame(n=300, seed=1), _frame(n=100, seed=2)
+    dc = DataCleaner(first)
+
+    dc.update(second.iloc[:40])
+    profile = dc.update(second.iloc[40:].reset_index(drop=True))
+
+    assert "incremental" not in profile
+    _assert_same_profile(profile, DataProfiler(pd.concat([first, second], ignore_index=True)).run())
+    assert dc._df.index.equals(pd.RangeIndex(400))
+    assert dc._appended == []
+
+
+def test_update_keeps_labels_of_non_default_indexes():
+    first = _frame(n=10, seed=1).set_axis(pd.RangeIndex(5, 15), axis=0)
+    dc = DataCleaner(first)
+    dc.update(_frame(n=3, seed=2))
+    assert dc._df.index.tolist() == list(range(5, 15)) + [0, 1, 2]
+
+    stamps = pd.date_range("2024-01-01", periods=13, freq="h")
+    dated = DataCleaner(_frame(n=10, seed=1).set_axis(stamps[:10], axis=0))
+    dated.update(_frame(n=3, seed=2).set_axis(stamps[10:], axis=0))
+    assert dated._df.index.equals(stamps)
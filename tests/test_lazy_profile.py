@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sanitify import DataCleaner
+from sanitify.core.lazy import PROFILE_METRICS, select_profile
+from sanitify.core.profiler import DataProfiler
+from sanitify.core.quality import ColumnRule, HighMissingRule, RuleEngine
+from sanitify.datacleaner import default_rules
+
+
+def _frame(rows=3_000):
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame({
+        "price": rng.random(rows),
+        "qty": rng.integers(0, 5, rows),
+        "city": pd.Series(rng.choice(["a", "b", None], rows), dtype=object),
+        "code": pd.array(np.where(rng.random(rows) < 0.3, None, rng.integers(0, 9, rows)), dtype="Int64"),
+        "empty": pd.Series([None] * rows, dtype=object),
+        "flag": rng.random(rows) > 0.5,
+    })
+    df.loc[::7, "price"] = np.nan
+    return df
+
+
+@pytest.mark.parametrize("options", [{}, {"max_sample_size": 1_000, "approximate": True}, {"approximate": True}])
+@pytest.mark.parametrize("metrics", [
+    ["missing_pct"],
+    ["mean", "std", "min", "max"],
+    ["median", "unique"],
+    ["missing", "memory_bytes", "duplicates"],
+])
+def test_selected_metrics_match_full_profile(options, metrics):
+    df = _frame()
+    full = DataProfiler(df, **options).run()
+
+    for columns in (None, ["price", "city", "empty"]):
+        selected = DataProfiler(df, columns=columns, metrics=metrics, **options).run()
+        assert selected == select_profile(full, columns, frozenset(metrics))
+        assert selected["selection"]["metrics"] == [m for m in PROFILE_METRICS if m in metrics]
+
+
+def test_selective_profile_omits_unselected_metrics():
+    profile = DataProfiler(_frame(), columns=["qty"], metrics=["missing_pct"]).run()
+
+    assert profile["columns"] == {"qty": {"dtype": "int64", "missing_pct": 0.0}}
+    assert "memory_bytes" not in profile["dataset"]
+    assert profile["duplicates"] is None
+    with pytest.raises(ValueError):
+        DataProfiler(_frame(), metrics=["entropy"])
+    with pytest.raises(KeyError):
+        DataProfiler(_frame(), columns=["nope"])
+
+
+def test_lazy_profile_computes_metrics_on_access():
+    df = _frame()
+    lazy = DataProfiler(df).lazy()
+
+    assert lazy["columns"]["price"]["missing_pct"] == pytest.approx(df["price"].isna().mean())
+    assert lazy.computed["price"] == {"missing", "missing_pct"}
+    assert lazy.computed["qty"] == set()
+    assert lazy["dataset"]["rows"] == len(df)
+
+    assert lazy["columns"]["qty"]["numeric"]["median"] == 2.0
+    assert {"mean", "median"} <= lazy.computed["qty"]
+    assert lazy["duplicates"] == int(df.duplicated().sum())
+
+    assert lazy.to_dict() == DataProfiler(df).run()
+
+
+def test_rules_declare_the_metrics_they_read():
+    assert RuleEngine(default_rules()).required_metrics() == {"missing_pct", "is_constant", "unique", "duplicates"}
+    assert RuleEngine([HighMissingRule()]).required_metrics() == {"missing_pct"}
+
+    class Spread(ColumnRule):
+        name = "spread"
+
+        def metric(self, table):
+            return table["std"]
+
+    assert RuleEngine([HighMissingRule(), Spread()]).required_metrics() is None
+
+
+def test_cleaner_profiles_only_what_rules_need(tmp_path):
+    df = _frame()
+    df["empty"] = None
+    full = DataCleaner(df).check_quality()
+
+    dc = DataCleaner(df)
+    profile = dc.profile(metrics="rules")
+    assert "numeric" not in profile["columns"]["price"]
+    assert "memory_bytes" not in profile["dataset"]
+    assert dc.check_quality() == full
+
+    # Suggestions need every metric and replace the selective profile.
+    assert dc.suggest_fixes() == DataCleaner(df).suggest_fixes()
+
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+    streamed = DataCleaner.from_path(str(path), chunksize=500).profile(columns=["qty"], metrics=["mean"])
+    assert streamed["columns"]["qty"] == {"dtype": "int64", "numeric": {"mean": pytest.approx(df["qty"].mean())}}
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sanitify import DataCleaner
+from sanitify.core.memory import estimate_memory
+from sanitify.core.profiler import DataProfiler
+
+
+def _text_frame(rows=60_000):
+    rng = np.random.default_rng(3)
+    words = np.array(["a" * n for n in range(1, 80)], dtype=object)
+    return pd.DataFrame({
+        "text": pd.Series(words[rng.integers(0, len(words), rows)], dtype=object),
+        "tagged": pd.Series(rng.choice(["x", None, "long value " * 3], rows), dtype=object),
+        "value": rng.normal(size=rows),
+    })
+
+
+def test_exact_mode_matches_deep_memory_usage():
+    df = _text_frame(1_000)
+    dataset = DataProfiler(df).run()["dataset"]
+
+    assert dataset["memory_bytes"] == int(df.memory_usage(deep=True).sum())
+    assert dataset["memory_mode"] == "exact"
+    assert dataset["memory_error_bytes"] == 0.0
+
+
+def test_sampled_mode_is_within_reported_error():
+    df = _text_frame()
+    exact = int(df.memory_usage(deep=True).sum())
+    dataset = DataProfiler(df, memory_mode="sampled").run()["dataset"]
+
+    assert dataset["memory_mode"] == "sampled"
+    assert 0 < dataset["memory_error_bytes"] < 0.05 * exact
+    # 95% half-width: allow the occasional draw in the tails.
+    assert abs(dataset["memory_bytes"] - exact) <= 2 * dataset["memory_error_bytes"]
+
+
+def test_sampled_mode_is_exact_on_small_frames():
+    df = _text_frame(500)
+    estimate = estimate_memory(df, "sampled", sample_rows=1_000)
+
+    assert estimate["memory_bytes"] == int(df.memory_usage(deep=True).sum())
+    assert estimate["memory_error_bytes"] == 0.0
+
+
+def test_shallow_mode_is_a_lower_bound():
+    df = _text_frame(1_000)
+    dataset = DataProfiler(df, memory_mode="shallow").run()["dataset"]
+
+    assert dataset["memory_bytes"] == int(df.memory_usage(deep=False).sum())
+    assert dataset["memory_bytes"] < int(df.memory_usage(deep=True).sum())
+    assert dataset["memory_error_bytes"] is None
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        DataProfiler(_text_frame(10), memory_mode="deep")
+
+
+def test_cleaner_keys_profiles_by_memory_mode():
+    dc = DataCleaner(_text_frame(2_000))
+    shallow = dc.profile(memory_mode="shallow")
+    exact = dc.profile()
+
+    assert shallow["dataset"]["memory_mode"] == "shallow"
+    assert exact["dataset"]["memory_mode"] == "exact"
+    assert exact["dataset"]["memory_bytes"] > shallow["dataset"]["memory_bytes"]
+
+
+def test_refresh_keeps_memory_mode():
+    df = _text_frame(2_000)
+    dc = DataCleaner(df)
+    dc.profile(memory_mode="shallow")
+    cleaned = dc.apply_fixes([{"column": "value", "operation": "impute_median"}], inplace=True)
+
+    profile = dc.profile(memory_mode="shallow")
+    assert profile["dataset"]["memory_mode"] == "shallow"
+    assert profile["dataset"]["memory_bytes"] == int(cleaned.memory_usage(deep=False).sum())
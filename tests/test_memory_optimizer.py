@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sanitify import DataCleaner
+from sanitify.cleaning.deterministic import FixRegistry
+from sanitify.core import optimize
+from sanitify.core.optimize import downcast_dtype
+from sanitify.core.suggestions import DeterministicSuggestionEngine
+
+
+def _frame(rows=20_000):
+    rng = np.random.default_rng(1)
+    return pd.DataFrame({
+        "city": pd.Series(rng.choice([f"city_{i}" for i in range(50)], rows), dtype=object),
+        "age": rng.integers(0, 120, rows),
+        "delta": rng.integers(-1_000, 1_000, rows),
+        "halves": rng.integers(0, 8, rows) / 2,
+        "noise": rng.random(rows),
+        "rare": np.where(rng.random(rows) < 0.95, np.nan, 1.0),
+    })
+
+
+def _cleaner(df, **engine):
+    dc = DataCleaner(df, rules=[])
+    dc._suggestion_engine = DeterministicSuggestionEngine(min_memory_savings=1, **engine)
+    return dc
+
+
+def test_downcast_dtype_picks_narrowest_safe_width():
+    assert downcast_dtype("int64", 0, 120) == "int8"
+    assert downcast_dtype("int64", -1_000, 1_000) == "int16"
+    assert downcast_dtype("int64", 0, 2 ** 40) is None
+    assert downcast_dtype("uint32", 0, 200) == "uint8"
+    assert downcast_dtype("Int64", -5, 5) == "Int8"
+    assert downcast_dtype("float64", -1.0, 1.0) == "float32"
+    assert downcast_dtype("int8", 0, 1) is None
+
+
+def test_suggestions_project_the_bytes_they_save():
+    df = _frame()
+    dc = _cleaner(df)
+    suggestions = dc.suggest_fixes()
+
+    by_column = {s["column"]: s for s in suggestions}
+    assert {c: s["operation"] for c, s in by_column.items()} == {
+        "city": "to_category",
+        "age": "downcast",
+        "delta": "downcast",
+        "halves": "downcast",
+        "rare": "to_sparse",
+    }
+    assert by_column["age"]["params"] == {"dtype": "int8"}
+    savings = [s["projected_savings_bytes"] for s in suggestions]
+    assert savings == sorted(savings, reverse=True)
+
+    cleaned = dc.apply_fixes(suggestions)
+    before = df.memory_usage(deep=True, index=False)
+    after = cleaned.memory_usage(deep=True, index=False)
+    for column, suggestion in by_column.items():
+        actual = before[column] - after[column]
+        assert suggestion["projected_savings_bytes"] == pytest.approx(actual, rel=0.05)
+    pd.testing.assert_frame_equal(cleaned.astype(df.dtypes), df)
+
+
+def test_object_strings_fall_back_to_category_without_pyarrow(monkeypatch):
+    rows = 4_000
+    df = pd.DataFrame({
+        "repeats": pd.Series([f"label {i % 3_000}" for i in range(rows)], dtype=object),
+        "unique": pd.Series([f"label {i}" for i in range(rows)], dtype=object),
+    })
+    monkeypatch.setattr(optimize, "_pyarrow_available", lambda: False)
+    suggestions = _cleaner(df).suggest_fixes()
+
+    assert [(s["column"], s["operation"]) for s in suggestions] == [("repeats", "to_category")]
+    cleaned = _cleaner(df).apply_fixes(suggestions)
+    assert isinstance(cleaned["repeats"].dtype, pd.CategoricalDtype)
+
+
+def test_downcast_keeps_columns_that_do_not_round_trip():
+    df = pd.DataFrame({"x": [1, 300, -5], "y": [0.1, 0.2, 0.3]})
+    out = FixRegistry.downcast(df.copy(), "x", {"dtype": "int8"})
+    out = FixRegistry.downcast(out, "y", {"dtype": "float32"})
+    assert out.dtypes.tolist() == [np.int64, np.float64]
+
+
+def test_memory_fixes_respect_other_suggestions_and_settings():
+    df = _frame(2_000)
+    df["gone"] = np.nan
+    dc = DataCleaner(df)
+    dc._suggestion_engine = DeterministicSuggestionEngine(min_memory_savings=1)
+    suggestions = dc.suggest_fixes()
+    assert not any(s["column"] == "gone" and s["operation"] == "to_sparse" for s in suggestions)
+
+    assert not any("projected_savings_bytes" in s for s in _cleaner(df, memory_fixes=False).suggest_fixes())
+    # The default threshold keeps small frames free of memory suggestions.
+    assert not any("projected_savings_bytes" in s for s in DataCleaner(df).suggest_fixes())
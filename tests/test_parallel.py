@@ -0,0 +1,53 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sanitify import DataCleaner
+from sanitify.core.parallel import column_groups
+from sanitify.core.profiler import DataProfiler
+
+
+def _frame():
+    rng = np.random.default_rng(3)
+    n = 500
+    data = {f"f{i}": rng.normal(size=n) for i in range(6)}
+    data["s"] = rng.choice(["a", "b", None], n)
+    data["i"] = rng.integers(0, 5, n)
+    data["t"] = rng.choice(["x", "y"], n)
+    return pd.DataFrame(data)
+
+
+def test_thread_pool_matches_serial():
+    df = _frame()
+
+    serial = DataProfiler(df).run()
+    threaded = DataProfiler(df, n_jobs=3).run()
+
+    assert threaded == serial
+    assert list(threaded["columns"]) == list(df.columns)
+
+
+def test_process_pool_matches_serial():
+    df = _frame()
+
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        parallel = DataCleaner(df).profile(executor=pool)
+
+    assert parallel == DataProfiler(df).run()
+
+
+def test_column_groups_cover_every_column_once():
+    df = _frame()
+
+    groups = column_groups(df, n_jobs=4)
+    positions = sorted(pos for _, group in groups for pos in group)
+
+    assert positions == list(range(df.shape[1]))
+    assert all(len({str(df.dtypes.iloc[p]) for p in group}) == 1 for is_block, group in groups if is_block)
+
+
+def test_invalid_n_jobs():
+    with pytest.raises(ValueError):
+        DataProfiler(_frame(), n_jobs=0).run()
@@ -0,0 +1,49 @@
+import pandas as pd
+
+from sanitify import DataCleaner
+from sanitify.core.quality import RuleEngine, HighMissingRule
+from sanitify.core.profiler import DataProfiler
+
+
+def _count_calls(monkeypatch, cls, name):
+    calls = {"n": 0}
+    original = getattr(cls, name)
+
+    def wrapper(self, *args, **kwargs):
+        calls["n"] += 1
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(cls, name, wrapper)
+    return calls
+
+
+def test_export_report_runs_each_stage_once(monkeypatch):
+    profiles = _count_calls(monkeypatch, DataProfiler, "run")
+    rules = _count_calls(monkeypatch, RuleEngine, "run")
+
+    dc = DataCleaner(pd.DataFrame({"A": [1, None, None, None]}))
+    dc.export_report()
+    dc.export_report()
+
+    assert profiles["n"] == 1
+    assert rules["n"] == 1
+
+
+def test_rule_configuration_change_recomputes_issues():
+    rule = HighMissingRule(threshold=0.9)
+    dc = DataCleaner(pd.DataFrame({"A": [1, None, None, 4]}), rules=[rule])
+
+    assert not any(i["rule"] == "high_missing" for i in dc.check_quality())
+
+    rule.threshold = 0.3
+    assert [i["rule"] for i in dc.check_quality()] == ["high_missing"]
+
+
+def test_apply_fixes_inplace_invalidates_cache():
+    dc = DataCleaner(pd.DataFrame({"A": [1, None, None, 3]}))
+    assert dc.check_quality()
+
+    dc.apply_fixes([{"column": "A", "operation": "impute_mean"}], inplace=True)
+
+    assert dc.profile()["columns"]["A"]["missing"] == 0
+    assert not any(i["rule"] == "high_missing" for i in dc.check_quality())
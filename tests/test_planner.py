@@ -0,0 +1,83 @@
+import pandas as pd
+import pytest
+
+from sanitify import DataCleaner
+from sanitify.cleaning.deterministic import FixApplier, FixRegistry
+
+
+def _frame():
+    return pd.DataFrame({
+        "A": [1.0, None, 3.0, 1.0],
+        "B": ["x", None, "x", "x"],
+        "C": [None, None, None, None],
+    })
+
+
+FIXES = [
+    {"column": "A", "operation": "impute_median"},
+    {"column": "C", "operation": "drop_column"},
+    {"column": None, "operation": "drop_duplicates"},
+    {"column": "B", "operation": "impute_mode"},
+    {"column": "C", "operation": "impute_mode"},
+    {"column": "A", "operation": "impute_mean"},
+]
+
+
+def test_plan_orders_and_fuses_steps():
+    plan = FixApplier().plan(_frame(), FIXES)
+
+    operations = [step["operation"] for step in plan["steps"]]
+    assert operations == ["drop_columns", "fillna", "drop_duplicates"]
+
+    fill = plan["steps"][1]
+    assert fill["values"] == {"A": 1.0, "B": "x"}
+    assert {s["reason"] for s in plan["skipped"]} == {"column dropped", "column already imputed"}
+    assert plan["estimated_cost"] == sum(s["estimated_cost"] for s in plan["steps"])
+
+
+def test_optimized_apply_matches_expected_frame():
+    out = FixApplier().apply(_frame(), FIXES, optimize=True)
+
+    assert list(out.columns) == ["A", "B"]
+    assert out.isna().sum().sum() == 0
+    assert len(out) == 2
+
+
+def test_plan_reuses_profile_statistics():
+    dc = DataCleaner(_frame())
+    dc.profile()
+
+    plan = dc.plan_fixes([{"column": "A", "operation": "impute_median"}])
+
+    assert plan["steps"][0]["sources"] == {"A": "profile"}
+    assert dc.apply_fixes(
+        [{"column": "A", "operation": "impute_median"}], optimize=True
+    )["A"].tolist() == [1.0, 1.0, 3.0, 1.0]
+
+
+def test_mode_imputation_reuses_profiled_top_values(monkeypatch):
+    df = pd.DataFrame({"B": ["x", None, "y", "x", None] * 10})
+    dc = DataCleaner(df)
+    dc.profile()
+
+    suggestion = next(s for s in dc.suggest_fixes() if s["column"] == "B")
+    assert suggestion["params"] == {"value": "x"}
+    assert "66.7% of present values" in suggestion["reason"]
+    assert dc.plan_fixes([{"column": "B", "operation": "impute_mode"}])["steps"][0]["sources"] == {"B": "profile"}
+
+    calls = []
+    mode = pd.Series.mode
+    monkeypatch.setattr(pd.Series, "mode", lambda self, *a, **k: calls.append(1) or mode(self, *a, **k))
+    assert FixRegistry.impute_mode(df.copy(), "B", {"value": "x"})["B"].isna().sum() == 0
+    assert FixRegistry.impute_mode(df.copy(), "B", {})["B"].tolist()[:2] == ["x", "x"]
+    assert len(calls) == 1
+
+    # A tie at the top is left to Series.mode.
+    tied = DataCleaner(pd.DataFrame({"B": ["y", "x", None]}))
+    tied.profile()
+    assert tied.plan_fixes([{"column": "B", "operation": "impute_mode"}])["steps"][0]["sources"] == {"B": "computed"}
+
+
+def test_plan_rejects_unknown_operation():
+    with pytest.raises(ValueError):
+        FixApplier().plan(_frame(), [{"column": "A", "operation": "nope"}])
@@ -0,0 +1,76 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from sanitify import DataCleaner
+from sanitify.core.cache import ProfileCache, frame_fingerprint
+
+
+def _frame(seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "x": rng.normal(size=300),
+        "s": rng.choice(["a", "b", None], size=300),
+        7: rng.integers(0, 5, size=300),
+    })
+
+
+def test_profiles_are_reused_across_instances(tmp_path):
+    cache = ProfileCache(tmp_path / "profiles.sqlite")
+    first = DataCleaner(_frame(), cache=cache).profile()
+
+    reloaded = ProfileCache(tmp_path / "profiles.sqlite")
+    second = DataCleaner(_frame(), cache=reloaded).profile()
+
+    assert second == first
+    assert list(second["columns"]) == ["x", "s", 7]
+    assert reloaded.stats()["hits"] == 1
+    assert reloaded.stats()["misses"] == 0
+
+
+def test_key_covers_content_and_options(tmp_path):
+    cache = ProfileCache(tmp_path / "profiles.sqlite")
+    DataCleaner(_frame(), cache=cache).profile()
+
+    changed = _frame()
+    changed.loc[0, "x"] = 1e9
+    assert frame_fingerprint(changed) != frame_fingerprint(_frame())
+
+    DataCleaner(changed, cache=cache).profile()
+    DataCleaner(_frame(), cache=cache).profile(max_sample_size=100)
+    DataCleaner(_frame(), cache=cache).profile(approximate=True)
+
+    stats = cache.stats()
+    assert stats["misses"] == 4
+    assert stats["hits"] == 0
+    assert stats["entries"] == 4
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ProfileCache(tmp_path / "profiles.sqlite", max_entries=2)
+    for seed in range(3):
+        DataCleaner(_frame(seed), cache=cache).profile()
+
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+
+    DataCleaner(_frame(0), cache=cache).profile()
+    DataCleaner(_frame(2), cache=cache).profile()
+    assert cache.stats()["hits"] == 1
+
+
+def test_file_profiles_follow_modification_time(tmp_path):
+    path = tmp_path / "data.csv"
+    _frame().to_csv(path, index=False)
+    cache = ProfileCache(tmp_path / "profiles.sqlite")
+
+    DataCleaner.from_path(str(path), cache=cache).profile()
+    DataCleaner.from_path(str(path), cache=cache).profile()
+    assert cache.stats()["hits"] == 1
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    DataCleaner.from_path(str(path), cache=cache).profile()
+    assert cache.stats()["misses"] == 2
@@ -0,0 +1,136 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sanitify import DataCleaner
+from sanitify.core.quality import ColumnRule, HighMissingRule, RuleEngine
+from sanitify.core.rules import RuleRegistry, compile_rules, load_rule_spec
+from sanitify.core.table import ProfileTable
+
+SPEC = {
+    "rules": [
+        {"rule": "high_missing", "threshold": 0.2, "weight": 5, "cap": 10},
+        {"rule": "high_missing", "name": "mostly_missing", "threshold": 0.5, "severity": "high"},
+        {"rule": "constant_column"},
+        {"rule": "threshold", "name": "wide_range", "metric": "max", "op": ">=", "threshold": 100},
+        {"rule": "high_duplicate_rate", "threshold": 0.05},
+    ]
+}
+
+
+def _frame():
+    return pd.DataFrame({
+        "sparse": [None, None, None, 1.0, 2.0],
+        "half": [None, 1.0, None, 3.0, 4.0],
+        "flat": [7, 7, 7, 7, 7],
+        "big": [1, 50, 100, 150, 200],
+    })
+
+
+def test_spec_compiles_once_and_is_cached():
+    plan = compile_rules(SPEC)
+
+    assert compile_rules(json.loads(json.dumps(SPEC))) is plan
+    assert compile_rules(json.dumps(SPEC)) is plan
+    assert [rule.name for rule in plan.rules] == [
+        "high_missing", "mostly_missing", "constant_column", "wide_range", "high_duplicate_rate",
+    ]
+    assert plan.weights == {"high_missing": 5}
+    assert plan.caps == {"high_missing": 10}
+
+
+def test_spec_rules_evaluate_like_constructed_rules():
+    dc = DataCleaner(_frame(), rules=SPEC)
+    issues = dc.check_quality()
+
+    flagged = {(issue["rule"], issue["column"]) for issue in issues}
+    assert flagged == {
+        ("high_missing", "sparse"),
+        ("high_missing", "half"),
+        ("mostly_missing", "sparse"),
+        ("constant_column", "flat"),
+        ("wide_range", "big"),
+    }
+    assert next(i for i in issues if i["rule"] == "mostly_missing")["severity"] == "high"
+
+    penalties = {p["rule"]: p for p in dc.quality_score()["penalties"]}
+    assert penalties["high_missing"]["raw_penalty"] == 10
+    assert penalties["high_missing"]["cap"] == 10
+
+
+def test_stacked_threshold_rules_match_individual_evaluation():
+    rng = np.random.default_rng(2)
+    columns = {
+        f"c{i}": {"dtype": "float64", "missing": 0, "missing_pct": float(p), "unique": 10, "is_constant": False}
+        for i, p in enumerate(rng.random(500))
+    }
+    profile = {"dataset": {"rows": 100}, "columns": columns, "duplicates": 0}
+    rules = [HighMissingRule(threshold) for threshold in np.linspace(0, 1, 40)]
+
+    expected = [issue for rule in rules for issue in rule.evaluate(profile)]
+    assert RuleEngine(rules).run(profile) == expected
+
+
+def test_rules_with_missing_inputs_are_skipped():
+    plan = compile_rules([
+        {"rule": "threshold", "name": "slow_tail", "metric": "p99", "threshold": 1.0},
+        {"rule": "high_duplicate_rate"},
+        {"rule": "constant_column"},
+    ])
+    profile = {
+        "dataset": {"rows": 2},
+        "columns": {"a": {"dtype": "int64", "missing": 0, "missing_pct": 0.0, "unique": 1, "is_constant": True}},
+    }
+
+    table = ProfileTable.from_profile(profile)
+    assert [rule.name for rule in plan.skipped(table)] == ["slow_tail", "high_duplicate_rate"]
+    assert [issue["rule"] for issue in plan.run(profile)] == ["constant_column"]
+
+
+def test_registry_accepts_custom_rules_and_rejects_unknown_ones():
+    registry = RuleRegistry()
+
+    @registry.register("negative_mean")
+    class NegativeMeanRule(ColumnRule):
+        name = "negative_mean"
+        requires = ("mean",)
+
+        def metric(self, table):
+            return table["mean"]
+
+        def flags(self, table, values):
+            return values < 0
+
+    plan = registry.compile([{"rule": "negative_mean", "severity": "low"}])
+    profile = DataCleaner(pd.DataFrame({"x": [-1.0, -2.0], "y": [1.0, 2.0]})).profile()
+    issues = plan.run(profile)
+    assert [(i["column"], i["severity"]) for i in issues] == [("x", "low")]
+
+    with pytest.raises(ValueError, match="Unknown rule"):
+        registry.compile([{"rule": "high_missing"}])
+    with pytest.raises(ValueError, match="Invalid options"):
+        compile_rules([{"rule": "high_missing", "limit": 0.1}])
+
+
+def test_specs_load_from_files(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps(SPEC))
+    assert load_rule_spec(path) == SPEC
+    assert load_rule_spec(str(path)) == SPEC
+
+    pytest.importorskip("yaml")
+    path = tmp_path / "rules.yaml"
+    path.write_text(
+        "rules:\n"
+        "  - rule: high_missing\n"
+        "    threshold: 0.2\n"
+        "  - rule: threshold\n"
+        "    name: wide_range\n"
+        "    metric: max\n"
+        "    op: '>='\n"
+        "    threshold: 100\n"
+    )
+    plan = compile_rules(path)
+    assert [rule.name for rule in plan.rules] == ["high_missing", "wide_range"]
@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+
+from sanitify.core.profiler import DataProfiler
+from sanitify.core.quality import (
+    ColumnRule,
+    ConstantColumnRule,
+    DuplicateRateRule,
+    HighCardinalityRule,
+    HighMissingRule,
+    RuleEngine,
+    ThresholdRule,
+)
+from sanitify.core.table import ProfileTable
+
+
+def _wide_profile(width=5_000, rows=1_000):
+    rng = np.random.default_rng(5)
+    columns = {}
+    for i in range(width):
+        unique = int(rng.integers(0, rows + 20))
+        meta = {
+            "dtype": "float64",
+            "missing": int(rng.integers(0, rows)),
+            "unique": unique,
+            "is_constant": unique <= 1,
+        }
+        meta["missing_pct"] = meta["missing"] / rows
+        if i % 3:
+            meta["numeric"] = {"mean": 0.0, "std": float(i), "min": 0.0, "max": 1.0, "median": 0.5}
+        if i % 7 == 0:
+            meta["approximate"] = {"unique": 0.01}
+        columns[f"c{i}"] = meta
+    return {"dataset": {"rows": rows}, "columns": columns, "duplicates": 0}
+
+
+def _loop_issues(profile):
+    # Reference: per-column evaluation over the profile dict.
+    rows = profile["dataset"]["rows"]
+    issues = []
+    for col, meta in profile["columns"].items():
+        if meta["missing_pct"] > 0.3:
+            issues.append({"column": col, "rule": "high_missing", "severity": "medium",
+                           "metric": meta["missing_pct"], "threshold": 0.3})
+    for col, meta in profile["columns"].items():
+        if meta["is_constant"]:
+            issues.append({"column": col, "rule": "constant_column", "severity": "low",
+                           "metric": 1, "threshold": None})
+    for col, meta in profile["columns"].items():
+        ratio = min(meta["unique"] / rows, 1.0)
+        if ratio > 0.9:
+            issue = {"column": col, "rule": "high_cardinality", "severity": "medium",
+                     "metric": ratio, "threshold": 0.9}
+            if "approximate" in meta:
+                issue["approximate"] = True
+                issue["error_bound"] = meta["approximate"]["unique"]
+            issues.append(issue)
+    return issues
+
+
+def test_vectorized_rules_match_per_column_evaluation():
+    profile = _wide_profile()
+    rules = [HighMissingRule(), ConstantColumnRule(), HighCardinalityRule()]
+
+    assert RuleEngine(rules).run(profile) == _loop_issues(profile)
+    # Rules keep working on their own against the profile dict.
+    assert rules[0].evaluate(profile) == [i for i in _loop_issues(profile) if i["rule"] == "high_missing"]
+
+
+def test_profile_table_aligns_metrics_with_columns():
+    df = pd.DataFrame({"a": [1.0, 2.0, None], "b": ["x", "x", "x"], 3: [1, 1, 1]})
+    table = ProfileTable.from_profile(DataProfiler(df).run())
+
+    assert list(table.columns) == ["a", "b", 3]
+    assert table.rows == 3
+    assert table["missing"].tolist() == [1, 0, 0]
+    assert table["is_numeric"].tolist() == [True, False, True]
+    assert table["median"][0] == 1.5
+    assert np.isnan(table["median"][1])
+    assert np.isnan(table["unique_error"]).all()
+
+
+def test_custom_column_rule_and_dataset_rules_run_together():
+    class HighSpreadRule(ColumnRule):
+        name = "high_spread"
+        severity = "low"
+
+        def __init__(self, threshold=4_000.0):
+            self.threshold = threshold
+
+        def metric(self, table):
+            return table["std"]
+
+    profile = _wide_profile()
+    profile["duplicates"] = 500
+    issues = RuleEngine([HighSpreadRule(), DuplicateRateRule()]).run(profile)
+
+    spread = [i for i in issues if i["rule"] == "high_spread"]
+    expected = [
+        col for col, meta in profile["columns"].items()
+        if "numeric" in meta and meta["numeric"]["std"] > 4_000
+    ]
+    assert [i["column"] for i in spread] == expected
+    assert all(isinstance(i["metric"], float) for i in spread)
+    assert issues[-1]["rule"] == "high_duplicate_rate"
+
+
+def test_empty_profiles_raise_no_issues():
+    profile = {"dataset": {"rows": 0}, "columns": {}, "duplicates": 0}
+    rules = [HighMissingRule(), ConstantColumnRule(), HighCardinalityRule(), DuplicateRateRule()]
+    assert RuleEngine(rules).run(profile) == []
+
+
+def test_numeric_thresholds_skip_non_numeric_columns():
+    df = pd.DataFrame({"n": [1.0, 2.0, 3.0], "s": ["x", "y", "z"]})
+    profile = DataProfiler(df).run()
+    rule = ThresholdRule("mean", 0, op="!=")
+
+    issues = RuleEngine([rule]).run(profile)
+    assert [(i["column"], i["metric"]) for i in issues] == [("n", 2.0)]
+    assert rule.evaluate_table(ProfileTable.from_profile(profile)) == issues
@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sanitify import DataCleaner
+from sanitify.core.profiler import DataProfiler
+from sanitify.core.sampling import draw_sample
+from sanitify.core.sketches import ReservoirSample
+from sanitify.core.streaming import ChunkedProfiler
+from sanitify.utils.tracing import Tracer
+
+
+def _frame(rows=40_000):
+    rng = np.random.default_rng(11)
+    # A rare segment with much larger values skews uniform samples.
+    segment = np.where(rng.random(rows) < 0.05, "rare", "common")
+    scale = np.where(segment == "rare", 100.0, 1.0)
+    return pd.DataFrame({
+        "segment": segment,
+        "value": rng.exponential(size=rows) * scale,
+        "count": rng.integers(0, 1_000, size=rows),
+    })
+
+
+def test_sampled_profile_estimates_heavy_metrics_with_intervals():
+    df = _frame()
+    profile = DataProfiler(df, max_sample_size=5_000, approximate=True).run()
+
+    assert profile["dataset"]["sampled"]
+    assert profile["dataset"]["sample_size"] == 5_000
+    assert profile["dataset"]["sampling"]["method"] == "uniform"
+
+    col = profile["columns"]["value"]
+    # Missing counts, extremes and the mean still cover every row.
+    assert col["missing"] == 0
+    assert col["numeric"]["max"] == df["value"].max()
+    assert col["numeric"]["mean"] == pytest.approx(df["value"].mean())
+
+    sampled = col["sampled"]
+    assert sampled["size"] == 5_000
+    assert sampled["confidence"] == 0.95
+    low, high = sampled["median"]
+    assert low <= col["numeric"]["median"] <= high
+    assert low <= df["value"].median() <= high
+    low, high = sampled["std"]
+    assert low <= df["value"].std() <= high
+
+
+def test_small_frames_are_not_sampled():
+    profile = DataProfiler(_frame(1_000), approximate=True).run()
+
+    assert profile["dataset"]["sampling"] is None
+    assert "sampled" not in profile["columns"]["value"]
+
+
+def test_exact_profiles_of_large_frames_are_not_sampled():
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({"value": rng.lognormal(size=200_000)})
+    profile = DataProfiler(df).run()
+
+    assert profile["dataset"]["sampled"] is False
+    numeric = profile["columns"]["value"]["numeric"]
+    assert numeric["median"] == df["value"].median()
+    assert numeric["std"] == pytest.approx(df["value"].std(), rel=1e-12)
+    assert "sampled" not in profile["columns"]["value"]
+
+
+def test_stratified_sample_covers_every_stratum():
+    df = _frame()
+    sample = draw_sample(df, 400, stratify_by="segment")
+
+    strata = df["segment"].to_numpy()[sample.positions]
+    assert set(strata) == {"rare", "common"}
+    assert abs(sample.size - 400) <= 2
+    # Weights add up to the population within each stratum.
+    for name in ("rare", "common"):
+        in_stratum = strata == name
+        assert sample.weights[in_stratum].sum() == pytest.approx((df["segment"] == name).sum())
+
+
+def test_stratified_profile_records_key():
+    profile = DataProfiler(_frame(), max_sample_size=2_000, stratify_by="segment", approximate=True).run()
+
+    sampling = profile["dataset"]["sampling"]
+    assert sampling["method"] == "stratified"
+    assert sampling["stratify_by"] == "segment"
+    assert sampling["strata"] == 2
+    assert "sampled" in profile["columns"]["count"]
+
+    with pytest.raises(KeyError):
+        DataProfiler(_frame(), stratify_by="missing")
+
+
+def test_approximate_mode_uses_the_sample_instead_of_sketches():
+    tracer = Tracer()
+    profile = DataProfiler(_frame(), max_sample_size=5_000, approximate=True, tracer=tracer).run()
+
+    names = {span.name for span in tracer.spans}
+    assert "metric.sample" in names
+    assert "metric.median" not in names
+    assert "median" not in profile["columns"]["value"].get("approximate", {})
+
+
+def test_reservoir_is_uniform_and_mergeable():
+    values = np.arange(100_000, dtype=np.float64)
+    left, right = ReservoirSample(size=2_000, seed=1), ReservoirSample(size=2_000, seed=2)
+    for chunk in np.array_split(values[:60_000], 7):
+        left.update(chunk)
+    right.update(values[60_000:])
+    left.merge(right)
+
+    assert left.count == 100_000
+    assert left.values.size == 2_000
+    assert len(np.unique(left.values)) == 2_000
+    # About 40% of a uniform sample comes from the last 40k values.
+    assert 0.35 < np.mean(left.values >= 60_000) < 0.45
+    assert 45_000 < np.median(left.values) < 55_000
+
+
+def test_chunked_profiler_reservoir_reports_median_interval():
+    df = _frame()
+    chunks = (df.iloc[start:start + 5_000] for start in range(0, len(df), 5_000))
+    profiler = ChunkedProfiler(sample_size=1_000).consume(chunks)
+    profile = profiler.run()
+
+    assert profile["dataset"]["sampling"]["method"] == "reservoir"
+    col = profile["columns"]["value"]
+    low, high = col["sampled"]["median"]
+    assert low <= df["value"].median() <= high
+    assert "std" not in col["sampled"]
+    assert col["numeric"]["std"] == pytest.approx(df["value"].std())
+
+
+def test_cleaner_keys_profiles_by_stratification():
+    dc = DataCleaner(_frame())
+    uniform = dc.profile(max_sample_size=2_000, approximate=True)
+    stratified = dc.profile(max_sample_size=2_000, stratify_by="segment", approximate=True)
+
+    assert uniform["dataset"]["sampling"]["method"] == "uniform"
+    assert stratified["dataset"]["sampling"]["method"] == "stratified"
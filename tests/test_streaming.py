@@ -0,0 +1,141 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sanitify import DataCleaner
+from sanitify.core.profiler import DataProfiler
+from sanitify.core.sketches import HyperLogLog, QuantileSketch, TopK
+
+
+def _frame(n=1_000):
+    rng = np.random.default_rng(7)
+    return pd.DataFrame({
+        "x": np.where(rng.random(n) < 0.2, np.nan, rng.normal(size=n)),
+        "k": rng.integers(0, 20, n),
+        "s": rng.choice(["a", "b", None], n),
+    })
+
+
+def _chunks(df, size):
+    return (df.iloc[i:i + size] for i in range(0, len(df), size))
+
+
+def test_from_chunks_matches_in_memory_profile():
+    df = pd.concat([_frame(), _frame().iloc[:50]], ignore_index=True)
+
+    expected = DataProfiler(df).run()
+    streamed = DataProfiler.from_chunks(_chunks(df, 128)).run()
+
+    assert streamed["dataset"]["rows"] == expected["dataset"]["rows"]
+    assert streamed["duplicates"] == expected["duplicates"]
+
+    for col, meta in expected["columns"].items():
+        got = streamed["columns"][col]
+        assert got["missing"] == meta["missing"]
+        assert got["unique"] == meta["unique"]
+        if "numeric" in meta:
+            for key, value in meta["numeric"].items():
+                assert got["numeric"][key] == pytest.approx(value)
+
+
+def test_chunked_profilers_merge():
+    df = _frame()
+
+    left = DataProfiler.from_chunks(_chunks(df.iloc[:400], 100))
+    right = DataProfiler.from_chunks(_chunks(df.iloc[400:], 100))
+    merged = left.merge(right).run()
+
+    expected = DataProfiler(df).run()
+    assert merged["columns"]["x"]["numeric"]["std"] == pytest.approx(
+        expected["columns"]["x"]["numeric"]["std"]
+    )
+    assert merged["columns"]["k"]["unique"] == 20
+
+
+def test_large_integers_hash_without_rounding_through_float():
+    ids = pd.Series([2 ** 60 + i for i in range(100)])
+    streamed = DataProfiler.from_chunks([pd.DataFrame({"id": ids})]).run()
+    assert streamed["columns"]["id"]["unique"] == 100
+
+    # Integral floats still hash like the integers they hold.
+    mixed = DataProfiler.from_chunks([
+        pd.DataFrame({"k": [1, 2, 3]}),
+        pd.DataFrame({"k": [3.0, 4.0, np.nan]}),
+        pd.DataFrame({"k": pd.array([4, 5, None], dtype="Int64")}),
+    ]).run()
+    assert mixed["columns"]["k"]["unique"] == 5
+
+
+def test_from_path_csv(tmp_path):
+    df = _frame()
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+
+    dc = DataCleaner.from_path(str(path), chunksize=200)
+    profile = dc.profile()
+
+    assert profile["dataset"]["rows"] == len(df)
+    assert profile["columns"]["x"]["missing"] == int(df["x"].isna().sum())
+    assert isinstance(dc.quality_score()["score"], (int, float))
+
+    with pytest.raises(ValueError):
+        dc.apply_fixes([])
+
+
+def test_from_path_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    df = _frame()
+    path = tmp_path / "data.parquet"
+    df.to_parquet(path, index=False)
+
+    profile = DataCleaner.from_path(str(path), chunksize=300).profile()
+
+    assert profile["columns"]["k"]["unique"] == 20
+
+
+def test_from_path_unsupported_format(tmp_path):
+    with pytest.raises(ValueError):
+        DataCleaner.from_path(str(tmp_path / "data.xlsx"))
+
+
+def test_hyperloglog_estimate_within_bound():
+    values = pd.Series(np.arange(200_000))
+    sketch = HyperLogLog(precision=12)
+    sketch.update(values)
+
+    assert not sketch.is_exact
+    assert abs(sketch.count() - 200_000) / 200_000 < 4 * sketch.relative_error
+
+
+def test_quantile_sketch_rank_error_bound():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=100_000)
+    sketch = QuantileSketch(k=256)
+    for part in np.array_split(values, 10):
+        sketch.update(part)
+
+    estimate = sketch.quantile(0.5)
+    rank = np.searchsorted(np.sort(values), estimate) / values.size
+
+    assert not sketch.is_exact
+    assert abs(rank - 0.5) <= sketch.rank_error
+
+
+def test_topk_heavy_hitters_within_error_bound():
+    rng = np.random.default_rng(1)
+    values = pd.Series(rng.zipf(1.3, 200_000) % 50_000).astype(str)
+    exact = values.value_counts()
+
+    left, right = TopK(k=5, capacity=256), TopK(k=5, capacity=256)
+    for i, start in enumerate(range(0, len(values), 25_000)):
+        (left if i % 2 else right).update(values.iloc[start:start + 25_000])
+    left.merge(right)
+
+    assert not left.is_exact
+    assert left.count == len(values)
+    assert [value for value, _ in left.top()] == exact.index[:5].tolist()
+    for value, count in left.top():
+        assert exact[value] - left.error <= count <= exact[value]
+
+    profile = DataProfiler.from_chunks(_chunks(_frame(), 128)).run()
+    assert profile["columns"]["s"]["top_values"] == DataProfiler(_frame()).run()["columns"]["s"]["top_values"]
@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sanitify import DataCleaner
+from sanitify.cleaning.streaming import StreamingFixApplier, _ChunkWriter
+from sanitify.core.duplicates import FingerprintSet
+
+FIXES = [
+    {"column": "age", "operation": "impute_median"},
+    {"column": "city", "operation": "impute_mode"},
+    {"column": "city", "operation": "strip_strings"},
+    {"column": "score", "operation": "impute_mean"},
+    {"column": "junk", "operation": "drop_column"},
+    {"column": None, "operation": "drop_duplicates"},
+]
+
+
+def _frame(rows=5_000):
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({
+        "age": np.where(rng.random(rows) < 0.1, np.nan, rng.integers(0, 90, rows)),
+        "city": pd.Series(rng.choice([" a", "b ", "c", None], rows), dtype=object),
+        "score": np.where(rng.random(rows) < 0.1, np.nan, rng.integers(0, 5, rows) / 4),
+        "junk": rng.random(rows),
+    })
+    return pd.concat([df, df.iloc[:700]], ignore_index=True)
+
+
+def _expected(df):
+    return DataCleaner(df, rules=[]).apply_fixes(FIXES, optimize=True).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".csv"])
+def test_stream_fixes_matches_optimized_apply(tmp_path, suffix):
+    df = _frame()
+    output = tmp_path / f"clean{suffix}"
+
+    summary = DataCleaner(df, rules=[]).stream_fixes(FIXES, output, chunksize=800)
+
+    expected = _expected(df)
+    if suffix == ".parquet":
+        actual = pd.read_parquet(output)
+    else:
+        actual = pd.read_csv(output)
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=suffix == ".parquet")
+    assert summary["rows_read"] == len(df)
+    assert summary["rows_written"] == len(expected)
+    assert summary["duplicates_dropped"] == len(df) - len(expected)
+    assert summary["chunks"] == 8
+    assert {stat["source"] for stat in summary["statistics"].values()} == {"computed"}
+    assert summary["statistics"]["score"]["value"] == df["score"].mean()
+    assert summary["materialized"] == ["age"]
+
+
+def test_stream_fixes_uses_exact_profile_statistics(tmp_path):
+    df = _frame()
+    dc = DataCleaner(df, rules=[])
+    dc.profile()
+
+    summary = dc.stream_fixes(FIXES[:4], tmp_path / "clean.parquet", chunksize=1_000)
+
+    statistics = summary["statistics"]
+    assert statistics["age"] == {"operation": "impute_median", "value": df["age"].median(), "source": "profile"}
+    assert statistics["city"] == {"operation": "impute_mode", "value": df["city"].mode().iloc[0], "source": "profile"}
+    assert summary["materialized"] == []
+
+
+def test_stream_fixes_from_file_spills_dedup(tmp_path):
+    df = _frame()
+    source = tmp_path / "raw.parquet"
+    df.to_parquet(source, index=False)
+
+    dc = DataCleaner.from_path(str(source), chunksize=500)
+    summary = dc.stream_fixes(FIXES, tmp_path / "clean.csv.gz", memory_limit=8 * 256)
+
+    assert summary["spilled"]
+    expected = _expected(df)
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / "clean.csv.gz"), expected, check_dtype=False)
+
+
+def test_fingerprint_set_marks_first_occurrences():
+    seen = FingerprintSet(memory_limit=8 * 4)
+    try:
+        first = seen.add(np.array([5, 1, 5, 2], dtype=np.uint64))
+        second = seen.add(np.array([1, 3, 3, 7, 2, 9], dtype=np.uint64))
+        assert first.tolist() == [True, True, False, True]
+        assert second.tolist() == [False, True, False, True, False, True]
+        assert len(seen) == 6
+        assert seen.spilled
+    finally:
+        seen.close()
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".csv"])
+def test_empty_source_writes_a_readable_file(tmp_path, suffix):
+    output = tmp_path / f"empty{suffix}"
+    summary = StreamingFixApplier().apply(lambda columns: iter([]), FIXES, output)
+
+    assert summary["rows_read"] == summary["rows_written"] == 0
+    if suffix == ".csv":
+        assert output.read_text() == "\n"
+        return
+    assert pd.read_parquet(output).empty
+
+    # The footer is written as soon as the writer closes.
+    writer = _ChunkWriter(output)
+    writer.close()
+    assert pd.read_parquet(output).empty
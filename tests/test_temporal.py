@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sanitify import DataCleaner
+from sanitify.cleaning.deterministic import FixRegistry
+from sanitify.core.profiler import DataProfiler
+from sanitify.core.suggestions import DeterministicSuggestionEngine
+from sanitify.core.temporal import TemporalSummary, detect_datetime
+
+
+def _frame(rows=3_000):
+    rng = np.random.default_rng(5)
+    df = pd.DataFrame({
+        "ts": pd.Series(pd.date_range("2024-03-01", periods=rows, freq="min")),
+        "tz": pd.Series(pd.date_range("2024-03-01", periods=rows, freq="s", tz="Europe/Paris")[::-1]),
+        "wait": pd.to_timedelta(rng.integers(0, 600, rows), unit="s"),
+        "never": pd.Series([pd.NaT] * rows, dtype="datetime64[ns]"),
+    })
+    df.loc[::9, "ts"] = pd.NaT
+    return df
+
+
+def test_datetime_columns_get_temporal_metrics():
+    df = _frame()
+    columns = DataProfiler(df).run()["columns"]
+
+    ts = columns["ts"]["temporal"]
+    assert pd.Timestamp(ts["min"]) == df["ts"].min()
+    assert pd.Timestamp(ts["max"]) == df["ts"].max()
+    assert ts["span_seconds"] == (df["ts"].max() - df["ts"].min()).total_seconds()
+    assert (ts["monotonic_increasing"], ts["monotonic_decreasing"]) == (True, False)
+    assert (ts["median_gap_seconds"], ts["max_gap_seconds"]) == (60.0, 120.0)
+
+    tz = columns["tz"]["temporal"]
+    assert pd.Timestamp(tz["max"]) == df["tz"].max()
+    assert tz["max"].endswith("+01:00")
+    assert tz["monotonic_decreasing"] and tz["median_gap_seconds"] == 1.0
+
+    wait = columns["wait"]["temporal"]
+    assert pd.Timedelta(wait["max"]) == df["wait"].max()
+    assert not wait["monotonic_increasing"] and wait["median_gap_seconds"] is None
+    assert columns["never"]["temporal"]["min"] is None
+    assert "top_values" not in columns["ts"]
+
+
+def test_temporal_metrics_match_across_profilers():
+    df = _frame()
+    full = DataProfiler(df).run()["columns"]
+
+    streamed = DataProfiler.from_chunks(df.iloc[i:i + 400] for i in range(0, len(df), 400)).run()["columns"]
+    selected = DataProfiler(df, metrics=["temporal"]).run()["columns"]
+    for col in df.columns:
+        assert streamed[col]["temporal"] == full[col]["temporal"]
+        assert selected[col] == {"dtype": full[col]["dtype"], "temporal": full[col]["temporal"]}
+
+    pa = pytest.importorskip("pyarrow")
+    arrow = DataProfiler.from_arrow(pa.Table.from_pandas(df, preserve_index=False)).run()["columns"]
+    assert {col: arrow[col]["temporal"] for col in df} == {col: full[col]["temporal"] for col in df}
+
+
+def test_temporal_summary_merge_tracks_order_across_chunks():
+    stamps = pd.Series(pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-05", "2024-01-04"]))
+    left, right = TemporalSummary(), TemporalSummary()
+    left.update(stamps.iloc[:2])
+    right.update(stamps.iloc[2:3])
+    left.merge(right)
+    assert left.to_dict()["max_gap_seconds"] == 3 * 86_400.0
+
+    late = TemporalSummary()
+    late.update(stamps.iloc[3:])
+    left.merge(late)
+    assert not left.is_ordered
+    assert left.to_dict()["median_gap_seconds"] is None
+
+
+def test_date_strings_get_a_cast_fix():
+    rows = 5_000
+    when = pd.Series(pd.date_range("2023-01-01", periods=rows, freq="h").strftime("%Y-%m-%d %H:%M"), dtype=object)
+    when[::5] = None
+    df = pd.DataFrame({"when": when, "label": pd.Series([f"item {i}" for i in range(rows)], dtype=object)})
+
+    dc = DataCleaner(df, rules=[])
+    dc._suggestion_engine = DeterministicSuggestionEngine(min_memory_savings=1)
+    fix = next(s for s in dc.suggest_fixes() if s["column"] == "when")
+    assert fix["operation"] == "to_datetime"
+    assert fix["params"] == {"format": "%Y-%m-%d %H:%M"}
+    assert not any(s["operation"] == "to_datetime" for s in dc.suggest_fixes() if s["column"] == "label")
+
+    cast = dc.apply_fixes([fix])["when"]
+    assert pd.api.types.is_datetime64_dtype(cast)
+    assert cast.isna().sum() == when.isna().sum()
+
+    assert detect_datetime(["2024", "2025"]) is None
+    assert detect_datetime(["2024-02-30"]) is None
+    broken = pd.DataFrame({"when": ["2024-01-01", "soon"]})
+    assert FixRegistry.to_datetime(broken.copy(), "when", {})["when"].tolist() == ["2024-01-01", "soon"]
@@ -0,0 +1,99 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import numpy as np
+import pandas as pd
+
+from sanitify import DataCleaner
+from sanitify.core.profiler import DataProfiler
+from sanitify.utils.tracing import NULL_TRACER, Tracer
+
+
+def _frame():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "a": rng.normal(size=200),
+        "b": rng.integers(0, 5, size=200),
+        "c": rng.choice(["x", "y", None], size=200),
+    })
+
+
+def test_profile_records_stage_and_metric_spans():
+    tracer = Tracer()
+    profile = DataProfiler(_frame(), tracer=tracer).run()
+
+    names = {span.name for span in tracer.spans}
+    assert {"profile", "profile.dataset", "profile.columns", "profile.duplicates"} <= names
+    assert {"profile.numeric_block", "metric.sort", "metric.moments", "metric.unique"} <= names
+
+    # tracing does not change the result
+    assert profile == DataProfiler(_frame()).run()
+
+    by_id = {span.span_id: span for span in tracer.spans}
+    root = next(span for span in tracer.spans if span.name == "profile")
+    assert root.parent_id is None
+    for span in tracer.spans:
+        if span is not root:
+            assert span.parent_id in by_id
+        assert span.wall_seconds >= 0
+        assert span.cpu_seconds >= 0
+
+
+def test_memory_peaks_nest():
+    tracer = Tracer(track_memory=True)
+    with tracer.span("outer"):
+        with tracer.span("inner"):
+            buffer = bytearray(4_000_000)
+            del buffer
+
+    spans = {span.name: span for span in tracer.spans}
+    assert spans["inner"].peak_bytes >= 4_000_000
+    assert spans["outer"].peak_bytes >= spans["inner"].peak_bytes
+
+
+def test_report_includes_trace_and_hooks_fire():
+    seen = []
+    tracer = Tracer(hooks=[seen.append])
+    dc = DataCleaner(_frame(), tracer=tracer)
+    report = dc.export_report()
+
+    stages = report["trace"]["summary"]
+    for stage in ("pipeline.profile", "pipeline.issues", "pipeline.score", "pipeline.suggestions"):
+        assert stages[stage]["count"] == 1
+    assert len(seen) == len(tracer.spans)
+    json.dumps(report["trace"])
+
+    assert "trace" not in DataCleaner(_frame()).export_report()
+    assert DataCleaner(_frame())._tracer is NULL_TRACER
+
+
+def test_otlp_export_to_local_collector():
+    received = []
+
+    class Collector(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers["Content-Length"])
+            received.append(json.loads(self.rfile.read(length)))
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Collector)
+    thread = threading.Thread(target=server.handle_request)
+    thread.start()
+
+    tracer = Tracer()
+    DataProfiler(_frame(), tracer=tracer).run()
+    status = tracer.export_otlp(f"http://127.0.0.1:{server.server_port}/v1/traces")
+    thread.join()
+    server.server_close()
+
+    assert status == 200
+    spans = received[0]["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert len(spans) == len(tracer.spans)
+    assert all(span["traceId"] == tracer.trace_id for span in spans)
+    keys = {attr["key"] for attr in spans[0]["attributes"]}
+    assert "sanitify.wall_seconds" in keys